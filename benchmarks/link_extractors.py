@@ -0,0 +1,119 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+# Compares the time ParserHTML and LinkExtractor take to collect the links of a corpus of saved webpages.
+# The webpages are fed to an HTMLStream in chunks, the same way the crawlers do, and the extractors share a URLCanonicalizer
+# (and the canonical forms it keeps) while the corpus is parsed, like the crawlers share theirs while a website is crawled.
+# Exits with 1 if the extractors found different links in any webpage.
+#
+# Usage: python benchmarks/link_extractors.py [<folder with .html files>] [--repeat N]
+# The default folder is benchmarks/corpus, with the cases where LinkExtractor must collect the same links as ParserHTML.
+# A larger corpus, to time the extractors, can be written with benchmarks/make_corpus.py.
+
+import os, sys, io, time, argparse, http.client
+
+# make the classes package importable when running this file from any folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from classes import Crawler, HTMLStream, LinkExtractor, ParserHTML, URLCanonicalizer
+
+# the root URL used to build the absolute URL of relative links
+ROOT_URL = "http://www.example.com"
+# the folder with the regression corpus, used when no folder is passed
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.realpath(__file__)), "corpus")
+
+# returns a list with the bytes of every .html/.htm file in a folder and its sub folders
+def loadCorpus(path) :
+	pages = []
+
+	for folder, _, files in os.walk(path) :
+		for file_name in sorted(files) :
+			if (file_name.lower().endswith((".html", ".htm"))) :
+				with open(os.path.join(folder, file_name), "rb") as file :
+					pages.append((os.path.join(folder, file_name), file.read()))
+
+	return(pages)
+
+# collects the links of a webpage with the extractor returned by create_extractor, passing it the canonicalizer
+# returns the set with the links
+def extractLinks(create_extractor, page, canonicalizer) :
+	headers = http.client.parse_headers(io.BytesIO(b"Content-Type: text/html\r\n\r\n"))
+	stream = HTMLStream.HTMLStream(create_extractor(canonicalizer), headers)
+
+	for i in range(0, len(page), Crawler.Crawler.READ_CHUNK_SIZE_) :
+		stream.feed(page[i:i + Crawler.Crawler.READ_CHUNK_SIZE_])
+	stream.close()
+
+	return(stream.links())
+
+# collects the links of every webpage, repeat times
+# returns a tuple (best time in seconds, list with the set of links of each webpage)
+def timeExtractor(create_extractor, pages, repeat) :
+	best_time = None
+
+	for _ in range(repeat) :
+		# NOTE: each pass starts with a new canonicalizer, so no pass uses the canonical forms kept by another
+		canonicalizer = URLCanonicalizer.URLCanonicalizer()
+
+		start_time = time.perf_counter()
+		links = [extractLinks(create_extractor, page, canonicalizer) for _, page in pages]
+		elapsed = time.perf_counter() - start_time
+
+		if (best_time == None or elapsed < best_time) :
+			best_time = elapsed
+
+	return((best_time, links))
+
+def main(argv=None) :
+	parser = argparse.ArgumentParser(description="Compares the time ParserHTML and LinkExtractor take to collect the links of saved webpages.")
+	parser.add_argument("corpus", nargs="?", default=DEFAULT_CORPUS, help="folder with the saved webpages (.html or .htm files), defaults to the regression corpus")
+	parser.add_argument("--repeat", type=int, default=5, help="# of times the corpus is parsed by each extractor (the best time is used)")
+	args = parser.parse_args(argv)
+
+	pages = loadCorpus(args.corpus)
+	if (len(pages) == 0) :
+		print("No .html or .htm files found in " + args.corpus)
+		return(1)
+
+	total_bytes = sum(len(page) for _, page in pages)
+	print("Corpus: {0} webpages, {1:.1f} MB".format(len(pages), total_bytes / 1024 / 1024))
+
+	# time both extractors
+	extractors = [
+		("ParserHTML", lambda canonicalizer : ParserHTML.ParserHTML(ROOT_URL, {"a" : {"href" : True}}, canonicalizer)),
+		("LinkExtractor", lambda canonicalizer : LinkExtractor.LinkExtractor(ROOT_URL, canonicalizer)),
+	]
+	results = {}
+	for name, create_extractor in extractors :
+		results[name] = timeExtractor(create_extractor, pages, max(1, args.repeat))
+		elapsed = results[name][0]
+		print("{0:<15}{1:>10.3f} s{2:>10.1f} MB/s{3:>10.0f} webpages/s".format(name, elapsed, total_bytes / 1024 / 1024 / elapsed, len(pages) / elapsed))
+
+	print("Speedup: {0:.2f}x".format(results["ParserHTML"][0] / results["LinkExtractor"][0]))
+
+	# list the webpages where the extractors found different links
+	differences = 0
+	for i, (path, _) in enumerate(pages) :
+		parser_links = results["ParserHTML"][1][i]
+		extractor_links = results["LinkExtractor"][1][i]
+
+		if (parser_links != extractor_links) :
+			differences += 1
+			print("Different links in {0}: {1} only found by ParserHTML, {2} only found by LinkExtractor".format(path, len(parser_links - extractor_links), len(extractor_links - parser_links)))
+
+	print("Webpages with different links: {0} of {1}".format(differences, len(pages)))
+
+	return(0 if differences == 0 else 1)
+
+if (__name__ == "__main__") :
+	sys.exit(main())
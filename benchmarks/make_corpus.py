@@ -0,0 +1,144 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+# Writes a corpus of synthetic webpages to a folder, to time the link extractors with benchmarks/link_extractors.py.
+# The webpages are built like the ones of a typical website: a <head> with metadata, styles and scripts,
+# a navigation menu and footer repeated in every webpage and a body with text, links, images, tables and forms.
+# The same seed always writes the same webpages, so the results can be compared between changes.
+#
+# Usage: python benchmarks/make_corpus.py <folder> [--pages N] [--seed N]
+
+import os, sys, random, argparse
+
+# the words used in the text of the webpages
+WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do", "eiusmod", "tempor",
+	"incididunt", "ut", "labore", "et", "dolore", "magna", "aliqua", "enim", "ad", "minim", "veniam", "quis", "nostrud",
+	"exercitation", "ullamco", "laboris", "nisi", "aliquip", "ex", "ea", "commodo", "consequat", "ação", "über", "café")
+
+# returns a sentence with the passed # of words
+def sentence(rand, num_words) :
+	return(" ".join(rand.choice(WORDS) for _ in range(num_words)).capitalize() + ".")
+
+# returns the HTML of the <head> of a webpage
+def head(rand, page_num) :
+	return("".join([
+		"<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n",
+		"<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n",
+		"<title>{0} | Example</title>\n".format(sentence(rand, 5)),
+		"<meta name=\"description\" content=\"{0}\">\n".format(sentence(rand, 20)),
+		"<link rel=\"canonical\" href=\"https://www.example.com/page{0}.html\">\n".format(page_num),
+		"<link rel=\"stylesheet\" href=\"/css/main.css?v=3\">\n",
+		"<style>\n.nav a { color: #333; }\n.card > .title { font-weight: bold; }\n</style>\n",
+		"<script async src=\"https://www.googletagmanager.com/gtag/js?id=G-X\"></script>\n",
+		"<script>\nwindow.dataLayer = window.dataLayer || [];\nvar banner = '<a href=\"/promo\">Promo</a>';\n",
+		"if (a < b && b > c) { document.write(banner); }\n</script>\n",
+		"<script type=\"application/ld+json\">{\"@context\": \"https://schema.org\", \"url\": \"https://www.example.com/\"}</script>\n",
+		"</head>\n",
+	]))
+
+# returns the HTML of the navigation menu, the same in every webpage
+def navigation() :
+	parts = ["<header class=\"site-header\">\n<nav class=\"nav\" aria-label=\"Main\">\n<ul>\n"]
+	for section in range(8) :
+		parts.append("<li class=\"nav-item\"><a class=\"nav-link\" href=\"/section{0}/\">Section {0}</a>\n<ul class=\"sub\">\n".format(section))
+		for sub_section in range(10) :
+			parts.append("<li><a href=\"/section{0}/sub{1}.html\" title=\"Section {0} &amp; {1}\">Sub {1}</a></li>\n".format(section, sub_section))
+		parts.append("</ul></li>\n")
+	parts.append("</ul>\n</nav>\n</header>\n")
+
+	return("".join(parts))
+
+# returns the HTML of the main content of a webpage
+def content(rand, num_blocks) :
+	parts = ["<main id=\"content\">\n"]
+
+	for block in range(num_blocks) :
+		kind = rand.random()
+		if (kind < 0.5) :
+			# a paragraph with inline links
+			words = []
+			for _ in range(rand.randint(40, 120)) :
+				word = rand.choice(WORDS)
+				link = rand.random()
+				if (link < 0.03) :
+					word = "<a href=\"/article/{0}-{1}.html\">{1}</a>".format(rand.randint(0, 5000), word)
+				elif (link < 0.04) :
+					word = "<a href=\"https://other{0}.example.org/path?q={1}&amp;page=2\" rel=\"nofollow\" target=\"_blank\">{1}</a>".format(rand.randint(0, 50), word)
+				elif (link < 0.05) :
+					word = "<strong>{0}</strong>".format(word)
+				elif (link < 0.06) :
+					word = "<em class=\"note\">{0}</em>".format(word)
+				words.append(word)
+			parts.append("<p>{0}.</p>\n".format(" ".join(words)))
+		elif (kind < 0.7) :
+			# a card with an image
+			parts.append("<div class=\"card\" data-id=\"{0}\">\n<img src=\"/img/{0}.jpg\" srcset=\"/img/{0}-2x.jpg 2x\" alt=\"{1}\" loading=\"lazy\" width=\"300\" height=\"200\">\n"
+				"<div class=\"title\"><a href=\"/products/{0}\">{1}</a></div>\n<p class=\"text\">{2}</p>\n</div>\n".format(rand.randint(0, 20000), sentence(rand, 4), sentence(rand, 25)))
+		elif (kind < 0.85) :
+			# a table
+			parts.append("<table class=\"data\">\n<tr><th>Name</th><th>Value</th><th>Link</th></tr>\n")
+			for row in range(rand.randint(5, 20)) :
+				parts.append("<tr><td>{0}</td><td>{1}</td><td><a href=\"/data/{2}\">more</a></td></tr>\n".format(rand.choice(WORDS), rand.randint(0, 1000), rand.randint(0, 1000)))
+			parts.append("</table>\n")
+		elif (kind < 0.95) :
+			# a form
+			parts.append("<form action=\"/search\" method=\"get\"><label for=\"q{0}\">Search</label>"
+				"<input id=\"q{0}\" type=\"text\" name=\"q\" placeholder=\"Search...\" value=\"\"><button type=\"submit\">Go</button></form>\n".format(block))
+		else :
+			# a comment and an embedded video
+			parts.append("<!-- related: <a href=\"/old-link.html\"> -->\n<iframe src=\"https://www.youtube.com/embed/x{0}\" allowfullscreen></iframe>\n".format(block))
+
+	parts.append("</main>\n")
+
+	return("".join(parts))
+
+# returns the HTML of the footer, the same in every webpage
+def footer() :
+	parts = ["<footer class=\"site-footer\">\n"]
+	for column in range(4) :
+		parts.append("<div class=\"col\"><h4>Column {0}</h4><ul>".format(column))
+		for link in range(8) :
+			parts.append("<li><a href=\"/info/{0}-{1}.html\">Info {1}</a></li>".format(column, link))
+		parts.append("</ul></div>\n")
+	parts.append("<p>&copy; Example. <a href=\"mailto:info@example.com\">Contact</a></p>\n</footer>\n</body>\n</html>\n")
+
+	return("".join(parts))
+
+def main(argv=None) :
+	parser = argparse.ArgumentParser(description="Writes a corpus of synthetic webpages, to time the link extractors.")
+	parser.add_argument("folder", help="folder where the webpages are written (created if needed)")
+	parser.add_argument("--pages", type=int, default=60, help="# of webpages written")
+	parser.add_argument("--seed", type=int, default=1, help="seed of the random choices, so the same webpages are written")
+	args = parser.parse_args(argv)
+
+	os.makedirs(args.folder, exist_ok=True)
+	rand = random.Random(args.seed)
+
+	# the navigation menu and footer are the same in every webpage
+	page_navigation = navigation()
+	page_footer = footer()
+
+	total_bytes = 0
+	for page_num in range(args.pages) :
+		page = head(rand, page_num) + "<body class=\"page\">\n" + page_navigation + content(rand, rand.randint(50, 400)) + page_footer
+
+		with open(os.path.join(args.folder, "page{0}.html".format(page_num)), "w", encoding="utf-8") as file :
+			file.write(page)
+		total_bytes += len(page.encode("utf-8"))
+
+	print("Wrote {0} webpages, {1:.1f} MB, to {2}".format(args.pages, total_bytes / 1024 / 1024, args.folder))
+
+	return(0)
+
+if (__name__ == "__main__") :
+	sys.exit(main())
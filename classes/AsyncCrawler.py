@@ -0,0 +1,436 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import asyncio, threading, time, ssl, io, http.client, urllib.parse, urllib.error
+from classes import Crawler, HTMLStream
+
+class AsyncCrawler(Crawler.Crawler) :
+	"""This class defines an asyncio based website crawler.
+	It runs an event loop in its own thread and keeps up to a set number of requests in flight at the same time.
+	It shares the class variables (queue and URL sets) with the Crawler class, so both are interchangeable."""
+
+	# class constant with the max # of redirects followed for each URL
+	MAX_REDIRECTS_ = 10
+	# class constant with the #seconds to wait for a connection or for each read before a request is abandoned
+	REQUEST_TIMEOUT_ = 30
+	# class constant with the max # of bytes of a body that isn't needed read, so the connection can be reused
+	MAX_DRAIN_SIZE_ = 65536
+
+	def __init__(self, concurrency) :
+		# call the Crawler __init__ method
+		super().__init__()
+
+		# instance variable with the max # of requests in flight at the same time
+		self.concurrency = max(1, int(concurrency))
+
+		# instance variable with the idle keep-alive connections, in the form {(scheme, host, port) : [[reader, writer, last used time], ...]}
+		# NOTE: only used by the event loop's thread, so no lock is needed
+		self.idle_connections = {}
+
+	# main method of the thread, defining what the thread should do
+	# will run the event loop until self.terminate_thread_ is True
+	def run(self) :
+		# if the class variables aren't set, terminate thread
+		if (not self.classVariablesSet()) :
+			print("At least 1 class variable not set!")
+			return
+
+		# parse the root_url_
+		self.parseRootURL()
+
+		# instance variable with the SSL context shared by all https connections
+		self.ssl_context = ssl.create_default_context()
+
+		# run the event loop until the crawl is terminated
+		asyncio.run(self.crawl())
+
+		print("thread terminating: " + str(threading.get_ident()))
+
+	# coroutine that keeps taking URLs from the queue and processing them, with up to
+	# self.concurrency URLs being processed at the same time
+	async def crawl(self) :
+		# local variable with the tasks in flight and the URL each one is processing
+		tasks = {}
+
+		# local variable with the running event loop
+		loop = asyncio.get_running_loop()
+
+		# local variable with the event set whenever URLs are put in the queue (by this or any other crawler)
+		# so a free slot is filled as soon as a URL is found, instead of waiting for a URL to be processed
+		queue_changed = asyncio.Event()
+		listener = lambda: loop.call_soon_threadsafe(queue_changed.set)
+		self.queue_.addListener(listener)
+
+		# loop until the terminate flag is set to True
+		while not self.terminate_thread_ :
+			cur_url = None
+
+			# NOTE: cleared before checking the queue, so any URLs put after the check set it again
+			queue_changed.clear()
+
+			if (len(tasks) == 0) :
+				# nothing in flight, so wait (in a worker thread) for a URL to be available
+				# if the queue is closed, None is returned and the terminate flag is checked
+				cur_url = await loop.run_in_executor(None, self.queue_.get)
+			elif (len(tasks) < self.concurrency) :
+				# there is a free slot, so get the next URL from the queue, if there is one
+				cur_url = self.queue_.get(0)
+
+			if (cur_url != None) :
+				# start processing this URL and move on to fill the next slot
+				tasks[asyncio.ensure_future(self.processURLAsync(cur_url))] = cur_url
+			elif (len(tasks) > 0) :
+				# wait for at least 1 URL to be processed or, if there is a free slot, for a URL to be put in the queue
+				waiting = set(tasks.keys())
+				queue_waiter = None
+				if (len(tasks) < self.concurrency) :
+					queue_waiter = asyncio.ensure_future(queue_changed.wait())
+					waiting.add(queue_waiter)
+
+				done, _ = await asyncio.wait(waiting, timeout=1, return_when=asyncio.FIRST_COMPLETED)
+				if (queue_waiter != None) :
+					queue_waiter.cancel()
+
+				for task in done :
+					if (task in tasks) :
+						del tasks[task]
+
+		self.queue_.removeListener(listener)
+
+		# cancel any URLs still being processed
+		for task in tasks :
+			task.cancel()
+		await asyncio.gather(*tasks.keys(), return_exceptions=True)
+
+		# close the idle keep-alive connections
+		for idle in self.idle_connections.values() :
+			for _, writer, _ in idle :
+				writer.close()
+		self.idle_connections.clear()
+
+		# put the URLs that were cancelled back in the queue, so they are crawled when the crawl continues
+		for cur_url in tasks.values() :
+			if (cur_url not in self.crawled_urls_ and cur_url not in self.failed_urls_) :
+				self.queue_.requeue(cur_url)
+
+	# coroutine that will visit the url, collect all it's HTML and store the links in it
+	async def processURLAsync(self, cur_url) :
+		# skip the URLs the host's robots.txt doesn't allow us to crawl, flagging them as failed
+		if (not await self.robotsAllowAsync(cur_url)) :
+			self.storeFailedURL(cur_url)
+			self.queue_.taskDone()
+			return
+
+		# if the URL is in the cache, make the request conditional
+		cache_entry = self.http_cache_.get(cur_url)
+
+		try :
+			# wait until the URL's host can receive another request
+			await self.waitForHostAsync(cur_url)
+
+			# local variables with the parsed webpage (None if it wasn't downloaded) and the response's headers
+			parsed = None
+			headers = None
+
+			# if the URL looks like a file, check what it is with a HEAD request
+			if (self.hasNonHTMLExtension(cur_url)) :
+				try :
+					parsed, headers = await self.fetchURL(cur_url, self.http_cache_.conditionalHeaders(cache_entry), "HEAD")
+				except urllib.error.HTTPError as e :
+					if (e.code not in self.HEAD_UNSUPPORTED_STATUSES_) :
+						raise
+
+			# download and parse the URL's HTML, unless the HEAD request showed it isn't a webpage
+			# NOTE: the links are stored as they are found
+			if (headers == None or self.isHTMLResponse(headers)) :
+				parsed, headers = await self.fetchURL(cur_url, self.http_cache_.conditionalHeaders(cache_entry), "GET")
+
+			# store the links in the cache and flag this URL as crawled
+			self.storeResponse(cur_url, headers, parsed)
+			self.storeCrawledURL(cur_url, [])
+		except urllib.error.HTTPError as e :
+			# if the page hasn't changed, use the links stored in the cache
+			if (e.code == 304 and cache_entry != None) :
+				self.storeCrawledURL(cur_url, self.collectURLs(self.cachedLinks(cache_entry)))
+			# if the host is overloaded, put the URL back in the queue to be tried again later
+			# NOTE: the URL is still an unfinished task of the queue, so taskDone() isn't called
+			elif (e.code in self.scheduler_.OVERLOADED_STATUSES_ and self.scheduler_.retry(cur_url)) :
+				self.queue_.requeue(cur_url)
+				return
+			else :
+				# flag this URL as failed
+				self.storeFailedURL(cur_url)
+		except Exception as e :
+			# flag this URL as failed
+			self.storeFailedURL(cur_url)
+
+		# signal the queue that this URL has been processed
+		self.queue_.taskDone()
+
+	# coroutine that waits until the url's host's robots.txt has been read and checks if its rules allow us to crawl the url
+	# returns True if they do, False otherwise
+	async def robotsAllowAsync(self, url) :
+		allowed = self.scheduler_.canFetch(url)
+		while (allowed == None) :
+			await asyncio.sleep(self.HOST_POLL_SECONDS_)
+			allowed = self.scheduler_.canFetch(url)
+
+		return(allowed)
+
+	# coroutine that waits until the url's host can receive another request, based on the host's request rate
+	async def waitForHostAsync(self, url) :
+		epoch = None
+
+		while True :
+			# reserve a time slot for the request or, after waiting for one, check it's still valid
+			reservation = self.scheduler_.reserve(url, epoch)
+			if (reservation == None) :
+				# the host's robots.txt is being read
+				await asyncio.sleep(self.HOST_POLL_SECONDS_)
+				continue
+
+			wait, epoch = reservation
+			if (wait <= 0) :
+				return
+
+			await asyncio.sleep(wait)
+
+	# coroutine that requests a URL, following any redirects, with the extra headers passed
+	# if it's a webpage, its body is parsed (as it's downloaded or, if there's a parser_pool_, by the parser processes)
+	# and the links found are stored
+	# returns a tuple ((set with the links, hash of the body), headers), where the first item is None if the body wasn't
+	# downloaded because the request is a HEAD request or the URL isn't a webpage
+	# raises urllib.error.HTTPError if the server doesn't reply with a success status code
+	async def fetchURL(self, url, extra_headers, method="GET") :
+		# local variables used to let the scheduler know how the host replied
+		start_time = time.monotonic()
+		request_url = url
+
+		for _ in range(self.MAX_REDIRECTS_ + 1) :
+			status, reason, headers, parsed = await self.requestURL(url, extra_headers, method)
+
+			# if this is a redirect, follow it
+			if (status in (301, 302, 303, 307, 308) and headers.get("Location") != None) :
+				url = urllib.parse.urljoin(url, headers.get("Location"))
+				continue
+
+			self.scheduler_.update(request_url, status, time.monotonic() - start_time, headers.get("Retry-After"))
+
+			# any status other than success is treated as a failed request
+			if (status < 200 or status >= 300) :
+				raise urllib.error.HTTPError(url, status, reason, headers, None)
+
+			return((parsed, headers))
+
+		raise urllib.error.URLError("Too many redirects: " + url)
+
+	# coroutine that sends a request for a URL, with the extra headers passed, and reads the reply
+	# using an idle keep-alive connection to the URL's host, if there is one
+	# the body is only read if the request succeeded and it's a webpage, in which case it's parsed
+	# returns a tuple (status code, reason, headers, (set with the links, hash of the body) or None)
+	async def requestURL(self, url, extra_headers, method="GET") :
+		parsed_url = urllib.parse.urlsplit(url)
+
+		# build the key identifying the host
+		if (parsed_url.scheme == "https") :
+			key = ("https", parsed_url.hostname, parsed_url.port or 443)
+		else :
+			key = ("http", parsed_url.hostname, parsed_url.port or 80)
+
+		# build the request's path and host header
+		path = parsed_url.path or "/"
+		if (parsed_url.query != "") :
+			path += "?" + parsed_url.query
+		host = parsed_url.hostname
+		if (parsed_url.port != None) :
+			host += ":" + str(parsed_url.port)
+
+		# build the request
+		request = method + " " + path + " HTTP/1.1\r\nHost: " + host + "\r\nUser-Agent: " + self.USER_AGENT_ + "\r\nAccept-Encoding: identity\r\n"
+		for name, value in extra_headers.items() :
+			request += name + ": " + value + "\r\n"
+		request = (request + "\r\n").encode("ascii")
+
+		reader, writer, reused = await self.getConnection(key)
+
+		# local variable with True if the connection can be reused once the reply has been read
+		reusable = False
+
+		try :
+			try :
+				status_line = await self.sendRequest(reader, writer, request)
+			except (ConnectionError, asyncio.IncompleteReadError) :
+				writer.close()
+
+				# if the connection was reused, the server may have closed it while it was idle, so try again with a new one
+				if (not reused) :
+					raise
+				reader, writer = await self.newConnection(key)
+				status_line = await self.sendRequest(reader, writer, request)
+
+			# parse the status line and read the headers
+			status_parts = status_line.split(" ", 2)
+			status = int(status_parts[1])
+			reason = status_parts[2] if len(status_parts) > 2 else ""
+			header_lines = []
+			while True :
+				header_lines.append(await self.readTimed(reader.readline()))
+				if (header_lines[-1] in (b"\r\n", b"\n", b"")) :
+					break
+			headers = http.client.parse_headers(io.BytesIO(b"".join(header_lines)))
+
+			# HTTP/1.1 connections are kept alive, unless the server asks to close it
+			keep_alive = status_parts[0] == "HTTP/1.1" and headers.get("Connection", "").lower() != "close"
+
+			# read and parse the body, if it's a webpage
+			parsed = None
+			body = None
+			if (method == "HEAD" or status < 200 or status in (204, 304)) :
+				# there is no body
+				reusable = keep_alive
+			elif (status < 300 and self.isHTMLResponse(headers)) :
+				if (self.parser_pool_ == None) :
+					# parse the body as it's downloaded
+					stream = HTMLStream.HTMLStream(self.createLinkExtractor(url), headers)
+					complete = await self.readBody(reader, headers, lambda data : self.feedStream(stream, data), self.max_body_size_)
+					self.closeStream(stream)
+					parsed = (stream.links(), stream.contentHash())
+				else :
+					# read the body, to be parsed by the parser processes
+					chunks = []
+					complete = await self.readBody(reader, headers, chunks.append, self.max_body_size_)
+					body = b"".join(chunks)
+
+				reusable = keep_alive and complete
+			elif (keep_alive and (headers.get("Transfer-Encoding", "").lower() == "chunked" or int(headers.get("Content-Length", self.MAX_DRAIN_SIZE_ + 1)) <= self.MAX_DRAIN_SIZE_)) :
+				# the body isn't needed, but a small one is read so the connection can be reused
+				reusable = await self.readBody(reader, headers, lambda data : None, self.MAX_DRAIN_SIZE_)
+		finally :
+			if (reusable) :
+				self.releaseConnection(key, reader, writer)
+			else :
+				writer.close()
+
+		# wait for the body to be parsed by the parser processes, after releasing the connection
+		if (body != None) :
+			parsed = await asyncio.wrap_future(self.submitBody(url, body, headers))
+			self.storeDiscoveredURLs(self.collectURLs(parsed[0]))
+
+		return((status, reason, headers, parsed))
+
+	# coroutine that sends a request and reads the reply's status line
+	# returns the status line
+	# raises ConnectionResetError if the connection was closed before the reply
+	async def sendRequest(self, reader, writer, request) :
+		writer.write(request)
+		await self.readTimed(writer.drain())
+
+		status_line = await self.readTimed(reader.readline())
+		if (status_line == b"") :
+			raise ConnectionResetError("The connection was closed before the reply")
+
+		return(status_line.decode("iso-8859-1").rstrip("\r\n"))
+
+	# coroutine that waits for an awaitable reading from or writing to a connection, for up to REQUEST_TIMEOUT_ seconds
+	# NOTE: each read has its own time limit, so large but healthy webpages aren't abandoned
+	# raises asyncio.TimeoutError if it takes longer
+	async def readTimed(self, awaitable) :
+		return(await asyncio.wait_for(awaitable, self.REQUEST_TIMEOUT_))
+
+	# coroutine that returns a tuple (reader, writer, True if it was reused) with a connection to the host identified by key
+	async def getConnection(self, key) :
+		idle = self.idle_connections.get(key, [])
+
+		# use the most recently used idle connection, closing any that have been idle for too long or were closed by the server
+		while (len(idle) > 0) :
+			reader, writer, last_used = idle.pop()
+			if (time.monotonic() - last_used < self.connection_pool_.idle_timeout and not reader.at_eof()) :
+				return((reader, writer, True))
+			writer.close()
+
+		reader, writer = await self.newConnection(key)
+
+		return((reader, writer, False))
+
+	# coroutine that opens a new connection to the host identified by key
+	# returns a tuple (reader, writer)
+	async def newConnection(self, key) :
+		return(await self.readTimed(asyncio.open_connection(key[1], key[2], ssl=self.ssl_context if key[0] == "https" else None)))
+
+	# keeps a connection, whose reply has been fully read, to be reused by the next request to the host identified by key
+	# up to concurrency idle connections are kept per host
+	def releaseConnection(self, key, reader, writer) :
+		idle = self.idle_connections.setdefault(key, [])
+
+		if (len(idle) < self.concurrency) :
+			idle.append([reader, writer, time.monotonic()])
+		else :
+			writer.close()
+
+	# coroutine that reads a body, up to limit bytes, passing each part read to the consume function
+	# returns True if the whole body was read and the connection can be used for another request, False otherwise
+	async def readBody(self, reader, headers, consume, limit) :
+		if (headers.get("Transfer-Encoding", "").lower() == "chunked") :
+			return(await self.readChunkedBody(reader, consume, limit))
+
+		# the body ends after Content-Length bytes or, if it's not set, at the end of the connection
+		length = None
+		end = limit
+		if (headers.get("Content-Length") != None) :
+			length = int(headers.get("Content-Length"))
+			end = min(limit, length)
+
+		size = 0
+		while (size < end) :
+			data = await self.readTimed(reader.read(min(self.READ_CHUNK_SIZE_, end - size)))
+			if (data == b"") :
+				return(False)
+
+			size += len(data)
+			consume(data)
+
+		return(length != None and size == length)
+
+	# coroutine that reads a body sent with "Transfer-Encoding: chunked", up to limit bytes, passing each part read to the consume function
+	# returns True if the whole body was read and the connection can be used for another request, False otherwise
+	async def readChunkedBody(self, reader, consume, limit) :
+		size = 0
+
+		while (size < limit) :
+			# each chunk starts with its size, in hexadecimal
+			chunk_size = int((await self.readTimed(reader.readline())).split(b";")[0].strip(), 16)
+
+			# a chunk with size 0 signals the end of the body, followed by any trailer headers and an empty line
+			if (chunk_size == 0) :
+				while True :
+					line = await self.readTimed(reader.readline())
+					if (line in (b"\r\n", b"\n")) :
+						return(True)
+					if (line == b"") :
+						return(False)
+
+			# read the chunk, in parts, and the \r\n after it
+			while (chunk_size > 0 and size < limit) :
+				data = await self.readTimed(reader.read(min(chunk_size, self.READ_CHUNK_SIZE_, limit - size)))
+				if (data == b"") :
+					return(False)
+
+				chunk_size -= len(data)
+				size += len(data)
+				consume(data)
+
+			if (chunk_size == 0) :
+				await self.readTimed(reader.readexactly(2))
+
+		return(False)
@@ -0,0 +1,66 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import math
+
+class BloomFilter :
+	"""This class defines a Bloom filter: a fixed size bit array answering if a string may have been added to it.
+	A string that wasn't added is reported as not added, except for a false positive rate of about error_rate,
+	while capacity strings or less were added (it grows past that, but the memory used doesn't).
+
+	It uses about 1.2 bytes per string of capacity at a 1% error rate, so it can be kept in memory in front of
+	a slower store (ex: a database), to skip looking up the strings that certainly aren't there.
+
+	The bits are picked with Python's hash() of the strings, which is only computed once per string object,
+	so the filter can't be saved and loaded by other processes (the hashes of strings change between processes)."""
+
+	def __init__(self, capacity, error_rate) :
+		# instance variables with the # of bits and the # of bits set per string (the optimal values for the capacity and error rate)
+		self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+		self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+		# instance variable with the bit array
+		self.bits = bytearray((self.num_bits + 7) // 8)
+
+	# removes all the strings
+	def clear(self) :
+		self.bits = bytearray(len(self.bits))
+
+	# returns the 2 hashes of a string, from the halves of its hash()
+	# the position of the bit i of the string is hash_1 + i * hash_2 (double hashing), instead of computing num_hashes hashes
+	def hashes(self, item) :
+		item_hash = hash(item)
+
+		# NOTE: the 2nd hash is made odd, so it's never 0 (all the positions would be the same)
+		return(item_hash & 0xFFFFFFFF, (item_hash >> 32) | 1)
+
+	# adds a string
+	def add(self, item) :
+		hash_1, hash_2 = self.hashes(item)
+
+		for i in range(self.num_hashes) :
+			position = (hash_1 + i * hash_2) % self.num_bits
+			self.bits[position >> 3] |= 1 << (position & 7)
+
+	# checks if a string may have been added
+	# returns False if it wasn't, True if it was or in case of a false positive
+	# NOTE: most strings not added are found to be so in the 1st or 2nd bit checked
+	def __contains__(self, item) :
+		hash_1, hash_2 = self.hashes(item)
+
+		for i in range(self.num_hashes) :
+			position = (hash_1 + i * hash_2) % self.num_bits
+			if (self.bits[position >> 3] & (1 << (position & 7)) == 0) :
+				return(False)
+
+		return(True)
@@ -0,0 +1,185 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import threading, time, ssl, http.client, urllib.parse, urllib.error
+
+class ConnectionPool :
+	"""This class keeps persistent (keep-alive) http.client connections, per host, to be shared by the crawler threads.
+	A connection is taken from the pool for each request and returned to it once the response has been fully read,
+	so consecutive requests to the same host reuse the same TCP connection (and TLS session).
+
+	Up to max_size idle connections are kept per host, and idle connections are closed after idle_timeout seconds."""
+
+	# class constant with the max # of redirects followed for each URL
+	MAX_REDIRECTS_ = 10
+
+	def __init__(self, max_size, idle_timeout, timeout=30) :
+		# instance variables with the pool settings
+		self.max_size = max(1, int(max_size))
+		self.idle_timeout = idle_timeout
+		self.timeout = timeout
+
+		# instance variable with the idle connections, in the form {(scheme, host, port) : [[connection, last used time], ...]}
+		self.idle_connections = {}
+		# instance variable with the lock used to access the idle connections
+		self.lock = threading.Lock()
+
+		# instance variable with the SSL context shared by all https connections
+		self.ssl_context = ssl.create_default_context()
+
+	# sends a request for a URL, following any redirects
+	# returns a PooledResponse with the final response
+	# raises urllib.error.HTTPError if the server doesn't reply with a success status code
+	def urlopen(self, url, headers, method="GET") :
+		for _ in range(self.MAX_REDIRECTS_ + 1) :
+			response = self.request(url, headers, method)
+
+			# if this is a redirect, follow it
+			if (response.status in (301, 302, 303, 307, 308) and response.headers.get("Location") != None) :
+				# read the body so the connection can be reused
+				response.read()
+				response.close()
+				url = urllib.parse.urljoin(url, response.headers.get("Location"))
+				continue
+
+			# any status other than success is treated as a failed request
+			if (response.status < 200 or response.status >= 300) :
+				response.read()
+				response.close()
+				raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+
+			return(response)
+
+		raise urllib.error.URLError("Too many redirects: " + url)
+
+	# sends 1 request for a URL, using a pooled connection if one is available
+	# returns a PooledResponse
+	def request(self, url, headers, method="GET") :
+		parsed_url = urllib.parse.urlsplit(url)
+
+		# build the key identifying the host
+		if (parsed_url.scheme == "https") :
+			key = ("https", parsed_url.hostname, parsed_url.port or 443)
+		else :
+			key = ("http", parsed_url.hostname, parsed_url.port or 80)
+
+		# build the request's path
+		path = parsed_url.path or "/"
+		if (parsed_url.query != "") :
+			path += "?" + parsed_url.query
+
+		connection, reused = self.getConnection(key)
+
+		try :
+			connection.request(method, path, headers=headers)
+			response = connection.getresponse()
+		except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) :
+			connection.close()
+
+			# if the connection was reused, the server may have closed it while it was idle, so try again with a new one
+			if (not reused) :
+				raise
+			connection = self.newConnection(key)
+			try :
+				connection.request(method, path, headers=headers)
+				response = connection.getresponse()
+			except Exception :
+				connection.close()
+				raise
+		except Exception :
+			connection.close()
+			raise
+
+		return(PooledResponse(self, key, connection, response, url))
+
+	# returns a tuple (connection, True if it was reused) for the host identified by key
+	def getConnection(self, key) :
+		with self.lock :
+			idle = self.idle_connections.get(key, [])
+
+			# use the most recently used idle connection, closing any that have been idle for too long
+			while (len(idle) > 0) :
+				connection, last_used = idle.pop()
+				if (time.monotonic() - last_used < self.idle_timeout) :
+					return((connection, True))
+				connection.close()
+
+		return((self.newConnection(key), False))
+
+	# creates a new connection to the host identified by key
+	def newConnection(self, key) :
+		if (key[0] == "https") :
+			return(http.client.HTTPSConnection(key[1], key[2], timeout=self.timeout, context=self.ssl_context))
+
+		return(http.client.HTTPConnection(key[1], key[2], timeout=self.timeout))
+
+	# returns a connection to the pool, if it can be reused and the pool for its host isn't full
+	def releaseConnection(self, key, connection, reusable) :
+		if (reusable) :
+			with self.lock :
+				idle = self.idle_connections.setdefault(key, [])
+
+				if (len(idle) < self.max_size) :
+					idle.append([connection, time.monotonic()])
+					return
+
+		connection.close()
+
+	# closes all the idle connections
+	def closeAll(self) :
+		with self.lock :
+			for idle in self.idle_connections.values() :
+				for connection, _ in idle :
+					connection.close()
+
+			self.idle_connections.clear()
+
+class PooledResponse :
+	"""This class wraps an http.client.HTTPResponse obtained from a ConnectionPool.
+	When closed, the connection is returned to the pool if the response was fully read and the server allows it to be reused."""
+
+	def __init__(self, pool, key, connection, response, url) :
+		self.pool = pool
+		self.key = key
+		self.connection = connection
+		self.response = response
+
+		# instance variables with the response's information
+		self.url = url
+		self.status = response.status
+		self.reason = response.reason
+		self.headers = response.msg
+
+	# reads up to amt bytes of the body (all of it if amt is None)
+	def read(self, amt=None) :
+		return(self.response.read(amt))
+
+	# releases the connection back to the pool
+	def close(self) :
+		if (self.connection == None) :
+			return
+
+		# the connection can only be reused if the whole body was read and the server didn't ask to close it
+		reusable = self.response.isclosed() and not self.response.will_close
+		if (not reusable) :
+			self.response.close()
+
+		self.pool.releaseConnection(self.key, self.connection, reusable)
+		self.connection = None
+
+	def __enter__(self) :
+		return(self)
+
+	def __exit__(self, exc_type, exc_value, traceback) :
+		self.close()
@@ -11,8 +11,8 @@
 # 															 #
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-import threading, time, urllib.robotparser, urllib.request, urllib.parse
-from classes import ParserHTML, general
+import threading, time, hashlib, urllib.robotparser, urllib.parse, urllib.error
+from classes import HTMLStream, LinkExtractor, ParserHTML, URLCanonicalizer, general
 
 class Crawler(threading.Thread) :
 	"""This class defined a website crawler.
@@ -34,13 +34,58 @@ class Crawler(threading.Thread) :
 	# class variable used to keep track of URLs found that could not be successfully crawled
 	failed_urls_ = None
 
-	# class variables referencing a queue and its lock
+	# class variable referencing the work queue (a Frontier instance)
 	queue_ = None
-	queue_lock_ = None
+
+	# class variable referencing the journal where the URL state transitions are logged (a Journal instance)
+	journal_ = None
+
+	# class variable referencing the pool of keep-alive connections shared by all crawlers (a ConnectionPool instance)
+	connection_pool_ = None
+
+	# class variable referencing the scheduler that spaces the requests to each host (a HostScheduler instance)
+	scheduler_ = None
+
+	# class variable referencing the store of the crawled URLs' validators and links (an HTTPCache instance)
+	http_cache_ = None
 
 	# class variable with the root URL for the website we're crawling
 	root_url_ = ""
 
+	# class variable flagging if the links are collected with the fast LinkExtractor (True) or with ParserHTML (False)
+	fast_link_extractor_ = True
+
+	# class variable with the rules used to convert the links found to their canonical form (a URLCanonicalizer instance)
+	canonicalizer_ = URLCanonicalizer.URLCanonicalizer()
+
+	# class variable referencing the pool of processes parsing the webpages (a ParserPool instance)
+	# if None, the webpages are parsed by the crawlers, as they are downloaded
+	parser_pool_ = None
+
+	# class variable with the max # of bytes downloaded from a webpage
+	# only the start of bigger webpages is parsed
+	max_body_size_ = 5 * 1024 * 1024
+
+	# class constant with the user agent sent to the servers
+	# NOTE: this program will present itself under the name "SiteMapCrawler"
+	USER_AGENT_ = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36 SiteMapCrawler"
+	# class constant with the name used to find the robots.txt rules that apply to this program
+	ROBOTS_NAME_ = "SiteMapCrawler"
+
+	# class constant with the #seconds a crawler sleeps at a time while waiting for a host to be available
+	HOST_POLL_SECONDS_ = 0.1
+
+	# class constant with the content types of the responses that are parsed for links
+	HTML_CONTENT_TYPES_ = ("text/html", "application/xhtml+xml")
+	# class constant with the extensions of the URLs that are first checked with a HEAD request, since they are unlikely to be webpages
+	NON_HTML_EXTENSIONS_ = (".pdf", ".zip", ".gz", ".tgz", ".tar", ".rar", ".7z", ".exe", ".msi", ".dmg", ".iso", ".apk", ".jpg", ".jpeg", ".png", ".gif",
+		".bmp", ".tif", ".tiff", ".webp", ".svg", ".ico", ".mp3", ".wav", ".ogg", ".flac", ".mp4", ".m4v", ".avi", ".mov", ".wmv", ".mkv", ".webm",
+		".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".odt", ".ods", ".odp")
+	# class constant with the status codes of servers that don't support HEAD requests
+	HEAD_UNSUPPORTED_STATUSES_ = (405, 501)
+	# class constant with the max # of bytes of a webpage read and parsed at a time
+	READ_CHUNK_SIZE_ = 64 * 1024
+
 	def __init__(self) :
 		# call the threading.Thread __init__ method, and make sure all threads are daemon=True
 		# this insures all threads will terminate if the application is shutdown...even thought data can be corrupted.
@@ -50,95 +95,324 @@ class Crawler(threading.Thread) :
 	# will continue running until self.terminate_thread_ is True
 	def run(self) :
 		# if the class variables aren't set, terminate thread
-		if (self.known_urls_ == None or self.crawled_urls_ == None or self.external_urls_ == None or self.failed_urls_ == None or self.queue_ == None or self.queue_lock_ == None or self.root_url_ == "") :
+		if (not self.classVariablesSet()) :
 			print("At least 1 class variable not set!")
 			return
 
 		# parse the root_url_
-		self.parsed_root_url = urllib.parse.urlparse(self.root_url_)
-		# remove the port information, if it's present
-		port_index = self.parsed_root_url.netloc.find(":")
-		if (port_index != -1) :
-			self.parsed_root_url_netloc_noport = self.parsed_root_url.netloc[:port_index]
-		else :
-			self.parsed_root_url_netloc_noport = self.parsed_root_url.netloc
-
-		# build the full URL with no port
-		self.parsed_root_url_full = self.parsed_root_url_netloc_noport + self.parsed_root_url.path
+		self.parseRootURL()
 
 		# loop until the terminate flag is set to True
 		while not self.terminate_thread_ :
-			# get the lock for the queue
-			self.queue_lock_.acquire()
-
-			if (len(self.queue_) > 0) :
-				# get the next URL from the queue
-				cur_url = self.queue_.pop()
-				# release the lock for the queue
-				self.queue_lock_.release()
-
-				# process this URL
-				try:
-					urls = self.processURL(cur_url)
-
-					# get the lock for the queue
-					self.queue_lock_.acquire()
-
-					# if the list is not empty, add them to the queue_
-					if (len(urls) > 0) :
-						for url in urls :
-							# check if this URL is already in the queue or has been processed
-							if (url not in self.known_urls_) :
-								# add this URL to the queue
-								self.queue_.add(url)
-								# add this URL to the set with known URLs
-								self.known_urls_.add(url)
-
-					# add this URL to the set with crawled URLs
-					self.crawled_urls_.add(cur_url)
-
-					# release the lock for the queue
-					self.queue_lock_.release()
-				except Exception as e:
-					# add this URL to the failed_urls_
-					self.failed_urls_.add(cur_url)
-					# add this URL to the set with known URLs
-					self.known_urls_.add(cur_url)
-			else :
-				# release the lock for the queue
-				self.queue_lock_.release()
-				# wait 1 second
-				time.sleep(1)
+			# get the next URL from the queue, waiting for one to be available
+			cur_url = self.queue_.get()
+
+			# if the queue was closed, terminate
+			if (cur_url == None) :
+				break
+
+			# skip the URLs the host's robots.txt doesn't allow us to crawl, flagging them as failed
+			allowed = self.robotsAllow(cur_url)
+			if (allowed == None) :
+				# the crawl was terminated while waiting, so put the URL back in the queue
+				self.queue_.requeue(cur_url)
+				break
+			if (not allowed) :
+				self.storeFailedURL(cur_url)
+				self.queue_.taskDone()
+				continue
+
+			# wait until the URL's host can receive another request
+			if (not self.waitForHost(cur_url)) :
+				# the crawl was terminated while waiting, so put the URL back in the queue
+				self.queue_.requeue(cur_url)
+				break
+
+			# process this URL
+			try:
+				urls = self.processURL(cur_url)
+
+				# store the URLs found and flag this URL as crawled
+				self.storeCrawledURL(cur_url, urls)
+			except urllib.error.HTTPError as e:
+				# if the host is overloaded, put the URL back in the queue to be tried again later
+				# NOTE: the URL is still an unfinished task of the queue, so taskDone() isn't called
+				if (e.code in self.scheduler_.OVERLOADED_STATUSES_ and self.scheduler_.retry(cur_url)) :
+					self.queue_.requeue(cur_url)
+					continue
+
+				# flag this URL as failed
+				self.storeFailedURL(cur_url)
+			except Exception as e:
+				# flag this URL as failed
+				self.storeFailedURL(cur_url)
+
+			# signal the queue that this URL has been processed
+			self.queue_.taskDone()
 
 		print("thread terminating: " + str(threading.get_ident()))
 
-	# this mehod will visit the url, collect all it's HTML, feed it to the HTML parser
-	# and gather all the links in that URL
+	# this mehod will visit the url, feed it's HTML to the HTML parser as it's downloaded
+	# and store the links in that URL as they are found
+	# if the URL was crawled before and hasn't changed since, the links stored in the cache are used
+	# if the URL isn't a webpage, its body isn't downloaded and no links are gathered
+	# returns a list with the internal links found that haven't been stored yet
 	def processURL(self, cur_url) :
-		# local variable to store the desired URLs
-		urls = []
+		# if the URL is in the cache, make the request conditional
+		cache_entry = self.http_cache_.get(cur_url)
+		headers = self.http_cache_.conditionalHeaders(cache_entry)
+		headers["User-Agent"] = self.USER_AGENT_
+
+		# local variables with the parsed webpage (None if it wasn't downloaded) and the response's headers
+		parsed = None
+		response_headers = None
+
+		try :
+			# if the URL looks like a file, check what it is with a HEAD request
+			if (self.hasNonHTMLExtension(cur_url)) :
+				try :
+					parsed, response_headers = self.openURL(cur_url, headers, "HEAD")
+				except urllib.error.HTTPError as e :
+					if (e.code not in self.HEAD_UNSUPPORTED_STATUSES_) :
+						raise
+
+			# download and parse the URL's HTML, unless the HEAD request showed it isn't a webpage
+			if (response_headers == None or self.isHTMLResponse(response_headers)) :
+				parsed, response_headers = self.openURL(cur_url, headers, "GET")
+		except urllib.error.HTTPError as e :
+			# if the page hasn't changed, use the links stored in the cache
+			if (e.code == 304 and cache_entry != None) :
+				return(self.collectURLs(self.cachedLinks(cache_entry)))
+			raise
+
+		# store the links in the cache
+		# NOTE: the links were stored as they were found
+		self.storeResponse(cur_url, response_headers, parsed)
+		return([])
+
+	# sends a request for a URL, using a pooled keep-alive connection, and lets the scheduler know how the host replied
+	# if it's a webpage, its body is parsed (as it's downloaded or, if there's a parser_pool_, by the parser processes)
+	# and the links found are stored
+	# returns a tuple ((set with the links, hash of the body), headers), where the first item is None if the body wasn't
+	# downloaded because the request is a HEAD request or the URL isn't a webpage
+	def openURL(self, url, headers, method) :
+		start_time = time.monotonic()
+
+		try :
+			with self.connection_pool_.urlopen(url, headers, method) as response :
+				self.scheduler_.update(url, response.status, time.monotonic() - start_time)
+
+				# the response to a HEAD request has no body, but reading it lets the connection be reused
+				if (method == "HEAD") :
+					response.read()
+					return((None, response.headers))
+
+				# closing the response without reading the body aborts the download
+				if (not self.isHTMLResponse(response.headers)) :
+					return((None, response.headers))
+
+				# read and parse the body, up to max_body_size_ bytes
+				if (self.parser_pool_ == None) :
+					stream = HTMLStream.HTMLStream(self.createLinkExtractor(response.url), response.headers)
+					while (stream.size < self.max_body_size_) :
+						data = response.read(min(self.READ_CHUNK_SIZE_, self.max_body_size_ - stream.size))
+						if (data == b"") :
+							break
+
+						self.feedStream(stream, data)
+					self.closeStream(stream)
+
+					return(((stream.links(), stream.contentHash()), response.headers))
+
+				# read the body, up to max_body_size_ bytes, to be parsed by the parser processes
+				body = response.read(self.max_body_size_)
+				response_headers = response.headers
+		except urllib.error.HTTPError as e :
+			self.scheduler_.update(url, e.code, time.monotonic() - start_time, e.headers.get("Retry-After"))
+			raise
+
+		# wait for the body to be parsed, after releasing the connection
+		parsed = self.submitBody(response.url, body, response_headers).result()
+		self.storeDiscoveredURLs(self.collectURLs(parsed[0]))
+
+		return((parsed, response_headers))
+
+	# checks if a URL's path ends with the extension of a file that isn't a webpage
+	# returns True if it does, False otherwise
+	def hasNonHTMLExtension(self, url) :
+		return(urllib.parse.urlsplit(url).path.lower().endswith(self.NON_HTML_EXTENSIONS_))
+
+	# checks if a response's Content-Type is a webpage
+	# returns True if it is, or if the server didn't send the Content-Type, False otherwise
+	def isHTMLResponse(self, headers) :
+		content_type = headers.get("Content-Type")
+		if (content_type == None) :
+			return(True)
+
+		return(content_type.split(";")[0].strip().lower() in self.HTML_CONTENT_TYPES_)
+
+	# returns a new link extractor, to collect the links of the webpage in url
+	def createLinkExtractor(self, url) :
+		if (self.fast_link_extractor_) :
+			return(LinkExtractor.LinkExtractor(url, self.canonicalizer_))
+
+		return(ParserHTML.ParserHTML(url, {"a" : {"href" : True}}, self.canonicalizer_))
+
+	# feeds a chunk of a webpage's body to its HTMLStream and stores the links found in it
+	def feedStream(self, stream, data) :
+		self.storeDiscoveredURLs(self.collectURLs(stream.feed(data)))
+
+	# parses the end of a webpage's body and stores the links found in it
+	def closeStream(self, stream) :
+		self.storeDiscoveredURLs(self.collectURLs(stream.close()))
+
+	# sends the body of the webpage in url to be parsed by the parser processes
+	# returns a concurrent.futures.Future with the tuple (set with the links, hash of the body)
+	def submitBody(self, url, body, headers) :
+		return(self.parser_pool_.parse(url, self.canonicalizer_, self.fast_link_extractor_, headers.get("Content-Type"), body))
+
+	# returns a list with the links stored in a URL's cache entry, in their canonical form
+	# NOTE: needed for the entries stored with other canonicalization rules
+	def cachedLinks(self, cache_entry) :
+		links = []
+		for link in self.http_cache_.links(cache_entry) :
+			link = self.canonicalizer_.canonicalize(link)
+			if (link != None) :
+				links.append(link)
+
+		return(links)
+
+	# stores the validators, links and content's hash of a crawled URL in the cache
+	# parsed is the tuple (set with the links, hash of the body), or None if the body wasn't downloaded
+	def storeResponse(self, cur_url, headers, parsed) :
+		if (parsed != None) :
+			links, content_hash = parsed
+		else :
+			# without the body, the ETag and Content-Length are used to tell if the URL changed since the last crawl
+			links = set()
+			content_hash = hashlib.sha1((str(headers.get("ETag")) + str(headers.get("Content-Length"))).encode("utf-8")).hexdigest()
+
+		self.http_cache_.put(cur_url, headers.get("ETag"), headers.get("Last-Modified"), links, content_hash)
+
+	# waits until the url's host's robots.txt has been read and checks if its rules allow us to crawl the url
+	# returns True if they do, False if they don't, or None if the crawl was terminated while waiting
+	def robotsAllow(self, url) :
+		allowed = self.scheduler_.canFetch(url)
+		while (allowed == None) :
+			if (self.terminate_thread_) :
+				return(None)
 
-		# instantiate the class to parse the HTML
-		html_parser = ParserHTML.ParserHTML(self.root_url_, {"a" : {"href" : True}})
+			time.sleep(self.HOST_POLL_SECONDS_)
+			allowed = self.scheduler_.canFetch(url)
 
-		# grab the URL's HTML text and feed it to the html parser
-		# NOTE: this program will present itself under the name "SiteMapCrawler"
-		url_request = urllib.request.Request(cur_url, headers={'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_9_3) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.47 Safari/537.36 SiteMapCrawler'})
-		html_parser.feed(urllib.request.urlopen(url_request).read().decode("utf-8"))
+		return(allowed)
+
+	# waits until the url's host can receive another request, based on the host's request rate
+	# returns True when the request can be sent, False if the crawl was terminated while waiting
+	def waitForHost(self, url) :
+		epoch = None
+
+		while not self.terminate_thread_ :
+			# reserve a time slot for the request or, after waiting for one, check it's still valid
+			reservation = self.scheduler_.reserve(url, epoch)
+			if (reservation == None) :
+				# the host's robots.txt is being read
+				time.sleep(self.HOST_POLL_SECONDS_)
+				continue
+
+			wait, epoch = reservation
+			if (wait <= 0) :
+				return(True)
+
+			# wait until the time slot, checking regularly if the crawl was terminated
+			end_time = time.monotonic() + wait
+			while not self.terminate_thread_ and time.monotonic() < end_time :
+				time.sleep(min(end_time - time.monotonic(), self.HOST_POLL_SECONDS_))
+
+		return(False)
+
+	# gathers the links found in a webpage
+	# external links are stored in external_urls_ and the internal links are returned in a list
+	def collectURLs(self, links) :
+		# local variables to store the desired URLs and the external URLs
+		urls = []
+		external_urls = []
 
 		# loop through the gathered links, prepare them and add them to the queue
-		for url_candidate in html_parser.collected_attrs :
+		for url_candidate in links :
 			# check if this URL points to an external domain
 			if (self.isExternal(url_candidate)) :
-				# store it in the seperate set
-				self.external_urls_.add(url_candidate)
+				# store it in the seperate list
+				external_urls.append(url_candidate)
 				continue
 
 			# add this URL to the final list
 			urls.append(url_candidate)
 
+		# store the external URLs
+		self.storeExternalURLs(external_urls)
+
 		return(urls)
 
+	# stores the internal URLs found in a crawled URL and flags that URL as crawled
+	# NOTE: the sets are always changed before the journal, so a compaction of the journal never loses a transition
+	def storeCrawledURL(self, cur_url, urls) :
+		# add any URLs not known yet to the queue
+		self.storeDiscoveredURLs(urls)
+
+		# add this URL to the set with crawled URLs
+		with self.queue_.mutex :
+			self.crawled_urls_.add(cur_url)
+		self.journal_.append(self.journal_.CRAWLED_, [cur_url])
+
+	# adds the internal URLs found, that aren't known yet, to the queue
+	def storeDiscoveredURLs(self, urls) :
+		if (len(urls) > 0) :
+			self.journal_.append(self.journal_.DISCOVERED_, self.queue_.put(urls))
+
+	# flags a URL that could not be successfully crawled
+	def storeFailedURL(self, cur_url) :
+		with self.queue_.mutex :
+			# add this URL to the failed_urls_
+			self.failed_urls_.add(cur_url)
+			# add this URL to the set with known URLs
+			self.known_urls_.add(cur_url)
+		self.journal_.append(self.journal_.FAILED_, [cur_url])
+
+	# stores the external URLs not known yet
+	def storeExternalURLs(self, urls) :
+		# local variable with the URLs added to external_urls_
+		added = []
+
+		with self.queue_.mutex :
+			for url in urls :
+				if (url not in self.external_urls_) :
+					self.external_urls_.add(url)
+					added.append(url)
+		self.journal_.append(self.journal_.EXTERNAL_, added)
+
+	# checks if all the class variables needed to crawl have been set
+	# returns True if they have, False otherwise
+	def classVariablesSet(self) :
+		if (self.known_urls_ == None or self.crawled_urls_ == None or self.external_urls_ == None or self.failed_urls_ == None or self.queue_ == None or self.journal_ == None or self.connection_pool_ == None or self.scheduler_ == None or self.http_cache_ == None or self.root_url_ == "") :
+			return(False)
+
+		return(True)
+
+	# parses root_url_ and stores the parts needed to check if a URL is external
+	def parseRootURL(self) :
+		# parse the root_url_
+		self.parsed_root_url = urllib.parse.urlparse(self.root_url_)
+		# remove the port information, if it's present
+		port_index = self.parsed_root_url.netloc.find(":")
+		if (port_index != -1) :
+			self.parsed_root_url_netloc_noport = self.parsed_root_url.netloc[:port_index]
+		else :
+			self.parsed_root_url_netloc_noport = self.parsed_root_url.netloc
+
+		# build the full URL with no port
+		self.parsed_root_url_full = self.parsed_root_url_netloc_noport + self.parsed_root_url.path
+
 	# checks if the passed URL is external to the project's domain
 	# return True if it's external, False otherwise
 	def isExternal(self, url) :
@@ -0,0 +1,228 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import os, collections, sqlite3, threading
+from classes import URLTable
+
+class DiskURLTable(URLTable.URLTable) :
+	"""This class stores the URLs of a project, and their state flags, in a sqlite database instead of in memory,
+	so crawls of websites with millions of URLs run in bounded memory. It has the same interface as URLTable.
+
+	The URLs are in a table with their flags, which is also the set of known URLs, and the order of the queued URLs
+	is kept in a 2nd table. The next QUEUE_HEAD_SIZE_ queued URLs are read in 1 go and kept in memory.
+
+	The database is a working copy of the project's URL files, which are still the saved state of the crawl,
+	so the changes are committed in batches and without waiting for them to be written to the disk.
+
+	If a BloomFilter is passed, all the URLs added are also added to it and the URLs it reports as not added
+	aren't looked up in the database. It only skips the lookups of new URLs: the known ones are still looked up
+	(the Frontier skips the links recently found to be known, like navigation links, before they get here)."""
+
+	# class constant with the # of queued URLs read from the database at a time
+	QUEUE_HEAD_SIZE_ = 1000
+	# class constant with the # of changes after which they are committed
+	COMMIT_CHANGES_ = 10000
+	# class constant with the max size, in KB, of the database's pages kept in memory
+	CACHE_SIZE_ = 32768
+
+	def __init__(self, path, bloom_filter=None) :
+		# instance variable with the path to the database file
+		self.path = path
+
+		# instance variable with the Bloom filter of the URLs in the database, or None to always look them up
+		self.bloom_filter = bloom_filter
+
+		# instance variable with the database connection
+		self.connection = None
+
+		# instance variable with the lock used to access the database
+		# NOTE: the changes are made by the crawlers holding the Frontier's mutex, but the URLs can be read without it
+		self.lock = threading.RLock()
+
+		self.clear()
+
+	# removes all the URLs, starting with an empty database
+	def clear(self) :
+		with self.lock :
+			self.close()
+
+			if (os.path.isfile(self.path)) :
+				os.remove(self.path)
+
+			if (self.bloom_filter != None) :
+				self.bloom_filter.clear()
+
+			self.connection = sqlite3.connect(self.path, check_same_thread=False)
+			self.connection.execute("PRAGMA journal_mode = OFF")
+			self.connection.execute("PRAGMA synchronous = OFF")
+			self.connection.execute("PRAGMA cache_size = -" + str(self.CACHE_SIZE_))
+			self.connection.execute("CREATE TABLE urls (url TEXT PRIMARY KEY, flags INTEGER NOT NULL) WITHOUT ROWID")
+			self.connection.execute("CREATE TABLE queue (position INTEGER PRIMARY KEY, url TEXT NOT NULL)")
+
+			# instance variable with the # of URLs with each flag, in the form {flag : count}
+			self.counts = {self.KNOWN_ : 0, self.QUEUED_ : 0, self.CRAWLED_ : 0, self.FAILED_ : 0, self.EXTERNAL_ : 0}
+
+			# instance variable with the queued URLs read from the database, in the order they were queued
+			# NOTE: URLs removed from the queue are only dropped from it when they reach its front
+			self.queue_head = collections.deque()
+
+			# instance variable with the # of changes not committed yet
+			self.changes = 0
+
+			# instance variable with the # of snapshots taken, used to name their tables
+			self.num_snapshots = 0
+
+	# closes the database and deletes its file
+	def close(self) :
+		with self.lock :
+			if (self.connection != None) :
+				self.connection.close()
+				self.connection = None
+
+				os.remove(self.path)
+
+	# commits the changes once COMMIT_CHANGES_ of them are pending
+	def changed(self) :
+		self.changes += 1
+
+		if (self.changes >= self.COMMIT_CHANGES_) :
+			self.connection.commit()
+			self.changes = 0
+
+	# returns the flags of a URL (0 if it isn't in the database)
+	def getFlags(self, url) :
+		# URLs not in the Bloom filter certainly aren't in the database
+		if (self.bloom_filter != None and url not in self.bloom_filter) :
+			return(0)
+
+		row = self.connection.execute("SELECT flags FROM urls WHERE url = ?", (url,)).fetchone()
+
+		return(0 if row == None else row[0])
+
+	# checks if a URL has a flag
+	# returns True if it has, False otherwise
+	def hasFlag(self, url, flag) :
+		with self.lock :
+			return(self.getFlags(url) & flag != 0)
+
+	# sets a flag of a URL, adding the URL to the database if needed
+	# returns True if the flag wasn't set, False otherwise
+	def setFlag(self, url, flag) :
+		with self.lock :
+			flags = self.getFlags(url)
+			if (flags & flag != 0) :
+				return(False)
+
+			self.connection.execute("INSERT OR REPLACE INTO urls (url, flags) VALUES (?, ?)", (url, flags | flag))
+			self.counts[flag] += 1
+
+			if (flags == 0 and self.bloom_filter != None) :
+				self.bloom_filter.add(url)
+
+			if (flag == self.QUEUED_) :
+				self.connection.execute("INSERT INTO queue (url) VALUES (?)", (url,))
+
+			self.changed()
+			return(True)
+
+	# clears a flag of a URL
+	# returns True if the flag was set, False otherwise
+	def clearFlag(self, url, flag) :
+		with self.lock :
+			flags = self.getFlags(url)
+			if (flags & flag == 0) :
+				return(False)
+
+			self.connection.execute("UPDATE urls SET flags = ? WHERE url = ?", (flags & ~flag, url))
+			self.counts[flag] -= 1
+
+			self.changed()
+			return(True)
+
+	# clears a flag of all the URLs
+	def clearAll(self, flag) :
+		with self.lock :
+			self.connection.execute("UPDATE urls SET flags = flags & ? WHERE flags & ? != 0", (~flag, flag))
+			self.counts[flag] = 0
+
+			if (flag == self.QUEUED_) :
+				self.connection.execute("DELETE FROM queue")
+				self.queue_head.clear()
+
+			self.connection.commit()
+			self.changes = 0
+
+	# generator yielding the URLs with a flag
+	# NOTE: the URLs are read in batches, so the database isn't locked while the caller uses them
+	def iterFlag(self, flag) :
+		last_url = ""
+
+		while True :
+			with self.lock :
+				rows = self.connection.execute("SELECT url FROM urls WHERE url > ? AND flags & ? != 0 ORDER BY url LIMIT ?", (last_url, flag, self.QUEUE_HEAD_SIZE_)).fetchall()
+
+			for row in rows :
+				yield row[0]
+
+			if (len(rows) < self.QUEUE_HEAD_SIZE_) :
+				return
+			last_url = rows[-1][0]
+
+	# returns an iterable with the URLs that have a flag now, which can be used without holding the caller's lock
+	# NOTE: the URLs are copied to a temporary table, dropped once they have all been read
+	def snapshot(self, flag) :
+		with self.lock :
+			self.num_snapshots += 1
+			table = "snapshot_" + str(self.num_snapshots)
+			self.connection.execute("CREATE TEMP TABLE " + table + " AS SELECT url FROM urls WHERE flags & ? != 0", (flag,))
+
+		return(self.iterSnapshot(table))
+
+	# generator yielding the URLs in a snapshot's table, read in batches, and dropping the table at the end
+	def iterSnapshot(self, table) :
+		last_rowid = 0
+
+		try :
+			while True :
+				with self.lock :
+					rows = self.connection.execute("SELECT rowid, url FROM " + table + " WHERE rowid > ? ORDER BY rowid LIMIT ?", (last_rowid, self.QUEUE_HEAD_SIZE_)).fetchall()
+
+				for row in rows :
+					yield row[1]
+
+				if (len(rows) < self.QUEUE_HEAD_SIZE_) :
+					return
+				last_rowid = rows[-1][0]
+		finally :
+			with self.lock :
+				if (self.connection != None) :
+					self.connection.execute("DROP TABLE IF EXISTS " + table)
+
+	# removes and returns the URL at the front of the queue
+	# raises KeyError if the queue is empty
+	def popQueued(self) :
+		with self.lock :
+			while True :
+				# read the next queued URLs from the database
+				if (len(self.queue_head) == 0) :
+					rows = self.connection.execute("SELECT position, url FROM queue ORDER BY position LIMIT ?", (self.QUEUE_HEAD_SIZE_,)).fetchall()
+					if (len(rows) == 0) :
+						raise KeyError("pop from an empty queue")
+
+					self.connection.execute("DELETE FROM queue WHERE position <= ?", (rows[-1][0],))
+					self.queue_head.extend(row[1] for row in rows)
+
+				# skip the URLs that were removed from the queue after being queued
+				url = self.queue_head.popleft()
+				if (self.clearFlag(url, self.QUEUED_)) :
+					return(url)
@@ -0,0 +1,168 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import threading, time
+
+class Frontier :
+	"""This class defines the work queue shared by the crawler and map generator threads.
+	Workers block in get() until a URL is available, and the caller can wait in join() until every URL
+	taken from the queue has been flagged as processed with taskDone(), like queue.Queue does.
+
+	The pending URLs are kept in the collection passed at instantiation (a set or URLSetView, or a list if no URLs will be added),
+	so the caller's variables always reflect the current state of the queue.
+
+	The URLs recently found to be known (ex: the navigation links repeated in every webpage) are also kept in a small set,
+	checked without the lock, so they don't wait for it or look up known_urls again (a database lookup if it's a DiskURLTable view)."""
+
+	# class constant with the max # of URLs in the set of recently known URLs
+	RECENT_KNOWN_SIZE_ = 10000
+
+	def __init__(self, queue, known_urls=None) :
+		# instance variables with the pending URLs and, if URLs can be added, the URLs already known
+		self.queue = queue
+		self.known_urls = known_urls
+
+		# instance variable with the URLs recently found to be known, in the order they were added (the oldest are dropped 1st)
+		# NOTE: it's only changed holding the lock, but it can be read without it, since a known URL never stops being known
+		self.recent_known = {}
+
+		# instance variable with the lock used to access the queue
+		# any code that changes the sets related to the queue should hold it
+		self.mutex = threading.Lock()
+
+		# instance variables used to signal workers that there are URLs in the queue and the caller that all URLs were processed
+		self.not_empty = threading.Condition(self.mutex)
+		self.all_tasks_done = threading.Condition(self.mutex)
+
+		# instance variable with the # of URLs in the queue or being processed
+		self.unfinished_tasks = len(queue)
+
+		# instance variable used to wake up and release any waiting threads
+		self.closed = False
+
+		# instance variable with the functions called, without arguments, whenever URLs are put in the queue
+		# used by workers that don't block in get() (ex: the asyncio crawler's event loop)
+		self.listeners = []
+
+	# adds a function to be called, without arguments, whenever URLs are put in the queue
+	# NOTE: it's called from the thread putting the URLs, after the lock is released
+	def addListener(self, listener) :
+		with self.mutex :
+			self.listeners.append(listener)
+
+	# removes a function added with addListener()
+	def removeListener(self, listener) :
+		with self.mutex :
+			self.listeners.remove(listener)
+
+	# adds the URLs, not known yet, to the queue and to known_urls
+	# returns a list with the URLs that were added
+	def put(self, urls) :
+		added = []
+
+		# skip the URLs recently found to be known, without waiting for the lock
+		urls = [url for url in urls if url not in self.recent_known]
+		if (len(urls) == 0) :
+			return(added)
+
+		with self.mutex :
+			for url in urls :
+				self.addRecentKnown(url)
+
+				# check if this URL is already in the queue or has been processed
+				if (url in self.known_urls) :
+					continue
+
+				# add this URL to the queue and to the set with known URLs
+				self.queue.add(url)
+				self.known_urls.add(url)
+				added.append(url)
+
+			# if URLs were added, wake up the workers waiting for them
+			if (len(added) > 0) :
+				self.unfinished_tasks += len(added)
+				self.not_empty.notify(len(added))
+			listeners = self.listeners.copy() if len(added) > 0 else []
+
+		for listener in listeners :
+			listener()
+
+		return(added)
+
+	# adds a URL to the set of recently known URLs, dropping the oldest one if it's full
+	# NOTE: the caller must hold the lock
+	def addRecentKnown(self, url) :
+		if (url in self.recent_known) :
+			return
+
+		if (len(self.recent_known) >= self.RECENT_KNOWN_SIZE_) :
+			del self.recent_known[next(iter(self.recent_known))]
+		self.recent_known[url] = None
+
+	# puts a URL taken from the queue, but not processed, back in the queue
+	def requeue(self, url) :
+		with self.mutex :
+			self.queue.add(url)
+			self.not_empty.notify()
+			listeners = self.listeners.copy()
+
+		for listener in listeners :
+			listener()
+
+	# removes and returns a URL from the queue
+	# if the queue is empty, waits for a URL to be added for up to timeout seconds (None waits forever)
+	# returns None if no URL is available or the queue was closed
+	def get(self, timeout=None) :
+		with self.not_empty :
+			if (timeout != None) :
+				end_time = time.monotonic() + timeout
+
+			while (len(self.queue) == 0 and not self.closed) :
+				if (timeout == None) :
+					self.not_empty.wait()
+				else :
+					remaining = end_time - time.monotonic()
+					if (remaining <= 0) :
+						return(None)
+					self.not_empty.wait(remaining)
+
+			if (self.closed) :
+				return(None)
+
+			return(self.queue.pop())
+
+	# flags a URL taken from the queue as processed
+	# must be called after any URLs found while processing it have been put in the queue
+	def taskDone(self) :
+		with self.all_tasks_done :
+			self.unfinished_tasks -= 1
+
+			if (self.unfinished_tasks <= 0) :
+				self.all_tasks_done.notify_all()
+
+	# waits until all URLs have been processed, for up to timeout seconds (None waits forever)
+	# returns True if all URLs have been processed, False otherwise
+	def join(self, timeout=None) :
+		with self.all_tasks_done :
+			if (self.unfinished_tasks > 0 and not self.closed) :
+				self.all_tasks_done.wait_for(lambda: self.unfinished_tasks <= 0 or self.closed, timeout)
+
+			return(self.unfinished_tasks <= 0)
+
+	# closes the queue, waking up any threads waiting in get() or join()
+	def close(self) :
+		with self.mutex :
+			self.closed = True
+			self.not_empty.notify_all()
+			self.all_tasks_done.notify_all()
@@ -94,6 +94,9 @@ class GUI :
 		# add the inner frame to frame_task_canvas
 		self.frame_task_data = ttk.Frame(self.frame_task_canvas)
 		self.frame_task_canvas.create_window(0, 0, window=self.frame_task_data, anchor="nw")
+		# the site map task's table, placed over the canvas when that task is active
+		# it's a ttk.Treeview where each item's iid is its index in site_map_items
+		self.sitemap_table = None
 
 		# set the initial state of the task buttons
 		self.setTaskButtons("initial")
@@ -150,6 +153,9 @@ class GUI :
 			# calculate the new padding values
 			self.setPaddingValues()
 
+			# the table's row height depends on the font size
+			ttk.Style().configure("Treeview", rowheight=self.gui_font_base.metrics("linespace") + self.pad_half_rem)
+
 			# start with the main window and go through it's children and their children, and so on
 			self.updateChildrenGridPadding(self.app_window, font_size_ratio)
 
@@ -251,6 +257,8 @@ class GUI :
 		gui_style.configure("TButton", font=self.gui_font_base)
 		gui_style.configure("Primary.TButton", foreground="#00A105", font=self.gui_font_bold)
 		gui_style.configure("Stop.TButton", foreground="#FF0000", font=self.gui_font_bold)
+		gui_style.configure("Treeview", font=self.gui_font_base, rowheight=self.gui_font_base.metrics("linespace") + self.pad_half_rem)
+		gui_style.configure("Treeview.Heading", font=self.gui_font_bold)
 
 	# this method will add scrollbars to the canvas element in frame_task
 	def addScrollBars(self) :
@@ -307,22 +315,22 @@ class GUI :
 	# creates/resets the instance variables used to store/control site map task data
 	def createSiteMapVariables(self) :
 		# instance variables used to store site map task's information
-		self.sitemap_label_header = [] # format: [col # (0 indexed)][ui element reference]
-		self.sitemap_checkbox_elems = [] # format: [row # (0 indexed)][ui element reference]
-		self.sitemap_entry_lastmod = [] # format: [row # (0 indexed)][ui element reference]
-		self.sitemap_combobox_changefreq = [] # format: [row # (0 indexed)][ui element reference]
-		self.sitemap_entry_priority = [] # format: [row # (0 indexed)][ui element reference]
+		# the widget used to edit a cell in place, in the form {"widget" : ui element reference, "row" : index, "col" : col alias}
+		self.sitemap_cell_editor = None
 
-		# instance variables used to store the ToolTips class objects
+		# instance variable used to store the ToolTips class objects
 		self.tooltips_inputs = None
-		self.tooltips_header = None
 
 		# instance variables used to control site map task's manipulation of data
 		self.sitemap_cur_index = -1 # we haven't grabbed any items yet
-		self.sitemap_selected_rows = set()
+		self.sitemap_selected_rows = set() # format: row # (1 indexed)
 
 	# this method clears a frame from all slaves
 	def clearFrame(self, frames, reset_vars) :
+		# if the task data is being cleared, remove the site map table
+		if (self.frame_task_data in frames) :
+			self.removeSiteMapTable()
+
 		# clear any references to relevant input variables
 		if (reset_vars == 1) :
 			self.createSiteMapVariables()
@@ -508,8 +516,24 @@ class GUI :
 		self.input_button_elems["run_crawl"] = ttk.Button(self.frame_inputs, text="Run Crawl", command=self.caller_object.crawlSite)
 		self.input_button_elems["run_crawl"].grid(row=0, column=2, sticky="W,E", pady=self.pad_half_rem, padx=self.pad_half_rem)
 
-		# set initial value for crawlers
+		# create the asynchronous crawler elements
+		ttk.Label(self.frame_inputs, text="Max simultaneous requests (asynchronous crawler): ").grid(row=1, column=0, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
+		self.entry_elems["concurrency"] = ttk.Entry(self.frame_inputs, width="5")
+		self.entry_elems["concurrency"].grid(row=1, column=1, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
+		self.tk_vars["crawl_async"] = tk.IntVar()
+		self.tk_vars["crawl_async"].set(0)
+		self.checkbox_elems["crawl_async"] = ttk.Checkbutton(self.frame_inputs, text="Use asynchronous crawler", variable=self.tk_vars["crawl_async"], onvalue=1, offvalue=0)
+		self.checkbox_elems["crawl_async"].grid(row=1, column=2, sticky="W,E", pady=self.pad_half_rem, padx=self.pad_half_rem)
+
+		# create the max request rate elements
+		ttk.Label(self.frame_inputs, text="Max requests per second, per host (0 = no limit): ").grid(row=2, column=0, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
+		self.entry_elems["max_rate"] = ttk.Entry(self.frame_inputs, width="5")
+		self.entry_elems["max_rate"].grid(row=2, column=1, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
+
+		# set initial value for crawlers, simultaneous requests and request rate
 		self.updateNumThreads(self.caller_object.num_threads)
+		self.entry_elems["concurrency"].insert(0, self.caller_object.concurrency)
+		self.entry_elems["max_rate"].insert(0, self.caller_object.max_rate)
 
 		# grab from the Application class, the count of URLs for the current project
 		url_counts = self.caller_object.getURLCounts()
@@ -568,11 +592,8 @@ class GUI :
 		# create this task's input GUI elements
 		self.manageTaskSiteMapInputElems("initial")
 
-		# create this task's canvas GUI elements
-		self.addSiteMapItemsHeader()
-
-		# add the scrollbars to frame_task_canvas
-		self.addScrollBars()
+		# create this task's table
+		self.createSiteMapTable()
 
 	# this method deals with changes to the GUI elements of the site map task
 	# depending on the state of execution at the moment
@@ -634,6 +655,10 @@ class GUI :
 			self.input_button_elems["sitemap_load"].grid(row=1, column=0, sticky="W,E", pady=self.pad_half_rem, padx=self.pad_half_rem)
 			self.input_button_elems["sitemap_createXML"] = ttk.Button(frame_sitemap_buttons, style="Primary.TButton", state="disabled", text="Create Site Map File", command=lambda: self.caller_object.processSiteMapFileOperations("xml"))
 			self.input_button_elems["sitemap_createXML"].grid(row=2, column=0, sticky="W,E", pady=self.pad_half_rem, padx=self.pad_half_rem)
+			self.tk_vars["sitemap_gzip"] = tk.IntVar()
+			self.tk_vars["sitemap_gzip"].set(0)
+			self.checkbox_elems["sitemap_gzip"] = ttk.Checkbutton(frame_sitemap_buttons, text="Compress (gzip)", variable=self.tk_vars["sitemap_gzip"], onvalue=1, offvalue=0)
+			self.checkbox_elems["sitemap_gzip"].grid(row=3, column=0, sticky="W,E", pady=self.pad_half_rem, padx=self.pad_half_rem)
 
 			# grid the local frames
 			frame_sitemap_initial_data.grid(row=0, column=0, sticky="N,E,S,W", pady=self.pad_half_rem, padx=self.pad_half_rem)
@@ -675,6 +700,8 @@ class GUI :
 			tooltip_strings.append("Load data from the last saved temporary file.")
 			tooltip_widgets.append(self.input_button_elems["sitemap_createXML"])
 			tooltip_strings.append("Create the final XML file to be linked to this domain.")
+			tooltip_widgets.append(self.checkbox_elems["sitemap_gzip"])
+			tooltip_strings.append("Create the site map files compressed with gzip (sitemap.xml.gz).\nSearch engines accept compressed site maps, which are much smaller to store and transfer.")
 			tooltip_widgets.append(self.entry_elems["sitemap_selected_rows_lastmod"])
 			tooltip_strings.append("Change the selected rows \"Last Modified\" field to this value.\nThe date (YYYY-MM-DD) at which the webpage file was last modified.")
 			tooltip_widgets.append(self.combobox_elems["sitemap_selected_rows_changefreq"])
@@ -709,35 +736,32 @@ class GUI :
 			# update the label's text with the last save date/time
 			self.updateSiteMapSaveTime()
 
-	# responsible for processing event listener triggers from the site map task's header cols
-	def sitemapHeaderEventHandling(self, event) :
-		# remove any tooltips currently being shown on this widget
-		self.tooltips_header.hideToolTips(event)
+	# responsible for processing clicks on the site map task's table header cols
+	def sitemapHeaderEventHandling(self, col_alias) :
+		# the data can't be sorted while the site map items are being built
+		if (self.caller_object.taskRunning()) :
+			return
 
-		# grab a reference to the event widget
-		widget_ref = event.widget
-		# get the widget's grid information
-		widget_grid_info = widget_ref.grid_info()
-		# store the widget's row and column in the grid
-		widget_col = widget_grid_info["column"]
+		# finish any cell being edited, so its value is stored before sorting
+		self.finishSiteMapCellEdit()
 
 		# local variable used to store the new sorting info
 		new_sort = []
 
 		# check if the selected column is already the primary sorting column
-		if (self.sitemap_cols_nums[widget_col]["data"] == self.caller_object.site_map_items_sorting[0][0]) :
+		if (col_alias == self.caller_object.site_map_items_sorting[0][0]) :
 			# the selected column is already the primary sorting column, so flip its order
 			# start by grabing a copy of the current sort info
-			new_sort = self.caller_object.site_map_items_sorting.copy()
+			new_sort = [sort_info.copy() for sort_info in self.caller_object.site_map_items_sorting]
 			# flip the primary sorting column order
 			new_sort[0][1] = not new_sort[0][1]
 		else :
 			# the selected column is a new primary sorting column, add it
 			# use ASC as the default order
-			new_sort.append([self.sitemap_cols_nums[widget_col]["data"], False])
+			new_sort.append([col_alias, False])
 
 			# check if the selected column is the URL column
-			if (self.sitemap_cols_alias["url"] != widget_col) :
+			if (col_alias != "url") :
 				# the sorting column is NOT the URL column
 				# so add the URL asc as the secondary sorting column
 				new_sort.append(["url", False])
@@ -788,21 +812,18 @@ class GUI :
 			# make a copy of the currently selected rows
 			selected_rows = self.sitemap_selected_rows.copy()
 
-			# loop through each of the selected rows
+			# update the selected rows' data in 1 call
+			site_map_items = self.caller_object.site_map_items
+			site_map_items.setValues([row - 1 for row in selected_rows], col_alias, new_value)
+
+			# show the value as it was stored (ex: a priority of 0.50 is stored as 0.5) in the selected rows' cells in the table
+			new_value = site_map_items[next(iter(selected_rows)) - 1][col_alias]
 			for row in selected_rows :
-				# update the row's data
-				self.caller_object.site_map_items[row - 1][self.sitemap_cols_nums[col_num]["data"]] = new_value
+				self.sitemap_table.set(str(row - 1), col_alias, new_value)
 
 			# check if a save to file is needed
 			self.caller_object.saveSiteMapData(True)
 
-			# redraw the data to the screen
-			self.redrawSiteMapItems(self.caller_object.site_map_items)
-
-			# reselect the rows that were selected before the redraw
-			for row in selected_rows :
-				self.sitemap_checkbox_elems[row - 1].invoke()
-
 			# all done -> give feedback to user
 			self.showInfoMsgBox(title="Update Completed", message=str(len(selected_rows)) + " rows were updated.")
 		else :
@@ -838,6 +859,10 @@ class GUI :
 	def getRobotsUse(self) :
 		return(bool(self.tk_vars["sitemap_robots"].get()))
 
+	# returns a boolean with the current value of the "compress (gzip)" checkbutton
+	def getGzipUse(self) :
+		return(bool(self.tk_vars["sitemap_gzip"].get()))
+
 	# sets the value for the number of threads entry GUI element
 	def updateNumThreads(self, value) :
 		self.entry_elems["num_threads"].insert(0, value)
@@ -850,6 +875,20 @@ class GUI :
 		except ValueError :
 			raise
 
+	# returns the current value in the max simultaneous requests entry GUI element
+	# raises ValueError exception if the value can't be cast to Int
+	def getConcurrency(self) :
+		return(int(self.entry_elems["concurrency"].get()))
+
+	# returns the current value in the max requests per second entry GUI element
+	# raises ValueError exception if the value can't be cast to Float
+	def getMaxRate(self) :
+		return(float(self.entry_elems["max_rate"].get()))
+
+	# returns a boolean with the current value of the "use asynchronous crawler" checkbutton
+	def getAsyncUse(self) :
+		return(bool(self.tk_vars["crawl_async"].get()))
+
 	# returns the current value in the root URL entry GUI element
 	def getRootURL(self) :
 		return(self.entry_elems["root_url"].get())
@@ -889,80 +928,85 @@ class GUI :
 		if ("failed" in self.label_elems) :
 			self.label_elems["failed"].configure(text=str(failed))
 
-		self.app_window.update()
-
 	# this method will redraw the entire site map data displayed on the GUI
 	# usualy will be called when processing a load button press
 	def redrawSiteMapItems(self, items) :
-		# clear the frame with the site map data
-		self.clearFrame([self.frame_task_data], 1)
+		# finish any cell being edited
+		self.finishSiteMapCellEdit()
 
-		# add the data headers again
-		self.addSiteMapItemsHeader()
+		# remove all the rows from the table
+		self.sitemap_table.delete(*self.sitemap_table.get_children())
+
+		# reset the variables used to control the rows drawn and selected
+		self.sitemap_cur_index = -1
+		self.sitemap_selected_rows = set()
+		self.tk_vars["sitemap_select_all"].set(0)
 
 		# add the new site map data
 		if (items != None and len(items) > 0) :
 			self.updateSiteMapItems(items)
 
-	# creates the first row of the site map task's data table
-	def addSiteMapItemsHeader(self) :
-		# local variable with the tooltips text
-		tooltip_text = [
-			"The date (YYYY-MM-DD) at which the webpage file was last modified.",
-			"How frequently the webpage's content is likely to change.",
-			"The priority of this URL relative to other URLs on your site. Valid values range from 0.0 to 1.0.\nThis value does not affect how your pages are compared to pages on other sites, it only lets the search engines know which pages you deem most important for the crawlers."
-		]
+	# creates the site map task's data table, in a frame placed over frame_task's canvas
+	# the table is a ttk.Treeview, which only draws the visible rows, so any # of items can be shown
+	def createSiteMapTable(self) :
+		# hide the canvas while the table is shown
+		self.frame_task_canvas.grid_remove()
+
+		# create the frame with the table
+		self.frame_sitemap_table = ttk.Frame(self.frame_task)
+		self.frame_sitemap_table.grid(row=0, column=0, sticky="N,E,S,W")
+		self.frame_sitemap_table.rowconfigure(1, weight=1)
+		self.frame_sitemap_table.columnconfigure(0, weight=1)
 
 		# create the "select all" checkbutton
 		self.tk_vars["sitemap_select_all"] = tk.IntVar()
 		self.tk_vars["sitemap_select_all"].set(0)
-		ttk.Checkbutton(self.frame_task_data, style="Bold.TCheckbutton", text="All", variable=self.tk_vars["sitemap_select_all"], command=self.selectAllSiteMapItems).grid(row=0, column=0, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
-
-		# create the header labels and add any tooltip event listeners as needed
-		# add en empty index for column 1's checkbox
-		self.sitemap_label_header.append(None)
-
-		self.sitemap_label_header.append(ttk.Label(self.frame_task_data, style="Bold.TLabel", text=self.sitemap_cols_nums[1]["ui"]))
-		self.sitemap_label_header[-1].grid(row=0, column=1, pady=self.pad_half_rem, padx=self.pad_half_rem)
-
-		self.sitemap_label_header.append(ttk.Label(self.frame_task_data, style="Bold.TLabel", text=self.sitemap_cols_nums[2]["ui"]))
-		self.sitemap_label_header[-1].grid(row=0, column=2, pady=self.pad_half_rem, padx=self.pad_half_rem)
-
-		self.sitemap_label_header.append(ttk.Label(self.frame_task_data, style="Bold.TLabel", text=self.sitemap_cols_nums[3]["ui"]))
-		self.sitemap_label_header[-1].grid(row=0, column=3, pady=self.pad_half_rem, padx=self.pad_half_rem)
+		ttk.Checkbutton(self.frame_sitemap_table, style="Bold.TCheckbutton", text="All", variable=self.tk_vars["sitemap_select_all"], command=self.selectAllSiteMapItems).grid(row=0, column=0, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
+
+		# create the table and its scrollbar
+		self.sitemap_table = ttk.Treeview(self.frame_sitemap_table, columns=("row", "url", "lastmod", "changefreq", "priority"), show="headings", selectmode="extended")
+		self.sitemap_table.grid(row=1, column=0, sticky="N,E,S,W")
+		table_vscrollbar = ttk.Scrollbar(self.frame_sitemap_table, orient="vertical", command=self.sitemap_table.yview)
+		table_vscrollbar.grid(row=1, column=1, sticky="N,S")
+		self.sitemap_table.configure(yscrollcommand=table_vscrollbar.set)
+
+		# set the header labels and the column sizes
+		# the row # column is not sortable
+		self.sitemap_table.heading("row", text="#")
+		self.sitemap_table.column("row", width=self.pad_one_rem * 5, stretch=False, anchor="e")
+		for col_num in range(1, 5) :
+			col_alias = self.sitemap_cols_nums[col_num]["data"]
+			self.sitemap_table.heading(col_alias, text=self.sitemap_cols_nums[col_num]["ui"])
+			self.sitemap_table.column(col_alias, width=self.pad_one_rem * 12, stretch=False)
+		self.sitemap_table.column("url", width=self.pad_one_rem * 40, stretch=True)
+
+		# add the event listeners for selecting rows and editing cells
+		self.sitemap_table.bind("<<TreeviewSelect>>", self.processSiteMapItemSelection)
+		self.sitemap_table.bind("<Double-Button-1>", self.editSiteMapCell)
+		for event_name in ("<Button-1>", "<MouseWheel>", "<Button-4>", "<Button-5>") :
+			self.sitemap_table.bind(event_name, lambda event: self.finishSiteMapCellEdit(), add="+")
+
+	# removes the site map task's data table, if it exists, and shows the canvas again
+	def removeSiteMapTable(self) :
+		if (self.sitemap_table == None) :
+			return
 
-		self.sitemap_label_header.append(ttk.Label(self.frame_task_data, style="Bold.TLabel", text=self.sitemap_cols_nums[4]["ui"]))
-		self.sitemap_label_header[-1].grid(row=0, column=4, pady=self.pad_half_rem, padx=self.pad_half_rem)
+		self.frame_sitemap_table.destroy()
+		self.frame_sitemap_table = None
+		self.sitemap_table = None
+		self.sitemap_cell_editor = None
 
-		# instantiate the ToolTips class for these widgets
-		self.tooltips_header = ToolTips.ToolTips(self.sitemap_label_header[2:], tooltip_text, self.gui_font_base)
+		self.frame_task_canvas.grid()
 
 	# selects/deselects all the rows in site map task's data table
 	def selectAllSiteMapItems(self) :
 		# check if we want to select or deselect
 		if (self.tk_vars["sitemap_select_all"].get() == 0) :
 			# deselect any selected rows
-			# check if there are any selected rows
-			if (len(self.sitemap_selected_rows) == 0) :
-				# there are no selected rows, so nothing needs to be done
-				return
-			else :
-				# loop through all currently selected rows and deselect them
-				for row in self.sitemap_selected_rows.copy() :
-					self.sitemap_checkbox_elems[int(row) - 1].invoke()
+			self.sitemap_table.selection_remove(*self.sitemap_table.selection())
 		else :
-			# select any deselected rows
-			# check if there is any deselcted rows
-			if (len(self.sitemap_selected_rows) == len(self.sitemap_checkbox_elems)) :
-				# there are no deselected rows, so nothing needs to be done
-				return
-			else :
-				# loop through all checkboxes and select any deselcted ones
-				for index in range(0, len(self.sitemap_checkbox_elems)) :
-					# check if this row is deselected
-					if (index + 1 not in self.sitemap_selected_rows) :
-						# select it
-						self.sitemap_checkbox_elems[index].invoke()
+			# select all rows
+			self.sitemap_table.selection_set(*self.sitemap_table.get_children())
 
 	# updates the site map items displayed on the screen
 	def updateSiteMapItems(self, items) :
@@ -972,98 +1016,31 @@ class GUI :
 			# there are no new items
 			return
 
-		# draw the new items to the screen
+		# add the new items to the table
 		while self.sitemap_cur_index + 1 < num_items :
 			# move to the item after the one we left off
 			self.sitemap_cur_index += 1
+			item = items[self.sitemap_cur_index]
 
-			# calculate the row number
-			# +1 for the 1st row as header
-			row_num = self.sitemap_cur_index + 1
-
-			# create the input GUI elements for this item
-			# also add the validation binds
-			self.sitemap_entry_lastmod.append(ttk.Entry(self.frame_task_data, validate="all"))
-			self.sitemap_combobox_changefreq.append(ttk.Combobox(self.frame_task_data, state="readonly", values=self.changefreq_values_, validate="focusout"))
-			self.sitemap_entry_priority.append(ttk.Entry(self.frame_task_data, validate="all"))
-			# add an extra validation bind to the combobox, to make sure the data is updated when an item is selected
-			# this removes the case where the user changes a value and before focusout clicks on a column label to
-			# change the sorting, which would not have updated the site_map_items variable with the last change
-			# and when the new sort was made it would revert the last changed value
-			self.sitemap_combobox_changefreq[-1].bind("<<ComboboxSelected>>", self.validateSiteMapComboboxInput)
-
-			# add the validation callbacks to the entry widgets
-			self.sitemap_entry_lastmod[-1].configure(validatecommand=(self.sitemap_entry_lastmod[-1].register(self.validateSiteMapInput), "%W", "%V", "%P"), invalidcommand=(self.sitemap_entry_lastmod[-1].register(self.invalidSiteMapUserInput), "%W"))
-			self.sitemap_combobox_changefreq[-1].configure(validatecommand=(self.sitemap_combobox_changefreq[-1].register(self.validateSiteMapInput), "%W", "%V", "%P"), invalidcommand=(self.sitemap_combobox_changefreq[-1].register(self.invalidSiteMapUserInput), "%W"))
-			self.sitemap_entry_priority[-1].configure(validatecommand=(self.sitemap_entry_priority[-1].register(self.validateSiteMapInput), "%W", "%V", "%P"), invalidcommand=(self.sitemap_entry_priority[-1].register(self.invalidSiteMapUserInput), "%W"))
-
-			# create this item's checkbutton
-			self.sitemap_checkbox_elems.append(ttk.Checkbutton(self.frame_task_data, text=str(row_num)))
-			# make sure the checkbutton starts as not checked (before the callback is registered)
-			self.sitemap_checkbox_elems[-1].invoke()
-			self.sitemap_checkbox_elems[-1].invoke()
-			# add the callback to the checkbutton, passing the row as a parameter
-			self.sitemap_checkbox_elems[-1].configure(command=(self.sitemap_checkbox_elems[-1].register(self.processSiteMapItemSelection), row_num))
-
-			# prepare the URL text to be displayed. If it exceed the max #characters, truncate it and add ... to the end
-			# the max #characters is a % of the window's width
-			url_max_len = int(int(self.app_window.winfo_width()) * 0.3)
-			url_string = items[self.sitemap_cur_index]["url"][0:url_max_len]
-			if (len(items[self.sitemap_cur_index]["url"]) > url_max_len) :
-				url_string += "..."
-
-			# draw this item to the screen
-			# NOTE: make sure to grid before inserting the value, otherwise the validation will fail due to not finding grid information
-			self.sitemap_checkbox_elems[-1].grid(row=row_num, column=0, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
-			ttk.Label(self.frame_task_data, text=url_string).grid(row=row_num, column=1, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
-			self.sitemap_entry_lastmod[-1].grid(row=row_num, column=2, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
-			self.sitemap_entry_lastmod[-1].insert(0, items[self.sitemap_cur_index]["lastmod"])
-			self.sitemap_combobox_changefreq[-1].grid(row=row_num, column=3, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
-			self.sitemap_combobox_changefreq[-1].set(items[self.sitemap_cur_index]["changefreq"])
-			self.sitemap_entry_priority[-1].grid(row=row_num, column=4, sticky="W", pady=self.pad_half_rem, padx=self.pad_half_rem)
-			self.sitemap_entry_priority[-1].insert(0, items[self.sitemap_cur_index]["priority"])
-
-			# force a GUI redraw
-			self.app_window.update()
-
-		# calculate the new canvas size and adjust scrollregion for the scrollbar
-		self.frame_task_canvas.configure(scrollregion=self.frame_task_canvas.bbox("all"))
-
-		# add sorting event listeners to table header and change their cursor to a hand
-		for i in range(0, len(self.sitemap_label_header)) :
-			# if there is no widget in this index, move to next index
-			if (self.sitemap_label_header[i] == None) :
-				continue
-
-			# add sorting event listener
-			self.sitemap_label_header[i].bind("<Button-1>", self.sitemapHeaderEventHandling)
-
-			# change cursor
-			self.sitemap_label_header[i].configure(cursor="hand2")
+			# add this item's row, with the item's index as its iid
+			# +1 for the row number shown, since the 1st row is #1
+			self.sitemap_table.insert("", "end", iid=str(self.sitemap_cur_index), values=(self.sitemap_cur_index + 1, item["url"], item["lastmod"], item["changefreq"], item["priority"]))
 
-	# this method is called when a checkbutton of a site map's item is clicked
-	# the instance variable with the currently selected rows will be updated by
-	# either adding or removing the clicked item from it
-	def processSiteMapItemSelection(self, row) :
-		row = int(row)
+		# add sorting event listeners to table header
+		for col_num in range(1, 5) :
+			col_alias = self.sitemap_cols_nums[col_num]["data"]
+			self.sitemap_table.heading(col_alias, command=lambda col_alias=col_alias: self.sitemapHeaderEventHandling(col_alias))
 
-		# if this row is in the set, then remove it
-		if (row in self.sitemap_selected_rows) :
-			self.sitemap_selected_rows.remove(row)
+	# this method is called when the selection of rows in the site map's table changes
+	# the instance variable with the currently selected rows will be updated to match it
+	def processSiteMapItemSelection(self, event) :
+		self.sitemap_selected_rows = set([int(iid) + 1 for iid in self.sitemap_table.selection()])
 
-			# not all rows are selected, so if the "select all" checkbox is ticked, untick it
-			if (self.tk_vars["sitemap_select_all"].get() == 1) :
-				self.tk_vars["sitemap_select_all"].set(0)
-		else:
-			# not in the list, so add it
-			self.sitemap_selected_rows.add(row)
-
-			# if all rows are selected, tick the "select all" checkbox
-			if (len(self.sitemap_selected_rows) == len(self.sitemap_checkbox_elems)) :
-				self.tk_vars["sitemap_select_all"].set(1)
-
-		# force a GUI redraw
-		self.app_window.update()
+		# tick the "select all" checkbox if all rows are selected, untick it otherwise
+		if (len(self.sitemap_selected_rows) > 0 and len(self.sitemap_selected_rows) == len(self.sitemap_table.get_children())) :
+			self.tk_vars["sitemap_select_all"].set(1)
+		else :
+			self.tk_vars["sitemap_select_all"].set(0)
 
 	# this method will validate/invalidate a value from one of the site map task's data inputs
 	# returns True if valid, False otherwise
@@ -1094,7 +1071,8 @@ class GUI :
 					aux = float(new_value)
 
 					# check if the number is not valid
-					if (aux < 0.0 or aux > 1.0) :
+					# NOTE: written this way so nan isn't valid either
+					if (not 0.0 <= aux <= 1.0) :
 						return(False)
 				except Exception as e :
 					return(False)
@@ -1102,130 +1080,93 @@ class GUI :
 			# not a known input, so invalidate
 			return(False)
 
-		# if we reach this point, then it's valid
-		return(True)
-
-	# method called by tkinter when a site map task's data input widget changes value
-	# i.e., when a character is entered into an entry widget or an item is selected in a combobox
-	# this method will NOT give an error message if the value is invalid/incomplete, but
-	# will update the the value in site_map_items if the value is completed and valid
-	def validateSiteMapComboboxInput(self, event) :
-		# get a reference to the widget that changed value
-		widget_ref = event.widget
-		if (widget_ref == None) :
-			# something went wrong, so bail out
-			return(False)
+		# if we reach this point, then it's valid if the site map data can also store it
+		return(self.caller_object.site_map_items.isValid(col_alias, new_value))
 
-		# get the widget's grid information
-		widget_grid_info = widget_ref.grid_info()
-		if (widget_grid_info == None or "row" not in widget_grid_info or "column" not in widget_grid_info) :
-			# something went wrong, so bail out
-			return(False)
-
-		# store the widget's row and column in the grid
-		widget_row = widget_grid_info["row"]
-		widget_col = widget_grid_info["column"]
+	# method called when a cell of the site map's table is double clicked
+	# places an entry (or a combobox for the change frequency) over the cell, to edit its value in place
+	def editSiteMapCell(self, event) :
+		# finish any cell already being edited
+		self.finishSiteMapCellEdit()
 
-		# check if the new value is NOT a valid format
-		new_value = widget_ref.get().strip()
-		if (not self.validateSiteMapValue(self.sitemap_cols_nums[widget_col]["data"], new_value)) :
-			# the value is not valid
-			return(False)
+		# the data can't be changed while the site map items are being built
+		if (self.caller_object.taskRunning()) :
+			return
 
-		# update the site map data
-		self.caller_object.site_map_items[widget_row - 1][self.sitemap_cols_nums[widget_col]["data"]] = new_value
+		# find the row and column that were double clicked
+		if (self.sitemap_table.identify_region(event.x, event.y) != "cell") :
+			return
+		iid = self.sitemap_table.identify_row(event.y)
+		col_alias = self.sitemap_table.column(self.sitemap_table.identify_column(event.x), "id")
 
-		# check if a save to file is needed
-		self.caller_object.saveSiteMapData(True)
+		# only the lastmod, changefreq and priority columns are editable
+		if (iid == "" or col_alias not in ("lastmod", "changefreq", "priority")) :
+			return
 
-		# signal that the new value can be accepted
-		return(True)
-
-	# method called by tkinter when a site map task's data input widget looses focus (focusout)
-	# or a new value is being entered (key)
-	# this method will check if the new value is valid or not
-	def validateSiteMapInput(self, widget_name, validation_condition, new_value) :
-		# only interested in "key" and "focusout" validation conditions
-		if (validation_condition not in ("key", "focusout")) :
-			# it's a validation condition that doesn't need processing, so validate
-			return(True)
-
-		# get a reference to the widget that changed value
-		widget_ref = self.app_window.nametowidget(widget_name)
-		if (widget_ref == None) :
-			# something went wrong, so invalidate
-			return(False)
+		# create the widget used to edit the value
+		cur_value = self.caller_object.site_map_items[int(iid)][col_alias]
+		if (col_alias == "changefreq") :
+			widget_ref = ttk.Combobox(self.sitemap_table, state="readonly", values=self.changefreq_values_)
+			widget_ref.set(cur_value)
+			widget_ref.bind("<<ComboboxSelected>>", lambda event: self.finishSiteMapCellEdit())
+		else :
+			widget_ref = ttk.Entry(self.sitemap_table)
+			widget_ref.insert(0, cur_value)
+			widget_ref.select_range(0, "end")
+			widget_ref.bind("<FocusOut>", lambda event: self.finishSiteMapCellEdit())
+
+		widget_ref.bind("<Return>", lambda event: self.finishSiteMapCellEdit())
+		widget_ref.bind("<KP_Enter>", lambda event: self.finishSiteMapCellEdit())
+		widget_ref.bind("<Escape>", lambda event: self.finishSiteMapCellEdit(False))
+
+		# place the widget over the cell
+		cell_x, cell_y, cell_width, cell_height = self.sitemap_table.bbox(iid, col_alias)
+		widget_ref.place(x=cell_x, y=cell_y, width=cell_width, height=cell_height)
+		widget_ref.focus_set()
+
+		self.sitemap_cell_editor = {"widget" : widget_ref, "row" : int(iid), "col" : col_alias}
+
+	# finishes the edit of a site map table's cell, if there is one in progress
+	# if store is True and the new value is valid it will be stored, otherwise the value is left unchanged
+	def finishSiteMapCellEdit(self, store=True) :
+		if (self.sitemap_cell_editor == None) :
+			return
 
-		# get the widget's grid information
-		widget_grid_info = widget_ref.grid_info()
-		if (widget_grid_info == None or "row" not in widget_grid_info or "column" not in widget_grid_info) :
-			# something went wrong, so invalidate
-			return(False)
+		# grab the edit's information and remove the editing widget
+		# done before anything else, so a message box taking the focus doesn't finish the edit again
+		editor = self.sitemap_cell_editor
+		self.sitemap_cell_editor = None
+		new_value = editor["widget"].get().strip()
+		editor["widget"].destroy()
 
-		# store the widget's row and column in the grid
-		widget_row = widget_grid_info["row"]
-		widget_col = widget_grid_info["column"]
+		# if the value didn't change or isn't to be stored, nothing else needs to be done
+		if (not store or new_value == self.caller_object.site_map_items[editor["row"]][editor["col"]]) :
+			return
 
 		# check if the new value is NOT a valid format
-		new_value = new_value.strip()
-		if (not self.validateSiteMapValue(self.sitemap_cols_nums[widget_col]["data"], new_value)) :
-			# the value is not valid
-			# if the validation condition is "key", then don't call the invalidate method, because
-			# the user maight be inserting the value. When the value becomes valid it will be saved
-			# and when the user focusout a full validation will be made
-			if (validation_condition == "key") :
-				return(True)
-			else :
-				return(False)
+		if (not self.validateSiteMapValue(editor["col"], new_value)) :
+			# build the message, depending on which column was changed
+			message = "The value inserted for \"" + self.sitemap_cols_nums[self.sitemap_cols_alias[editor["col"]]]["ui"] + "\" for row " + str(editor["row"] + 1) + " is not valid.\n\n"
+			if (editor["col"] == "lastmod") :
+				message += "Either leave the field empty or insert a date in the format: YYYY-MM-DD"
+			elif (editor["col"] == "changefreq") :
+				message += "Either leave the field empty or insert a value from the provided list"
+			elif (editor["col"] == "priority") :
+				message += "Either leave the field empty or insert a decimal number between 0.0 and 1.0\n\nMake sure to use a period (.) as the decimal point indicator"
+
+			# create a msgbox to inform the user that the value inserted is not valid
+			# and give info on valid values
+			self.showErrorMsgBox(title="Invalid Value", message=message)
+			return
 
-		# update the site map data
-		self.caller_object.site_map_items[widget_row - 1][self.sitemap_cols_nums[widget_col]["data"]] = new_value
+		# update the site map data and the table's cell, with the value as it was stored
+		item = self.caller_object.site_map_items[editor["row"]]
+		item[editor["col"]] = new_value
+		self.sitemap_table.set(str(editor["row"]), editor["col"], item[editor["col"]])
 
 		# check if a save to file is needed
 		self.caller_object.saveSiteMapData(True)
 
-		# signal that the new value can be accepted
-		return(True)
-
-	# method called by tkinter when a site map task's data input widgets fails it's data validation
-	def invalidSiteMapUserInput(self, widget_name) :
-		# get a reference to the widget that changed value
-		widget_ref = self.app_window.nametowidget(widget_name)
-		if (widget_ref == None) :
-			# something went wrong, so bail out
-			# return the expected value
-			return(0)
-
-		# get the widget's grid information
-		widget_grid_info = widget_ref.grid_info()
-		if (widget_grid_info == None or "row" not in widget_grid_info or "column" not in widget_grid_info) :
-			# something went wrong, so bail out
-			# return the expected value
-			return(0)
-
-		widget_row = widget_grid_info["row"]
-		widget_col = widget_grid_info["column"]
-
-		# build the message, depending on which column was changed
-		message = "The value inserted for \"" + self.sitemap_cols_nums[widget_col]["ui"] + "\" for row " + str(widget_row) + " is not valid.\n\n"
-		if (self.sitemap_cols_nums[widget_col]["data"] == "lastmod") :
-			message += "Either leave the field empty or insert a date in the format: YYYY-MM-DD"
-		elif (self.sitemap_cols_nums[widget_col]["data"] == "changefreq") :
-			message += "Either leave the field empty or insert a value from the provided list"
-		elif (self.sitemap_cols_nums[widget_col]["data"] == "priority") :
-			message += "Either leave the field empty or insert a decimal number between 0.0 and 1.0\n\nMake sure to use a period (.) as the decimal point indicator"
-
-		# create a msgbox to inform the user that the value inserted is not valid
-		# and give info on valid values
-		self.showErrorMsgBox(title="Invalid Value", message=message)
-
-		# change the widget's value to the last accepted value
-		widget_ref.delete(0, "end")
-		widget_ref.insert(0, self.caller_object.site_map_items[widget_row - 1][self.sitemap_cols_nums[widget_col]["data"]])
-
-		# return the expected value
-		return(0)
-
 	# this method will update the site map task's table headers with the correct arrows
 	# for the current sorting info
 	def updateSortArrows(self) :
@@ -1233,19 +1174,10 @@ class GUI :
 		up_arrow = "↑"
 		down_arrow = "↓"
 
-		# loop through all the header columns and add/remove arrows as needed
-		for header_col_index in range(0, len(self.sitemap_label_header)) :
-			# if this header column is None, then it doesn't support sorting, so skip
-			if (self.sitemap_label_header[header_col_index] == None) :
-				continue
-
-			# grab a copy of the current widget's text for this header
-			label_text = self.sitemap_label_header[header_col_index].cget("text")
-
-			# remove any arrows from this header
-			label_text = label_text.replace(up_arrow, "")
-			label_text = label_text.replace(down_arrow, "")
-			label_text = label_text.strip()
+		# loop through all the sortable header columns and add/remove arrows as needed
+		for header_col_index in range(1, 5) :
+			# start with the column's text, with no arrows
+			label_text = self.sitemap_cols_nums[header_col_index]["ui"]
 
 			# loop through the sorting cols, from primary to secondary, and if this header is in use
 			# for sorting, add the corresponding arrow
@@ -1273,8 +1205,8 @@ class GUI :
 				if (sorting_cols_len > 1) :
 					label_text += str(sort_col_index + 1)
 
-				# update the widget's text
-				self.sitemap_label_header[header_col_index].configure(text=label_text)
+			# update the header's text
+			self.sitemap_table.heading(self.sitemap_cols_nums[header_col_index]["data"], text=label_text)
 
 	# update the GUI after a project is opened (either when creating a new project or opening an existing one)
 	def projectOpened(self, root_domain, crawled) :
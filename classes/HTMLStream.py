@@ -0,0 +1,109 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import re, codecs, hashlib
+
+class HTMLStream :
+	"""This class decodes and parses a webpage's body as it's downloaded, 1 chunk at a time.
+	The charset comes from the Content-Type header or, if the header doesn't have one, from a byte order mark or a <meta> tag
+	in the first SNIFF_BYTES_ bytes of the body, defaulting to utf-8.
+
+	The decoded text is fed to a link extractor (a ParserHTML or LinkExtractor instance) and each call to feed() returns the links
+	found in that chunk, so they can be queued before the body is fully downloaded."""
+
+	# class constant with the # of bytes of the body buffered to look for a <meta> tag with the charset
+	SNIFF_BYTES_ = 1024
+	# class constant with the regex matching the charset in a <meta charset> or <meta http-equiv="Content-Type"> tag
+	META_CHARSET_RE_ = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([a-z0-9_.:-]+)', re.IGNORECASE)
+
+	def __init__(self, extractor, headers) :
+		# instance variable with the link extractor collecting the links
+		self.parser = extractor
+
+		# instance variable with the charset in the Content-Type header (None if there isn't one)
+		self.header_charset = headers.get_content_charset()
+
+		# instance variable with the incremental decoder, created once the charset is known
+		self.decoder = None
+		# instance variable with the bytes received before the charset is known
+		self.buffer = b""
+
+		# instance variable with the # of bytes received
+		self.size = 0
+		# instance variable with the hash of the bytes received
+		self.hash = hashlib.sha1()
+
+	# decodes and parses a chunk of the body
+	# returns a set with the links found since the last call
+	def feed(self, data) :
+		self.size += len(data)
+		self.hash.update(data)
+
+		if (self.decoder == None) :
+			self.buffer += data
+
+			# wait for enough bytes to look for the charset, unless the header has it
+			if (self.header_charset == None and len(self.buffer) < self.SNIFF_BYTES_) :
+				return(set())
+
+			self.createDecoder()
+			data = self.buffer
+			self.buffer = b""
+
+		self.parser.feed(self.decoder.decode(data))
+
+		return(self.parser.flushCollected())
+
+	# decodes and parses any bytes still buffered, at the end of the body
+	# returns a set with the links found since the last call to feed()
+	def close(self) :
+		if (self.decoder == None) :
+			self.createDecoder()
+			data = self.buffer
+			self.buffer = b""
+		else :
+			data = b""
+
+		self.parser.feed(self.decoder.decode(data, True))
+		self.parser.close()
+
+		return(self.parser.flushCollected())
+
+	# returns a set with all the links found
+	def links(self) :
+		return(self.parser.collected_attrs)
+
+	# returns the hash of the body, as a hex string
+	def contentHash(self) :
+		return(self.hash.hexdigest())
+
+	# finds the charset and creates the incremental decoder
+	# any bytes that can't be decoded are replaced, so they don't stop the links from being found
+	def createDecoder(self) :
+		charset = self.header_charset
+
+		if (charset == None) :
+			if (self.buffer.startswith(codecs.BOM_UTF8)) :
+				charset = "utf-8-sig"
+			else :
+				match = self.META_CHARSET_RE_.search(self.buffer)
+				if (match != None) :
+					charset = match.group(1).decode("ascii")
+
+		# make sure python knows the charset
+		try :
+			codecs.lookup(charset)
+		except (LookupError, TypeError) :
+			charset = "utf-8"
+
+		self.decoder = codecs.getincrementaldecoder(charset)(errors="replace")
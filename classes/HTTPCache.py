@@ -0,0 +1,173 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import os, json, time, threading, email.utils
+
+class HTTPCache :
+	"""This class defines a per project store of the HTTP validators (ETag and Last-Modified) and the links of each crawled URL.
+	When the project is crawled again, the validators are sent in conditional requests and, if the server replies that
+	the page hasn't changed (304 Not Modified), the stored links are used instead of downloading and parsing the page.
+
+	It also stores the date each page was last modified, used as the site map's lastmod. That's the date in the
+	Last-Modified header or, if the server doesn't send it, the date the crawler first saw the page's current content.
+
+	The file has 1 JSON object per line and new entries are appended to it as the crawlers work, so when a URL has
+	several lines the last one is used. The file is rewritten without the outdated lines when it's opened.
+	The links are only kept in the file: the entries in memory have the position of their line, which is read
+	when the links are needed (ex: after a 304 Not Modified reply)."""
+
+	def __init__(self, path) :
+		# instance variable with the path to the cache file
+		self.path = path
+
+		# instance variable with the entries, in the form {url : {"etag" : str, "last_modified" : str, "hash" : hash of the page's content,
+		# "lastmod" : YYYY-MM-DD, "offset" : position of the entry's line in the file}}
+		self.entries = {}
+
+		# instance variable with the # of lines in the file
+		self.num_lines = 0
+
+		# instance variables with the file objects used to append to the file and to read the links from it, while the cache is open
+		self.file = None
+		self.reader = None
+
+		# instance variable with the lock used to access the entries and the file
+		self.lock = threading.Lock()
+
+	# loads the entries from the file, if it exists
+	def load(self) :
+		with self.lock :
+			self.entries.clear()
+			self.num_lines = 0
+
+			if (not os.path.isfile(self.path)) :
+				return
+
+			with open(self.path, "rb") as f :
+				offset = 0
+				for line in f :
+					try :
+						entry = json.loads(line)
+					except ValueError :
+						# a line left incomplete by an interrupted crawl, so ignore it
+						offset += len(line)
+						continue
+
+					self.entries[entry["url"]] = self.memoryEntry(entry, offset)
+					self.num_lines += 1
+					offset += len(line)
+
+	# opens the cache for appending, rewriting the file first if it has outdated lines
+	def open(self) :
+		with self.lock :
+			if (self.num_lines > len(self.entries)) :
+				# copy the current line of each entry, which are read in the order they are in the file
+				with open(self.path, "rb") as old_file, open(self.path + ".tmp", "wb") as f :
+					for entry in sorted(self.entries.values(), key=lambda entry : entry["offset"]) :
+						old_file.seek(entry["offset"])
+						entry["offset"] = f.tell()
+						f.write(old_file.readline())
+				os.replace(self.path + ".tmp", self.path)
+				self.num_lines = len(self.entries)
+
+			self.file = open(self.path, "ab")
+			self.reader = open(self.path, "rb")
+
+	# closes the cache, writing any buffered lines to the file
+	def close(self) :
+		with self.lock :
+			if (self.file != None) :
+				self.file.close()
+				self.file = None
+				self.reader.close()
+				self.reader = None
+
+	# writes the buffered lines to the file
+	def flush(self) :
+		with self.lock :
+			if (self.file != None) :
+				self.file.flush()
+
+	# returns the entry for a URL, or None if there isn't one
+	def get(self, url) :
+		with self.lock :
+			return(self.entries.get(url))
+
+	# returns a dictionary with the headers that make the request for a URL conditional, based on its entry
+	def conditionalHeaders(self, entry) :
+		headers = {}
+
+		if (entry == None) :
+			return(headers)
+
+		if (entry["etag"] != None) :
+			headers["If-None-Match"] = entry["etag"]
+		if (entry["last_modified"] != None) :
+			headers["If-Modified-Since"] = entry["last_modified"]
+
+		return(headers)
+
+	# returns a list with the links stored in an entry
+	# NOTE: they are read from the file, so the cache must be open
+	def links(self, entry) :
+		with self.lock :
+			# make sure the entry's line isn't still buffered
+			self.file.flush()
+
+			self.reader.seek(entry["offset"])
+			line = self.reader.readline()
+
+		try :
+			return(json.loads(line)["links"])
+		except (ValueError, KeyError) :
+			return([])
+
+	# returns the date (YYYY-MM-DD) a URL was last modified, or None if it's not known
+	def lastModifiedDate(self, url) :
+		entry = self.get(url)
+		if (entry == None) :
+			return(None)
+
+		return(entry.get("lastmod"))
+
+	# stores the validators, links and content's hash of a crawled URL
+	def put(self, url, etag, last_modified, links, content_hash) :
+		entry = {"url" : url, "etag" : etag, "last_modified" : last_modified, "links" : sorted(links), "hash" : content_hash, "lastmod" : None}
+
+		with self.lock :
+			# find the date the page was last modified
+			previous_entry = self.entries.get(url)
+			if (last_modified != None) :
+				try :
+					entry["lastmod"] = email.utils.parsedate_to_datetime(last_modified).strftime("%Y-%m-%d")
+				except (TypeError, ValueError) :
+					pass
+			if (entry["lastmod"] == None) :
+				if (previous_entry != None and previous_entry.get("hash") == content_hash and previous_entry.get("lastmod") != None) :
+					# the content is the same as in the last crawl, so it wasn't modified since
+					entry["lastmod"] = previous_entry["lastmod"]
+				else :
+					entry["lastmod"] = time.strftime("%Y-%m-%d")
+
+			offset = None
+			if (self.file != None) :
+				offset = self.file.tell()
+				self.file.write((json.dumps(entry) + "\n").encode("utf-8"))
+				self.num_lines += 1
+
+			self.entries[url] = self.memoryEntry(entry, offset)
+
+	# returns the form an entry is kept in memory: without the URL, which is its key, and the links, which are read from the file
+	# offset is the position of the entry's line in the file
+	def memoryEntry(self, entry, offset) :
+		return({"etag" : entry["etag"], "last_modified" : entry["last_modified"], "hash" : entry.get("hash"), "lastmod" : entry.get("lastmod"), "offset" : offset})
@@ -0,0 +1,230 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import threading, time, email.utils, urllib.parse
+
+class HostScheduler :
+	"""This class spaces the requests sent to each host, so the crawlers never exceed a max request rate per host.
+	Before each request a crawler reserves the host's next time slot and waits until then. The slots are spaced by the
+	host's delay, which starts at the larger of 1/max_rate and the Crawl-delay (or Request-rate) in the host's robots.txt.
+
+	The delay adapts to how the host is coping: it's doubled on 429 and 503 replies (also honoring any Retry-After header)
+	and, if there is a max rate, when the host's response time rises well above its usual value, and it slowly recovers
+	to the initial delay while the host replies normally.
+	Backing off cancels the slots already reserved, so the crawlers waiting for them reserve a new slot, spaced by the new delay.
+
+	The rules in the host's robots.txt for our robot name are also kept, so the crawlers can skip the URLs they don't allow.
+	They are read again once the robots.txt expires in the project's cache (ex: a few minutes after it failed with server errors)."""
+
+	# class constants with the max delay, in seconds, between requests to a host and the lowest delay used when backing off
+	MAX_DELAY_ = 60
+	BACKOFF_MIN_DELAY_ = 0.5
+	# class constants with the factors the delay is multiplied by when backing off and when recovering
+	BACKOFF_FACTOR_ = 2
+	RECOVERY_FACTOR_ = 0.8
+	# class constant with the weight of each new response time in the host's average response time
+	LATENCY_WEIGHT_ = 0.2
+	# class constants with how many times, and #seconds, the average response time must be above the usual value to back off
+	LATENCY_SLOWDOWN_ = 3
+	LATENCY_MIN_INCREASE_ = 0.1
+	# class constant with the HTTP status codes that mean the host is overloaded
+	OVERLOADED_STATUSES_ = (429, 503)
+	# class constant with the max # of times a URL is retried after the host replied it's overloaded
+	MAX_RETRIES_ = 3
+	# class constant with the min #seconds the rules in a host's robots.txt are used before it's read again
+	# NOTE: it applies to the robots.txt files that aren't kept in the project's cache (ex: after a network error)
+	ROBOTS_MIN_AGE_ = 300
+
+	def __init__(self, max_rate, robots_cache, robots_name) :
+		# instance variable with the min delay between requests to a host (0 = no limit)
+		if (max_rate > 0) :
+			self.min_delay = 1 / max_rate
+		else :
+			self.min_delay = 0
+
+		# instance variable flagging if the delay is increased when a host's response time rises
+		# NOTE: without a max rate, only the replies saying the host is overloaded slow down the requests
+		self.adapt_to_latency = max_rate > 0
+
+		# instance variables with the project's cache of robots.txt files (a loaded RobotsCache instance)
+		# and the name used to find the rules that apply to us
+		self.robots_cache = robots_cache
+		self.robots_name = robots_name
+
+		# instance variable with the state of each host, in the form {host : {"min_delay" : float, "delay" : float,
+		# "next" : monotonic time of the next free slot, "epoch" : # of times the reserved slots were cancelled,
+		# "latency" : average response time, "base_latency" : usual response time,
+		# "loading" : True while the robots.txt is being read, "robots" : RobotsRules instance,
+		# "robots_expires" : monotonic time the robots.txt must be read again}}
+		self.hosts = {}
+
+		# instance variable with the # of times each URL was retried
+		self.retries = {}
+
+		# instance variable with the lock used to access the hosts' state
+		self.lock = threading.Lock()
+
+	# reserves the next time slot for a request to the url's host
+	# once the caller has waited until its slot, it should call again passing the epoch returned, since the host
+	# may have backed off meanwhile, cancelling the slot
+	# returns a tuple (#seconds to wait until the slot, epoch of the slot), where the #seconds is 0 if the request
+	# can be sent now, or None if the host's robots.txt is still being read and no slot was reserved,
+	# in which case the caller should call again a moment later
+	def reserve(self, url, epoch=None) :
+		with self.lock :
+			state = self.hostState(url)
+			if (state["loading"]) :
+				return(None)
+
+			# the slot the caller waited for is still valid
+			if (epoch == state["epoch"]) :
+				return((0, epoch))
+
+			now = time.monotonic()
+			slot = max(now, state["next"])
+			state["next"] = slot + state["delay"]
+
+			return((slot - now, state["epoch"]))
+
+	# checks if the rules in the robots.txt of the url's host allow us to request it
+	# returns True if they do (or there's no robots.txt), False if they don't, or None if the host's robots.txt
+	# is still being read, in which case the caller should call again a moment later
+	def canFetch(self, url) :
+		with self.lock :
+			state = self.hostState(url)
+			if (state["loading"]) :
+				return(None)
+
+			# the host's robots.txt has expired, so read it again
+			if (time.monotonic() >= state["robots_expires"]) :
+				self.startReadingRobots(url, state)
+				return(None)
+
+			robots_rules = state["robots"]
+
+		return(robots_rules == None or robots_rules.canFetch(url))
+
+	# returns the state of the url's host
+	# if this is the 1st request to this host, starts reading its robots.txt, which is done before any requests are sent
+	# NOTE: must be called holding the lock
+	def hostState(self, url) :
+		host = self.hostKey(url)
+
+		state = self.hosts.get(host)
+		if (state == None) :
+			state = {"min_delay" : self.min_delay, "delay" : self.min_delay, "next" : 0, "epoch" : 0, "latency" : None, "base_latency" : None, "loading" : True, "robots" : None, "robots_expires" : 0}
+			self.hosts[host] = state
+			self.startReadingRobots(url, state)
+
+		return(state)
+
+	# starts reading the robots.txt of the url's host in a new thread, while no requests are sent to it
+	# NOTE: must be called holding the lock
+	def startReadingRobots(self, url, state) :
+		state["loading"] = True
+		threading.Thread(target=self.readRobots, args=(url, state), daemon=True).start()
+
+	# reads the robots.txt of the url's host, keeping its rules for our robot name
+	# and, if it has a Crawl-delay or Request-rate for us, uses it as the host's min delay
+	# NOTE: the robots.txt is only requested if it isn't in the project's cache
+	def readRobots(self, url, state) :
+		min_delay = self.min_delay
+
+		robots_rules = self.robots_cache.getRules(url, self.robots_name)
+		robots_expires = time.monotonic() + max(self.robots_cache.expiresIn(url), self.ROBOTS_MIN_AGE_)
+		robots_delay = robots_rules.minDelay()
+		if (robots_delay != None) :
+			min_delay = max(min_delay, robots_delay)
+
+		with self.lock :
+			state["min_delay"] = min_delay
+			state["delay"] = max(state["delay"], min_delay)
+			state["robots"] = robots_rules
+			state["robots_expires"] = robots_expires
+			state["loading"] = False
+
+	# adapts the delay of the url's host to the reply of a request
+	# status is the reply's HTTP status code, latency the #seconds until the reply was received
+	# and retry_after the value of the reply's Retry-After header, if any
+	def update(self, url, status, latency, retry_after=None) :
+		host = self.hostKey(url)
+
+		with self.lock :
+			state = self.hosts.get(host)
+			if (state == None) :
+				return
+
+			if (status in self.OVERLOADED_STATUSES_) :
+				# the host is overloaded, so back off
+				self.backOff(state)
+
+				# if the host said when to try again, don't send any requests before then
+				retry_seconds = self.parseRetryAfter(retry_after)
+				if (retry_seconds != None) :
+					state["next"] = max(state["next"], time.monotonic() + min(retry_seconds, max(self.MAX_DELAY_, state["min_delay"])))
+				return
+
+			if (not self.adapt_to_latency) :
+				return
+
+			# update the host's average response time and its usual (lowest average) response time
+			if (state["latency"] == None) :
+				state["latency"] = latency
+			else :
+				state["latency"] += self.LATENCY_WEIGHT_ * (latency - state["latency"])
+			if (state["base_latency"] == None or state["latency"] < state["base_latency"]) :
+				state["base_latency"] = state["latency"]
+
+			if (state["latency"] > state["base_latency"] * self.LATENCY_SLOWDOWN_ and state["latency"] - state["base_latency"] > self.LATENCY_MIN_INCREASE_) :
+				# the host is getting slower, so back off
+				self.backOff(state)
+			else :
+				# the host is healthy, so move the delay back towards its min delay
+				state["delay"] = max(state["min_delay"], state["delay"] * self.RECOVERY_FACTOR_)
+
+	# increases a host's delay, up to the max delay (or the host's min delay, if larger)
+	# and cancels the slots already reserved, so the next request is sent 1 delay from now
+	def backOff(self, state) :
+		state["delay"] = min(max(state["delay"] * self.BACKOFF_FACTOR_, self.BACKOFF_MIN_DELAY_), max(self.MAX_DELAY_, state["min_delay"]))
+		state["next"] = time.monotonic() + state["delay"]
+		state["epoch"] += 1
+
+	# registers a new attempt for a URL that failed because its host was overloaded
+	# returns True if the URL can be retried, False if it reached the max # of retries
+	def retry(self, url) :
+		with self.lock :
+			num_retries = self.retries.get(url, 0)
+			if (num_retries >= self.MAX_RETRIES_) :
+				return(False)
+
+			self.retries[url] = num_retries + 1
+			return(True)
+
+	# returns the #seconds in a Retry-After header (in seconds or as a date), or None if it's not set or not valid
+	def parseRetryAfter(self, retry_after) :
+		if (retry_after == None) :
+			return(None)
+
+		try :
+			return(max(0, float(retry_after)))
+		except ValueError :
+			pass
+
+		try :
+			return(max(0, email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()))
+		except (TypeError, ValueError) :
+			return(None)
+
+	# returns the key identifying the url's host
+	def hostKey(self, url) :
+		return(urllib.parse.urlsplit(url).netloc.lower())
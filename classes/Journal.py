@@ -0,0 +1,133 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import os, shutil, threading
+
+class Journal :
+	"""This class defines an append-only log of the state transitions of a crawl's URLs.
+	Each line has a state code followed by a space and the URL, and the lines are appended as the crawlers work,
+	so saving the crawl's state only needs to flush the file instead of rewriting all the URL files.
+
+	Replaying the journal on top of the URL files rebuilds the state of the crawl. Every transition is idempotent,
+	so the journal can be replayed over files that already include some of its lines.
+
+	While the URL files are rewritten, the lines appended before are kept in a rotated file (the journal's path + ".old"),
+	which is replayed before the journal and only deleted once all the files have been written."""
+
+	# class constants with the state codes
+	DISCOVERED_ = "D"
+	CRAWLED_ = "C"
+	FAILED_ = "F"
+	EXTERNAL_ = "E"
+
+	def __init__(self, path) :
+		# instance variables with the paths to the journal file and to the rotated journal file
+		self.path = path
+		self.rotated_path = path + ".old"
+
+		# instance variable with the file object, while the journal is open for appending
+		self.file = None
+
+		# instance variable with the # of lines appended since the journal was last truncated
+		self.num_entries = 0
+
+		# instance variable with the lock used to write to the file
+		self.lock = threading.Lock()
+
+	# opens the journal for appending
+	def open(self) :
+		with self.lock :
+			self.file = open(self.path, "a", encoding="utf-8")
+
+	# closes the journal, writing any buffered lines to the file
+	def close(self) :
+		with self.lock :
+			if (self.file != None) :
+				self.file.close()
+				self.file = None
+
+	# appends a line for each URL with the state code passed
+	def append(self, code, urls) :
+		with self.lock :
+			for url in urls :
+				self.file.write(code + " " + url + "\n")
+
+			self.num_entries += len(urls)
+
+	# writes any buffered lines to the file
+	def flush(self) :
+		with self.lock :
+			self.file.flush()
+
+	# moves the journal's lines to the rotated journal file and starts an empty journal
+	# should be called when the state of the crawl, to be written to the URL files, is taken
+	def rotate(self) :
+		with self.lock :
+			self.file.close()
+
+			if (os.path.isfile(self.rotated_path)) :
+				# the URL files weren't all written after the last rotation, so its lines are still needed
+				with open(self.rotated_path, "a", encoding="utf-8") as rotated_file, open(self.path, "r", encoding="utf-8") as f :
+					shutil.copyfileobj(f, rotated_file)
+			else :
+				os.replace(self.path, self.rotated_path)
+
+			self.file = open(self.path, "w", encoding="utf-8")
+			self.num_entries = 0
+
+	# deletes the rotated journal file
+	# should be called once the URL files have been rewritten with the state taken when the journal was rotated
+	def removeRotated(self) :
+		with self.lock :
+			if (os.path.isfile(self.rotated_path)) :
+				os.remove(self.rotated_path)
+
+	# applies the transitions in the rotated journal and in the journal to the passed URL sets
+	def replay(self, known_urls, crawled_urls, url_queue, external_urls, failed_urls) :
+		for path in (self.rotated_path, self.path) :
+			self.replayFile(path, known_urls, crawled_urls, url_queue, external_urls, failed_urls)
+
+	# applies the transitions in a journal file to the passed URL sets
+	def replayFile(self, path, known_urls, crawled_urls, url_queue, external_urls, failed_urls) :
+		# if there is no journal, there is nothing to replay
+		if (not os.path.isfile(path)) :
+			return
+
+		with open(path, "r", encoding="utf-8") as f :
+			# loop each line
+			for line in f :
+				# remove any new line characters returned
+				line = line.replace("\n", "")
+				# ignore empty or incomplete lines (ex: the last line, if the application was shutdown while writing it)
+				if (len(line) < 3 or line[1] != " ") :
+					continue
+
+				code = line[0]
+				url = line[2:]
+
+				if (code == self.DISCOVERED_) :
+					# a URL found for the 1st time is added to the queue
+					if (url not in known_urls) :
+						known_urls.add(url)
+						url_queue.add(url)
+				elif (code == self.CRAWLED_) :
+					known_urls.add(url)
+					crawled_urls.add(url)
+					url_queue.discard(url)
+				elif (code == self.FAILED_) :
+					known_urls.add(url)
+					failed_urls.add(url)
+					url_queue.discard(url)
+				elif (code == self.EXTERNAL_) :
+					external_urls.add(url)
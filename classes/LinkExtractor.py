@@ -0,0 +1,193 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import re, html
+from classes import ParserHTML
+
+class LinkExtractor :
+	"""This class is a faster alternative to ParserHTML that only collects the href of the <a> tags.
+	Instead of handling every tag, text and attribute, it uses compiled regexes to jump from one tag, comment or other markup
+	to the next, in the same way HTMLParser (used by ParserHTML) splits the HTML string, so what's in a quoted attribute value
+	or a comment is never taken for a tag. Only the attributes of <a>, <script> and <style> tags are looked at and the content
+	of the last 2 is skipped, since the links in them aren't parsed by ParserHTML either.
+
+	It has the same interface as ParserHTML (feed(), close(), flushCollected() and collected_attrs), so they are interchangeable.
+	The links are stored by a ParserHTML instance, which is also fed the rest of the HTML string if it's malformed
+	or has markup that is rarely used and parsed in several ways (ex: <![CDATA[ ... ]]>)."""
+
+	# class constant with the regex skipping the text and markup that have no links, up to the next part of the HTML string
+	# to look at: an <a>, <script> or <style> tag, a marked section or markup that is unfinished or malformed
+	# NOTE: it skips comments, end tags, declarations, processing instructions and the other start tags the same way HTMLParser does,
+	# and never backtracks into what it skipped, so the parts of the HTML string without links are skipped without running any Python code
+	# the start tags are 1st matched by a faster regex, only matching the usual tags (with names and values without quotes or =),
+	# whose end HTMLParser finds in the same place, and then by the same regex HTMLParser uses
+	SKIP_RE_ = re.compile(r"(?:[^<]++"
+		r"|<!--(?s:.*?)--\s*>"
+		r"|<(?:/|\?|!(?!--|\[))[^>]*+>"
+		r"|<(?![aA](?:[\t\n\r\f />\x00]|\Z)|(?i:script|style)(?:[\t\n\r\f />\x00]|\Z))"
+		r"(?:[a-zA-Z][^\s/>\"'=\x00]*+(?:\s++[^\s/>\"'=\x00]++(?:\s*+=\s*+(?:\"[^\"]*+\"|'[^']*+'|[^\s\"'>=`\x00]++))?+)*+\s*+/?>"
+		r"|(?>[a-zA-Z][^\t\n\r\f />\x00]*+(?:[\s/]*(?:(?<=['\"\s/])[^\s/>][^\s/=>]*(?:\s*=+\s*(?:'[^']*'|\"[^\"]*\"|(?!['\"])[^>\s]*)\s*)?(?:\s|/(?!>))*)*)?\s*)/?>)"
+		r"|<(?=[^a-zA-Z/!?])"
+		r")*+")
+	# class constant with the regex matching a start tag, up to where it ends, the same way HTMLParser does, with its name in group 1
+	# NOTE: a quote only starts a value after an =, so the text in a quoted value (ex: title="<a href=/x>") is skipped
+	START_TAG_RE_ = re.compile(r"<([a-zA-Z][^\t\n\r\f />\x00]*)(?:[\s/]*(?:(?<=['\"\s/])[^\s/>][^\s/=>]*(?:\s*=+\s*(?:'[^']*'|\"[^\"]*\"|(?!['\"])[^>\s]*)\s*)?(?:\s|/(?!>))*)*)?\s*")
+	# class constant with the regex matching a tag's name and the whitespace and / before its 1st attribute
+	TAG_NAME_RE_ = re.compile(r"[a-zA-Z][^\t\n\r\f />\x00]*(?:\s|/(?!>))*")
+	# class constant with the regex matching 1 attribute of a tag, the same way HTMLParser does,
+	# with the name in group 1 and, if it has a value, the = and the value in group 2 and the value (maybe quoted) in group 3
+	# NOTE: the attributes are matched in order, so the text in a quoted value is never taken for an attribute
+	ATTR_RE_ = re.compile(r"((?<=['\"\s/])[^\s/>][^\s/=>]*)(\s*=+\s*('[^']*'|\"[^\"]*\"|(?!['\"])[^>\s]*))?(?:\s|/(?!>))*")
+	# class constant with the chars after a start tag's attributes that mean it's unfinished (ex: <a href="/x at the end of a chunk)
+	UNFINISHED_TAG_CHARS_ = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ=/")
+	# class constant with the regex matching the end of a comment
+	COMMENT_END_RE_ = re.compile(r"--\s*>")
+	# class constant with the regexes matching the end of the elements whose content is skipped
+	END_RES_ = {"script" : re.compile(r"</\s*script\s*>", re.IGNORECASE), "style" : re.compile(r"</\s*style\s*>", re.IGNORECASE)}
+	# class constant with the max length of a start tag
+	# a longer unfinished tag is considered malformed and the rest of the HTML string is fed to ParserHTML
+	MAX_TAG_LENGTH_ = 16 * 1024
+
+	def __init__(self, base_url, canonicalizer=None) :
+		# instance variable with the parser storing the links, and parsing the HTML string if it's malformed
+		self.parser = ParserHTML.ParserHTML(base_url, {"a" : {"href" : True}}, canonicalizer)
+		self.collected_attrs = self.parser.collected_attrs
+
+		# instance variable with the end of the HTML string fed that couldn't be scanned yet (ex: an unfinished tag)
+		self.pending = ""
+		# instance variable flagging if the HTML string is malformed, in which case ParserHTML is used
+		self.use_parser = False
+
+	# scans a part of the HTML string for links
+	def feed(self, data) :
+		if (self.use_parser) :
+			self.parser.feed(data)
+			return
+
+		text = self.pending + data
+		self.pending = ""
+		pos = 0
+
+		while True :
+			start = self.SKIP_RE_.match(text, pos).end()
+			if (start == len(text)) :
+				break
+
+			# find the end of this part of the HTML string (-1 if it's unfinished)
+			tag_end = None
+			if (start == len(text) - 1) :
+				# a < at the end of the HTML string fed so far
+				end = -1
+			elif (text.startswith("<!--", start)) :
+				end_match = self.COMMENT_END_RE_.search(text, start + 4)
+				end = end_match.end() if end_match != None else -1
+			elif (text.startswith("<![", start)) :
+				# a marked section, so let ParserHTML deal with it
+				self.pending = text[start:]
+				self.useParser()
+				return
+			elif (text[start + 1] in "/!?") :
+				# end tags, declarations (ex: <!DOCTYPE html>) and processing instructions end at the next >
+				end = text.find(">", start + 2)
+				if (end != -1) :
+					end += 1
+			else :
+				tag_match = self.START_TAG_RE_.match(text, start)
+				tag_end = self.startTagEnd(text, tag_match.end())
+				if (tag_end == None) :
+					# a malformed tag, so let ParserHTML deal with it
+					self.pending = text[start:]
+					self.useParser()
+					return
+
+				end = tag_end
+				name = tag_match.group(1).lower()
+				if (tag_end != -1 and name in ("a", "script", "style")) :
+					# a tag with anything that isn't an attribute is treated as text by ParserHTML
+					hrefs = self.tagHrefs(text[start:tag_end])
+					if (hrefs != None and name == "a") :
+						self.parser.handle_starttag("a", hrefs)
+					elif (hrefs != None) :
+						end_match = self.END_RES_[name].search(text, tag_end)
+						end = end_match.end() if end_match != None else -1
+
+			# if it's unfinished, wait for the rest of the HTML string
+			if (end == -1) :
+				self.pending = text[start:]
+
+				# a start tag this long is malformed, so let ParserHTML deal with it
+				if (tag_end == -1 and len(self.pending) > self.MAX_TAG_LENGTH_) :
+					self.useParser()
+				return
+
+			pos = end
+
+	# scans the end of the HTML string
+	def close(self) :
+		# anything still unfinished is malformed, so let ParserHTML deal with it
+		if (self.pending != "") :
+			self.useParser()
+
+		self.parser.close()
+
+	# returns a set with the links stored since the last call to this method
+	def flushCollected(self) :
+		return(self.parser.flushCollected())
+
+	# returns where a start tag ends, with the position where its attributes end, the same way HTMLParser does
+	# returns -1 if it's unfinished or None if it's malformed (ParserHTML treats it as text)
+	# NOTE: a tag that stays unfinished is malformed too, but ParserHTML only gives up on it at the end of the HTML string,
+	# so it's waited for until MAX_TAG_LENGTH_ or close()
+	def startTagEnd(self, text, attrs_end) :
+		next_char = text[attrs_end:attrs_end + 1]
+		if (next_char == ">") :
+			return(attrs_end + 1)
+		if (text.startswith("/>", attrs_end)) :
+			return(attrs_end + 2)
+		if (next_char == "" or next_char in self.UNFINISHED_TAG_CHARS_) :
+			return(-1)
+
+		return(None)
+
+	# returns the href attributes of a start tag (the whole tag, from < to >), in the form [("href", value), ...],
+	# with the same values ParserHTML gets (unquoted and unescaped), or None if the tag has anything that isn't an attribute,
+	# in which case ParserHTML treats it as text
+	# NOTE: the attributes without a value (ex: <a href>) are left out, since ParserHTML ignores them
+	def tagHrefs(self, tag) :
+		hrefs = []
+
+		pos = self.TAG_NAME_RE_.match(tag, 1).end()
+		while (pos < len(tag)) :
+			match = self.ATTR_RE_.match(tag, pos)
+			if (match == None) :
+				break
+			pos = match.end()
+
+			if (match.group(2) == None or match.group(1).lower() != "href") :
+				continue
+
+			value = match.group(3)
+			if (value[:1] in ("'", '"') and value[:1] == value[-1:]) :
+				value = value[1:-1]
+			hrefs.append(("href", html.unescape(value)))
+
+		if (tag[pos:].strip() not in (">", "/>")) :
+			return(None)
+
+		return(hrefs)
+
+	# switches to ParserHTML for the rest of the HTML string, starting with what couldn't be scanned
+	def useParser(self) :
+		self.use_parser = True
+		self.parser.feed(self.pending)
+		self.pending = ""
@@ -11,105 +11,47 @@
 # 															 #
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-import threading, time, urllib.robotparser
+from classes import SiteMapItems
 
-class MapGenerator(threading.Thread) :
-	"""This class will build a site map for a given web domain, that has been crawled.
+class MapGenerator :
+	"""This class will build the site map items for a given web domain, that has been crawled, in 1 pass over its URLs.
 	Any rules set for that domain in it's robots.txt file will be followed."""
 
-	# class variable used to force all instances to terminate
-	terminate_thread_ = False
+	def __init__(self, root_url, local_time, robots_cache, http_cache=None) :
+		# instance variable with the root URL for the website
+		self.root_url = root_url
 
-	# class variables referencing a queue and its lock
-	queue_ = None
-	queue_lock_ = None
+		# instance variable with the local system's time to be used as the lastmod value of URLs without a known modification date
+		self.local_time = local_time
 
-	# class variable with the root URL for the website we're crawling
-	root_url_ = ""
+		# instance variable with the project's cache of robots.txt files (a loaded RobotsCache instance)
+		self.robots_cache = robots_cache
 
-	# class variable with the robots.txt parser
-	robots_parser_ = None
+		# instance variable with the project's HTTP cache (a loaded HTTPCache instance), with the date each URL was last modified
+		self.http_cache = http_cache
 
-	# class variable with the local system's time to be used as the lastmod value
-	local_time_ = ""
+		# instance variable with the robots.txt rules that apply to all robots (None = all URLs are allowed)
+		self.robots_rules = None
 
-	# class variable used to store the final items
-	site_map_items_ = None
-
-	def __init__(self, use_robots) :
-		# call the threading.Thread __init__ method, and make sure all threads are daemon=True
-		# this insures all threads will terminate if the application is shutdown...even thought data can be corrupted.
-		super().__init__(daemon=True)
-
-		# set the instance variable to control the use or not of the robots.txt file
-		self.use_robots = bool(use_robots)
-
-		# if we haven't set the robots.txt parse, do so
-		if (self.use_robots and self.robots_parser_ == None) :
-			self.parseRobots()
-
-	# main method of a thread, defining what the thread should do
-	# will continue running until self.terminate_thread_ is True
-	def run(self) :
-		# if the class variables aren't set, terminate thread
-		if (self.queue_ == None or self.queue_lock_ == None or self.root_url_ == "" or (self.use_robots and self.robots_parser_ == None) or self.local_time_ == "" or self.site_map_items_ == None) :
-			print("MapGenerator: At least 1 class variable not set!")
-			return
-
-		# loop until the terminate flag is set to True
-		while not self.terminate_thread_ :
-			# get the lock for the queue
-			self.queue_lock_.acquire()
-
-			if (len(self.queue_) > 0) :
-				# get the next URL from the queue
-				cur_url = self.queue_.pop()
-				# release the lock for the queue
-				self.queue_lock_.release()
-
-				# check if this URL passes the robots.txt rules
-				if (self.canAccessURL(cur_url)) :
-					# build the site map item
-					item = self.buildSiteMapItem(cur_url)
-
-					# get the lock for the queue
-					self.queue_lock_.acquire()
-
-					# add the item to the storing variable
-					self.site_map_items_.append(item)
-
-					# release the lock for the queue
-					self.queue_lock_.release()
-			else :
-				# release the lock for the queue
-				self.queue_lock_.release()
-				# wait 1 second
-				time.sleep(1)
-
-		print("thread terminating: " + str(threading.get_ident()))
-
-	# find and read the robots.txt file on the server
+	# get the rules for all robots in the robots.txt file of the server
+	# NOTE: the file is only requested if it isn't in the project's cache
 	def parseRobots(self) :
-		self.robots_parser_ = urllib.robotparser.RobotFileParser(self.root_url_ + "/robots.txt")
-		self.robots_parser_.read()
+		self.robots_rules = self.robots_cache.getRules(self.root_url, "*")
 
 	# checks if the passed URL should be indexed by SEO, based on the server's robots.txt file
 	# returns True if the URL is to be indexed, False otherwise
 	def canAccessURL(self, url) :
 		# if the robots.txt is empty, doesn't exist
 		# or we don't want to use the robots.txt file (==None), allow all URLs
-		if (self.robots_parser_ == None) :
+		if (self.robots_rules == None) :
 			return(True)
 
-		return(self.robots_parser_.can_fetch("*", url))
-
-	# adds a url to the site map with all necessary data for it
-	def buildSiteMapItem(self, url) :
-		# calculate how many levels deep this URL is
-		levels_deep = url[len(self.root_url_):].count("/")
+		return(self.robots_rules.canFetch(url))
 
-		# calculate a default priority for this URL, based on the level of depth compared to the home page
-		# he home page gets 0.8 priority
+	# calculates a default priority for a URL, based on the level of depth compared to the home page
+	# returns the priority as a string
+	@staticmethod
+	def priority(levels_deep) :
 		if (levels_deep == 0) :
 			# it's the home page
 			priority = 0.9
@@ -119,7 +61,44 @@ class MapGenerator(threading.Thread) :
 		else :
 			priority = 1 / levels_deep
 
-		# build the site map's item
-		item = {"url" : url, "lastmod" : self.local_time_, "changefreq" : "monthly", "priority" : str(round(priority, 1))}
+		return(str(round(priority, 1)))
+
+	# builds the site map items, with all necessary data, for the passed URLs that the robots.txt rules allow
+	# if use_robots is True, the robots.txt file is read from the server first
+	# returns a SiteMapItems with the items, in the same order as the URLs
+	def buildSiteMapItems(self, urls, use_robots) :
+		if (use_robots) :
+			self.parseRobots()
+
+		# local variable with the priorities already calculated, in the form {levels deep : priority}
+		# NOTE: most URLs are only a few levels deep, so the priorities are only calculated once per level
+		priorities = {}
+
+		root_length = len(self.root_url)
+		items = SiteMapItems.SiteMapItems()
+
+		for url in urls :
+			# check if this URL passes the robots.txt rules
+			if (not self.canAccessURL(url)) :
+				continue
+
+			# calculate how many levels deep this URL is
+			# NOTE: a trailing / doesn't add a level (ex: the home page's canonical URL ends with /)
+			levels_deep = url[root_length:].rstrip("/").count("/")
+
+			priority = priorities.get(levels_deep)
+			if (priority == None) :
+				priority = self.priority(levels_deep)
+				priorities[levels_deep] = priority
+
+			# use the date the URL was last modified, recorded while crawling, as lastmod
+			lastmod = None
+			if (self.http_cache != None) :
+				lastmod = self.http_cache.lastModifiedDate(url)
+			if (lastmod == None) :
+				lastmod = self.local_time
+
+			# build the site map's item
+			items.append(url, lastmod, "monthly", priority)
 
-		return(item)
+		return(items)
@@ -12,22 +12,29 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 from html.parser import HTMLParser
+from classes import URLCanonicalizer
 
 class ParserHTML(HTMLParser) :
 	"""This class inherits HTMLParser (default python class).
 	It receives a tuple of HTML tags to watch and will store all the attributes in those tags.
 	It can be passed an HTML string using he feed() method.
 
-	The stored attributes will be in the public list collected_attrs."""
+	The attributes that are URLs are resolved against the webpage's URL (base_url) and stored in their canonical form,
+	using the URLCanonicalizer passed (or 1 with the default rules).
+
+	The stored attributes will be in the public set collected_attrs.
+	When the HTML string is fed in several parts, flushCollected() returns the attributes stored since its last call."""
 
 	# sets the instance varible with the tags to look for
-	def __init__(self, root_url, tags) :
+	def __init__(self, base_url, tags, canonicalizer=None) :
 		super().__init__()
 
 		# instance variables
-		self.root_url = root_url
+		self.base_url = base_url
+		self.canonicalizer = canonicalizer if canonicalizer != None else URLCanonicalizer.URLCanonicalizer()
 		self.relevant_data = tags
 		self.collected_attrs = set()
+		self.new_attrs = set()
 
 	# this method will trigger for every opening tag in the HTML string fed to this class
 	# it will cross-reference the tags and their attributes with the data provided to the class at
@@ -35,25 +42,30 @@ class ParserHTML(HTMLParser) :
 	def handle_starttag(self, tag, attrs) :
 		if (tag in self.relevant_data) :
 			for attr in attrs :
-				if (attr[0] in self.relevant_data[tag]) :
+				# NOTE: attributes without a value (ex: <a href>) are ignored
+				if (attr[0] in self.relevant_data[tag] and attr[1] != None) :
 					# if the attribute is a URL, do any preparations needed first
+					# URLs that can't be crawled (ex: mailto:) are ignored
 					if (self.relevant_data[tag][attr[0]]) :
-						value = self.prepareURL(attr[1].lower())
+						value = self.prepareURL(attr[1])
+						if (value == None) :
+							continue
 					else :
 						value = attr[1].lower()
 
 					# add the item to the final data set
-					self.collected_attrs.add(value)
+					if (value not in self.collected_attrs) :
+						self.collected_attrs.add(value)
+						self.new_attrs.add(value)
 
-	# do any adjustments to the URL in order for the code to use it
-	# returns the adjusted URL
-	def prepareURL(self, url) :
-		# if the URL starts with a /, i.e., it's a relative link, then add the root_url to the start of it
-		if (url.startswith("/")) :
-			url = self.root_url + url
+	# returns a set with the attributes stored since the last call to this method
+	def flushCollected(self) :
+		new_attrs = self.new_attrs
+		self.new_attrs = set()
 
-		# add the http:// to the start of the URL, if not there already
-		if ("http://" not in url and "https://" not in url) :
-			url = "http://" + url
+		return(new_attrs)
 
-		return(url)
+	# do any adjustments to the URL in order for the code to use it
+	# returns the URL's canonical form, or None if it's not an http(s) URL
+	def prepareURL(self, url) :
+		return(self.canonicalizer.canonicalize(url, self.base_url))
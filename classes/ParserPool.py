@@ -0,0 +1,54 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import io, http.client, concurrent.futures
+from classes import HTMLStream, LinkExtractor, ParserHTML
+
+class ParserPool :
+	"""This class runs the parsing of webpages in a pool of processes, separate from the crawlers that download them.
+	Since each process has its own GIL, parsing (CPU bound) doesn't slow down the crawlers and can use all the CPU cores.
+
+	The crawlers hand over the raw bytes of a webpage and get back a future with a tuple (set with the links, hash of the body)."""
+
+	def __init__(self, processes) :
+		# instance variable with the pool of processes
+		self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=max(1, int(processes)))
+
+	# sends a webpage's body to be parsed by 1 of the processes
+	# returns a concurrent.futures.Future with the tuple (set with the links, hash of the body)
+	def parse(self, base_url, canonicalizer, fast_link_extractor, content_type, body) :
+		return(self.executor.submit(ParserPool.parseBody, base_url, canonicalizer, fast_link_extractor, content_type, body))
+
+	# stops the processes, dropping any webpages still waiting to be parsed
+	def close(self) :
+		self.executor.shutdown(wait=False, cancel_futures=True)
+
+	# runs in the pool's processes and parses a webpage's body
+	# returns a tuple (set with the links, hash of the body)
+	@staticmethod
+	def parseBody(base_url, canonicalizer, fast_link_extractor, content_type, body) :
+		if (fast_link_extractor) :
+			extractor = LinkExtractor.LinkExtractor(base_url, canonicalizer)
+		else :
+			extractor = ParserHTML.ParserHTML(base_url, {"a" : {"href" : True}}, canonicalizer)
+
+		# the charset is found the same way as when the webpage is parsed as it's downloaded
+		headers = http.client.parse_headers(io.BytesIO(b""))
+		if (content_type != None) :
+			headers["Content-Type"] = content_type
+
+		stream = HTMLStream.HTMLStream(extractor, headers)
+		stream.feed(body)
+		stream.close()
+
+		return((stream.links(), stream.contentHash()))
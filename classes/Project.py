@@ -0,0 +1,720 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import os, time, urllib.parse
+from classes import general, MapGenerator, Crawler, AsyncCrawler, Frontier, ConnectionPool, Journal, HostScheduler, HTTPCache, ParserPool, URLCanonicalizer, URLTable, DiskURLTable, BloomFilter, RobotsCache, SiteMapItems
+
+class Project :
+	"""This class handles a project's data and the crawl and site map build of its website, without any user interface.
+	It's used by the GUI application (Main.py) and by the command line interface (python -m classes).
+
+	The crawl and site map build are split in a prepare step and a run step, meant to be called in a background task
+	(a TaskController instance), which publishes "progress" events and a "done" event at the end."""
+
+	# class constant with the default # of threads to use
+	DEFAULT_NUM_THREADS_ = 8
+	# class constant with the default max # of simultaneous requests of the asynchronous crawler
+	DEFAULT_CONCURRENCY_ = 500
+	# class constant with the default max # of requests per second sent to each host when crawling (0 = no limit)
+	DEFAULT_MAX_RATE_ = 0
+	# class constant with the default max size, in MB, of a webpage downloaded when crawling
+	DEFAULT_MAX_BODY_SIZE_ = 5
+	# class constant with the default # of processes parsing the webpages when crawling (0 = parsed by the crawlers)
+	DEFAULT_PARSER_PROCESSES_ = 0
+	# class constant with the default false positive rate of the Bloom filter of the URLs stored in a database (0 = no Bloom filter)
+	DEFAULT_BLOOM_ERROR_RATE_ = 0
+	# class constant with the # of URLs the Bloom filter is sized for (past it, the false positive rate grows)
+	BLOOM_FILTER_CAPACITY_ = 10000000
+	# class constant with #secods between a save of data to files (in automated tasks)
+	SAVE_STATE_SECONDS_ = 5
+	# class constant with the # of journal lines after which the URL files are rewritten and the journal emptied
+	JOURNAL_COMPACT_ENTRIES_ = 100000
+	# class constant with #secods between a save of data to files (in tasks when the user changes an input value)
+	SAVE_TMP_FILE_SECONDS_ = 30
+	# class constant with #secods between progress updates of a running task
+	PROGRESS_UPDATE_SECONDS_ = 1
+	# class constant with the max # of idle keep-alive connections kept per host when crawling (0 = the # of crawlers)
+	CONNECTION_POOL_SIZE_ = 0
+	# class constant with #seconds an idle keep-alive connection is kept open
+	CONNECTION_IDLE_SECONDS_ = 30
+
+	def __init__(self) :
+		# instance variable containing the # of threads to be used when crawling
+		self.num_threads = self.DEFAULT_NUM_THREADS_
+		# instance variable containing the max # of simultaneous requests when crawling asynchronously
+		self.concurrency = self.DEFAULT_CONCURRENCY_
+		# instance variable containing the max # of requests per second sent to each host when crawling
+		self.max_rate = self.DEFAULT_MAX_RATE_
+		# instance variable containing the max size, in MB, of a webpage downloaded when crawling
+		self.max_body_size = self.DEFAULT_MAX_BODY_SIZE_
+		# instance variable flagging if the links are collected with the fast LinkExtractor (True) or with ParserHTML (False)
+		self.fast_link_extractor = True
+		# instance variable containing the # of processes parsing the webpages when crawling (0 = parsed by the crawlers)
+		self.parser_processes = self.DEFAULT_PARSER_PROCESSES_
+		# instance variable with the rules used to convert the URLs found when crawling to their canonical form
+		self.canonicalizer = URLCanonicalizer.URLCanonicalizer()
+		# instance variable flagging if the URLs are stored in a database in the project's folder (True) or in memory (False)
+		self.disk_frontier = False
+		# instance variable with the false positive rate of the Bloom filter in front of the database of URLs (0 = no Bloom filter)
+		self.bloom_error_rate = self.DEFAULT_BLOOM_ERROR_RATE_
+
+		# instance variable with the table storing all the URLs found and their state
+		self.url_table = None
+
+		# create the instance variables for data storage
+		self.resetDataVariables()
+
+		# instance variable with the path to the projects folder
+		self.path_projects = os.getcwd() + "/projects/"
+
+		# instance variables with the partial path to the temp sitemap file
+		self.path_tmp_folder = "/tmp/"
+		self.file_tmp_save_sitemap = "tmp_save_sitemap.txt"
+
+		# instance boolean variable used to stop a running crawl or site map build (ex: the PAUSE button was pressed)
+		self.paused = False
+
+	# gives feedback to the user about an error
+	# meant to be overridden by the user interface, by default the message is printed
+	def showError(self, title, message) :
+		print(title + ": " + message)
+
+	# gives feedback to the user about a completed operation
+	# meant to be overridden by the user interface, by default the message is printed
+	def showInfo(self, title, message) :
+		print(title + ": " + message)
+
+	# this method creates/resets the instance variables used to store the
+	# data and their situation for the current project
+	def resetDataVariables(self) :
+		# instance variable with the currently opened project's data
+		self.root_url = ""
+		self.root_domain = ""
+
+		# create an empty table for the URLs and the URL sets, which are views of it
+		self.createURLTable(False)
+
+		# instance variable used to store the site map items and sorting info
+		self.site_map_items = SiteMapItems.SiteMapItems()
+		self.site_map_items_sorting = []
+
+	# creates the table storing all the URLs found and their state, in memory or, if use_disk is True, in a database
+	# in the project's folder, and the URL sets, which are views of this table, so each URL is only stored once
+	def createURLTable(self, use_disk) :
+		# release the current table's URLs
+		if (self.url_table != None) :
+			self.url_table.close()
+
+		if (use_disk) :
+			bloom_filter = BloomFilter.BloomFilter(self.BLOOM_FILTER_CAPACITY_, self.bloom_error_rate) if self.bloom_error_rate > 0 else None
+			self.url_table = DiskURLTable.DiskURLTable(self.paths["url_db"], bloom_filter)
+		else :
+			self.url_table = URLTable.URLTable()
+
+		# instance variables used by the crawlers to store all URLs
+		# that have been found (they are either in the queue or processed)
+		# and the URLs that have been crawled already
+		self.known_urls = self.url_table.view(URLTable.URLTable.KNOWN_)
+		self.crawled_urls = self.url_table.view(URLTable.URLTable.CRAWLED_)
+
+		# instance variable used by the crawlers to store URLs that were not
+		# possible to either access or get the html
+		self.failed_urls = self.url_table.view(URLTable.URLTable.FAILED_)
+
+		# instance variable used by the crawlers to store URLs pointing
+		# to external websites. NOTE: these links will not be crawled!
+		self.external_urls = self.url_table.view(URLTable.URLTable.EXTERNAL_)
+
+		# instance variable used by the crawlers with the URLs still not crawled
+		self.url_queue = self.url_table.view(URLTable.URLTable.QUEUED_)
+		self.site_map_items_sorting = []
+
+	# determined the domain from a URL
+	def getDomain(self, url) :
+		# parse the URL
+		parsed_url = urllib.parse.urlparse(self.root_url)
+
+		# build the domain
+		# if the url has a subdomain in the folder format, convert it to the subdomain format
+		if (parsed_url.path != "") :
+			domain = general.convertFoldersToSubdomain(parsed_url)
+		else :
+			# remove the port information, if it's present
+			port_index = parsed_url.netloc.find(":")
+			if (port_index != -1) :
+				domain = parsed_url.netloc[:port_index]
+			else :
+				domain = parsed_url.netloc
+
+			domain += parsed_url.path
+
+		# if the url passed ended with a / remove it
+		if (domain.endswith("/")) :
+			domain = domain[:-1]
+
+		return(domain)
+
+	# validate root URL
+	# return True if valid, False if not valid
+	def validateRootURL(self) :
+		# strip whitespaces from start and end of the root URL
+		self.root_url = self.root_url.strip()
+
+		# add the http:// to the start of the root URL, if not there already
+		if (not self.root_url.startswith("http://") and not self.root_url.startswith("https://")) :
+			self.root_url = "http://" + self.root_url
+
+		# parse the URL
+		parsed_url = urllib.parse.urlparse(self.root_url)
+
+		# check if there a main body to the URL and that there are no queries in the URL
+		if (parsed_url.netloc == "" or parsed_url.query != "") :
+			# there isn't a main body or there is a query, so fail validation
+			return(False)
+
+		# store the tentative final URL
+		self.root_url = parsed_url.geturl()
+
+		# local variable used to know if any changes to path were made below and upsate the final URL
+		update_url = False
+
+		# if the URL ends with "index.[file type]" remove it
+		if (parsed_url.path.count(".") > 0) :
+			# remove everything after the last /, making sure it doesn't end with a /
+			new_path = parsed_url.path[:parsed_url.path.rindex("/")]
+
+			update_url = True
+		elif (parsed_url.path.endswith("/")) :
+			# remove the ending / from path
+			new_path = parsed_url.path[:-1]
+
+			update_url = True
+
+		# if needed, update the path with the changes made above
+		# NOTE: the URL is rebuilt from its parts, since the path can also be found in other parts of it (ex: a path "/")
+		if (update_url) :
+			self.root_url = parsed_url._replace(path=new_path).geturl()
+
+		return(True)
+
+	# this method scans the projects folder and returns a list of all the
+	# projects currently created
+	def projectList(self) :
+		# local variable where the project names will be added
+		projects = []
+
+		# loop each item and if it's a directory add it to the list
+		for item in os.listdir(self.path_projects) :
+			# check if this item is a folder
+			if (os.path.isdir(self.path_projects + item)) :
+				projects.append(item)
+
+		# return the project list, sorted by alphabetical order
+		projects.sort(key=str.lower)
+		return(projects)
+
+	# create the folder and files for a new project, with the passed root URL
+	# returns True if successful, False otherwise
+	def createProjectFolder(self, root_url) :
+		self.root_url = root_url
+
+		# validate the root URL
+		if (not self.validateRootURL()) :
+			# the root URL is not valid, so give error
+			self.showError(title="An error occured", message="The root URL inserted is not valid.")
+			return(False)
+
+		# get the domain name for the root url
+		self.root_domain = self.getDomain(self.root_url)
+
+		# build the folder and file paths for this project
+		self.buildFilePaths()
+
+		# check if the project path already exists
+		if (os.path.isdir(self.paths["project_folder"])) :
+			# the project already exists, so give error
+			self.showError(title="An error occured", message="A project already exists for the inserted root url!")
+			return(False)
+
+		# project path doesn't exist, so create the necessary directory and files
+		os.mkdir(self.paths["project_folder"])
+		general.writeToFile(self.paths["webpages"], "w", "")
+		general.writeToFile(self.paths["queue"], "w", self.startURL() + "\n")
+		general.writeToFile(self.paths["external_links"], "w", "")
+		general.writeToFile(self.paths["failed_links"], "w", "")
+
+		return(True)
+
+	# sets the project with the passed root domain as the current project
+	# returns True if the project's website has already been crawled, False otherwise
+	def loadProject(self, root_domain) :
+		# reset the instance variables used to store the data of the project
+		self.resetDataVariables()
+
+		# set the new root domain
+		self.root_domain = root_domain
+
+		# build the folder and file paths for this project
+		self.buildFilePaths()
+
+		# set the root URL for this project
+		self.root_url = self.root_domain
+		self.validateRootURL()
+
+		# determine if this project has already been crawled
+		# the only way the queue.txt file exists and is empty is if all pages have been crawled
+		return(os.path.isfile(self.paths["queue"]) and os.path.getsize(self.paths["queue"]) == 0)
+
+	# returns the URL where the crawl starts: the canonical form of the root URL, the same as the links to it
+	def startURL(self) :
+		return(self.canonicalizer.canonicalize(self.root_url))
+
+	# prepares the build of the initial version of the site map, using the URLs stored in the .txt file
+	# returns the URLs to be passed to runSiteMapBuild(), or None if the project hasn't been completely crawled
+	def prepareSiteMapBuild(self) :
+		# if the current project's URL state variables are not set, do so
+		if (len(self.known_urls) == 0) :
+			self.setCrawlVariables(True)
+
+		# if the queue isn't empty, then this project hasn't been fully crawled
+		# so bail out
+		if (len(self.url_queue) != 0) :
+			self.showError(title="Operation Failed", message="The currently opened project hasn't been completely crawled.\n\nPlease do so before generating a site map.")
+			return(None)
+
+		# local list variable with the URLs to process, built from the known_urls set
+		# sorted by URL asc, so the items are built in that order (the same order SiteMapItems sorts the URLs in)
+		urls = sorted(self.known_urls, key=SiteMapItems.SiteMapItems.urlKey)
+
+		# reset the instance variable with the site map data
+		self.site_map_items = SiteMapItems.SiteMapItems()
+		# reset the instance variable with the site map data's sorting
+		# in the form [[col_alias, True/False], [col_alias, True/False]]
+		# the default is to sort by url asc
+		self.site_map_items_sorting = [["url", False]]
+
+		# local variable with the current system date as YYYY-MM-DD
+		local_time_aux = time.localtime()
+		local_time_str = "{0}-{1}-{2}".format(str(local_time_aux.tm_year), str(local_time_aux.tm_mon).zfill(2), str(local_time_aux.tm_mday).zfill(2))
+
+		# local variable with the HTTP cache, which has the date each page was last modified
+		http_cache = HTTPCache.HTTPCache(self.paths["http_cache"])
+		http_cache.load()
+
+		# instance variable with the cache of the robots.txt files, shared with the crawls
+		self.robots_cache = RobotsCache.RobotsCache(self.paths["robots_cache"], Crawler.Crawler.USER_AGENT_)
+		self.robots_cache.load()
+
+		# instance variable with the builder of the site map items
+		self.map_generator = MapGenerator.MapGenerator(self.root_url, local_time_str, self.robots_cache, http_cache)
+
+		return(urls)
+
+	# runs in a background task, after prepareSiteMapBuild(), and builds the site map items of the URLs in 1 pass
+	# publishing a "done" event at the end
+	def runSiteMapBuild(self, controller, urls, use_robots_file) :
+		self.site_map_items = self.map_generator.buildSiteMapItems(urls, use_robots_file)
+
+		# save the robots.txt file, if it was requested
+		self.robots_cache.save()
+
+		controller.publish("done")
+
+	# sorts the site map items based on the passed column sorting (in a list of lists)
+	# the columns should be passed with index=0 being the primary sorting col,
+	# index=1 being the secondary sorting col, and so on
+	# and for each col there should be an asc/desc bool value (asc=False, desc=True)
+	# sort_cols should be in the form [[col_alias, True/False], [col_alias, True/False]]
+	# the method returns True if successful, False otherwise
+	# NOTE: the site map items only change the order their positions map to the items, and keep the items sorted by URL,
+	# so any sorting ending with the URL col (ex: all the sortings done in the GUI) only needs to sort by the other cols
+	def sortSiteMapItems(self, new_sort) :
+		# try to do the requested sorting
+		try:
+			self.site_map_items.sort(new_sort)
+		except Exception as e:
+			return(False)
+
+		# if everything went ok, then store the new sorting
+		self.site_map_items_sorting = new_sort
+
+		return(True)
+
+	# this method will be called whenever the user changes any of the site map's data
+	# it will check if the data should be saved to a temp file, based on a timer
+	def saveSiteMapData(self, timed) :
+		# build the path to the temp file
+		file_path = self.paths["project_folder"] + self.path_tmp_folder + self.file_tmp_save_sitemap
+
+		# if the temp file doesn't exist or we want to save now or the last save was longer than the save cooldown
+		if (not os.path.isfile(file_path) or not timed or time.time() - os.path.getmtime(file_path) >= self.SAVE_TMP_FILE_SECONDS_) :
+			self.writeSiteMapData()
+
+	# saves the current site map data to the temp file
+	def writeSiteMapData(self) :
+		general.saveTmpSiteMap(self.paths["project_folder"], self.file_tmp_save_sitemap, "w", self.site_map_items, self.site_map_items_sorting)
+
+	# this method returns the last modified time stamp of the temp file with the site map data
+	def lastSiteMapSaveTime(self) :
+		file_path = self.paths["project_folder"] + self.path_tmp_folder + self.file_tmp_save_sitemap
+
+		# check if the the temp file exists
+		if (not os.path.isfile(file_path)) :
+			# if it doesn't exist, return empty string
+			return("")
+
+		# at this point, the file exists, so grab the modified time stamp
+		# local variable with the last modified time stamp
+		ts = os.path.getmtime(file_path)
+		ts_aux = time.localtime(ts)
+		return("{0}-{1}-{2} {3}:{4}:{5}".format(str(ts_aux.tm_year), str(ts_aux.tm_mon).zfill(2), str(ts_aux.tm_mday).zfill(2), str(ts_aux.tm_hour).zfill(2), str(ts_aux.tm_min).zfill(2), str(ts_aux.tm_sec).zfill(2)))
+
+	# this method checks if the temporary save file with site map data exists and has data
+	# returns True if the file eists and has data, False otherwise
+	def tempSaveSiteMapExists(self, file_path="") :
+		# if needed, build the path to the temp file
+		if (file_path == "") :
+			file_path = self.paths["project_folder"] + self.path_tmp_folder + self.file_tmp_save_sitemap
+
+		# if the temp file doesn't exist or it's empty, return False
+		if (not os.path.isfile(file_path) or os.path.getsize(file_path) == 0) :
+			return(False)
+
+		# return True if all checks pass
+		return(True)
+
+	# this method will populate the site_map_items variable with the data in the site map temp file
+	def loadSiteMapData(self) :
+		# build the path to the temp file
+		file_path = self.paths["project_folder"] + self.path_tmp_folder + self.file_tmp_save_sitemap
+
+		# if the temp file doesn't exist or it's empty, skip
+		if (not self.tempSaveSiteMapExists(file_path)) :
+			return
+
+		# empty the current site map data and sorting info
+		self.site_map_items.clear()
+		self.site_map_items_sorting.clear()
+
+		# local bool variable to know if we've loaded the sorting info
+		first_line = True
+
+		with open(file_path, "r") as f :
+			# loop each line
+			for line in f :
+				# remove any new line characters returned
+				line = line.replace("\n", "")
+				if (line == "") :
+					continue
+
+				# split the line into the several information
+				line_parts = line.split("||")
+
+				# if we're on the 1st line, then we have the sorting info
+				if (first_line) :
+					# loop through each sorting item
+					for sorting_item in line_parts :
+						if (sorting_item == "") :
+							continue
+
+						# split this item into the 2 parts
+						sorting_item_parts = sorting_item.split(";")
+
+						# add it to the instance variable
+						self.site_map_items_sorting.append([sorting_item_parts[0], bool(int(sorting_item_parts[1]))])
+
+					first_line = False
+				else :
+					# we're not on the 1st line, so we have sitemap data
+					# values that can't be stored (ex: a priority of nan, saved by older versions) are stored as empty
+					values = []
+					for col_alias, value in zip(("lastmod", "changefreq", "priority"), line_parts[1:4]) :
+						values.append(value if self.site_map_items.isValid(col_alias, value) else "")
+
+					# build this item's data and add it to the site map data variable
+					self.site_map_items.append(line_parts[0], values[0], values[1], values[2])
+
+	# creates the final site map XML file(s) with the current site map data
+	# returns the name of the file to be submitted to the search engines
+	def createSiteMapFile(self, compress=False) :
+		return(general.createSiteMapXML(self.paths["project_folder"], self.site_map_items, self.root_url, compress))
+
+	# returns a dictionary with the number of URL known, crawled, external and failed for the current project
+	def getURLCounts(self) :
+		counts = {}
+
+		# count
+		c_known = len(self.known_urls)
+		c_crawled = len(self.crawled_urls)
+		c_external = len(self.external_urls)
+		c_failed = len(self.failed_urls)
+
+		# if the crawl instance variables aren't set yet, do so
+		if (c_known == 0 and c_crawled == 0 and c_external == 0 and c_failed == 0) :
+			# set the variables
+			self.setCrawlVariables(True)
+			# count again
+			c_known = len(self.known_urls)
+			c_crawled = len(self.crawled_urls)
+			c_external = len(self.external_urls)
+			c_failed = len(self.failed_urls)
+
+		counts["known"] = c_known
+		counts["crawled"] = c_crawled
+		counts["external"] = c_external
+		counts["failed"] = c_failed
+
+		return(counts)
+
+	# sets instance variables used in the crawl task
+	# if read_only is True, the variables will be set based on the files.
+	# if False, the treatment will depend on whether the project has been fully crawled already or not
+	# if it has, then it will reset to the initial values, else it will set from where we left off
+	def setCrawlVariables(self, read_only) :
+		# if the folder or any of the files don't exist, show error and return
+		if (not os.path.isdir(self.paths["project_folder"]) or not os.path.isfile(self.paths["webpages"]) or not os.path.isfile(self.paths["queue"]) or not os.path.isfile(self.paths["external_links"]) or not os.path.isfile(self.paths["failed_links"])) :
+			self.showError(title="An error occured", message="Some of the required files for this project could not be found.")
+			return(False)
+
+		# clear all the sets of past data, creating the table of the URLs with the storage to use
+		self.createURLTable(self.disk_frontier)
+
+		# if not in read_only mode and the queue.txt is empty, then build the variables
+		# with the initial values (as if the project was created) to crawl the website again
+		if (not read_only and os.path.getsize(self.paths["queue"]) == 0) :
+			self.known_urls.add(self.startURL())
+			self.url_queue.add(self.startURL())
+		else :
+			# build the variables based on the file's content
+			with open(self.paths["webpages"], "r") as f :
+				# loop each line
+				for line in f :
+					# remove any new line characters returned
+					line = line.replace("\n", "")
+					if (line == "") :
+						continue
+
+					# add this URL to the sets
+					self.crawled_urls.add(line)
+					self.known_urls.add(line)
+
+			with open(self.paths["queue"], "r") as f :
+				# loop each line
+				for line in f :
+					# remove any new line characters returned
+					line = line.replace("\n", "")
+					if (line == "") :
+						continue
+
+					# add this URL to the sets
+					self.url_queue.add(line)
+					self.known_urls.add(line)
+
+			with open(self.paths["external_links"], "r") as f :
+				# loop each line
+				for line in f :
+					# remove any new line characters returned
+					line = line.replace("\n", "")
+					if (line == "") :
+						continue
+
+					# add this URL to the set
+					self.external_urls.add(line)
+
+			with open(self.paths["failed_links"], "r") as f :
+				# loop each line
+				for line in f :
+					# remove any new line characters returned
+					line = line.replace("\n", "")
+					if (line == "") :
+						continue
+
+					# add this URL to the set
+					self.failed_urls.add(line)
+
+			# apply the URL state transitions logged after the files were last written
+			Journal.Journal(self.paths["journal"]).replay(self.known_urls, self.crawled_urls, self.url_queue, self.external_urls, self.failed_urls)
+
+		return(True)
+
+	# prepares the crawl of the project's website, continuing an incomplete crawl or starting from scratch
+	# returns True if the crawl can be started with runCrawl(), False otherwise
+	def prepareCrawl(self) :
+		# if the queue is empty, then reset the data to start crawling again
+		# NOTE: if we reach ths code, we want to crawl the site
+		# either continue an incomplete crawl, or start from scratch
+		if (len(self.url_queue) == 0) :
+			# this project has been fully crawled before, so reset
+			if (not self.setCrawlVariables(False)) :
+				# the variables couldn't be set, so bail out
+				return(False)
+
+		# instance variable with the work queue used by the crawlers, built from the URLs still not crawled
+		self.frontier = Frontier.Frontier(self.url_queue, self.known_urls)
+
+		# instance variable with the journal of URL state transitions
+		# start by writing the current state to the files and emptying the journal, so the journal
+		# only has transitions from this crawl
+		self.journal = Journal.Journal(self.paths["journal"])
+		self.journal.open()
+		self.compactCrawlState()
+
+		# instance variable with the cache of the validators and links of the URLs crawled before
+		# used to only download the pages that changed since then
+		self.http_cache = HTTPCache.HTTPCache(self.paths["http_cache"])
+		self.http_cache.load()
+		self.http_cache.open()
+
+		# instance variable with the cache of the robots.txt files, shared with the site map build
+		self.robots_cache = RobotsCache.RobotsCache(self.paths["robots_cache"], Crawler.Crawler.USER_AGENT_)
+		self.robots_cache.load()
+
+		# set the crawler's class variables, to keep all crawlers in sync
+		Crawler.Crawler.terminate_thread_ = False
+		Crawler.Crawler.known_urls_ = self.known_urls
+		Crawler.Crawler.crawled_urls_ = self.crawled_urls
+		Crawler.Crawler.external_urls_ = self.external_urls
+		Crawler.Crawler.failed_urls_ = self.failed_urls
+		Crawler.Crawler.queue_ = self.frontier
+		Crawler.Crawler.journal_ = self.journal
+		Crawler.Crawler.http_cache_ = self.http_cache
+		Crawler.Crawler.connection_pool_ = ConnectionPool.ConnectionPool(self.CONNECTION_POOL_SIZE_ or self.num_threads, self.CONNECTION_IDLE_SECONDS_)
+		Crawler.Crawler.scheduler_ = HostScheduler.HostScheduler(self.max_rate, self.robots_cache, Crawler.Crawler.ROBOTS_NAME_)
+		Crawler.Crawler.root_url_ = self.root_url
+		Crawler.Crawler.max_body_size_ = int(self.max_body_size * 1024 * 1024)
+		Crawler.Crawler.fast_link_extractor_ = self.fast_link_extractor
+		Crawler.Crawler.canonicalizer_ = self.canonicalizer
+		Crawler.Crawler.parser_pool_ = ParserPool.ParserPool(self.parser_processes) if self.parser_processes > 0 else None
+
+		# instance boolean variable used to stop the crawl (ex: the PAUSE button was pressed)
+		self.paused = False
+
+		return(True)
+
+	# runs in a background task, after prepareCrawl(), and controls the crawlers until all URLs are crawled
+	# or the crawl is paused, publishing a "progress" event every PROGRESS_UPDATE_SECONDS_ and a "done" event at the end
+	def runCrawl(self, controller, use_async) :
+		# local variable used to store all the crawler objects created
+		threads = []
+
+		# local variables used to control the periodic save of the queue to a file
+		last_time_call = time.monotonic()
+		state_save_cooldown = self.SAVE_STATE_SECONDS_
+
+		if (use_async) :
+			# instantiate the asynchronous crawler, which runs all the requests in 1 thread
+			thread = AsyncCrawler.AsyncCrawler(self.concurrency)
+			thread.start()
+			threads.append(thread)
+		else :
+			# instantiate each crawler, start it and store the object reference
+			for _ in range(self.num_threads) :
+				thread = Crawler.Crawler()
+				thread.start()
+				threads.append(thread)
+
+		# local variable set to True once all the URLs have been crawled
+		all_done = False
+
+		# loop until all items have been processed
+		# (checked after updating UI to make sure it updates with last items processed)
+		while True :
+			# let the user interface update the URLs crawled and found
+			controller.publish("progress", (len(self.crawled_urls), len(self.known_urls), len(self.external_urls), len(self.failed_urls)))
+
+			# update the queue save timers
+			state_save_cooldown -= time.monotonic() - last_time_call
+			last_time_call = time.monotonic()
+			# check if it's time to store the crawl's state
+			if (state_save_cooldown <= 0) :
+				# write the journal's and the cache's buffered lines to the files
+				self.journal.flush()
+				self.http_cache.flush()
+
+				# if the journal is getting long, write the full state to the files and empty it
+				if (self.journal.num_entries >= self.JOURNAL_COMPACT_ENTRIES_) :
+					self.compactCrawlState()
+
+				# reset the queue save cooldown
+				state_save_cooldown = self.SAVE_STATE_SECONDS_
+
+			# if all processing is done OR the pause button was pressed, exit loop
+			if (all_done or self.paused) :
+				break
+
+			# wait for all the URLs to be crawled, but no longer than until the next GUI update
+			all_done = self.frontier.join(self.PROGRESS_UPDATE_SECONDS_)
+
+		# signal all instances of the crawler to terminate and wake up any waiting for URLs
+		Crawler.Crawler.terminate_thread_ = True
+		self.frontier.close()
+
+		# wait for all the crawlers to terminate
+		for t in threads:
+			t.join()
+
+		# close the keep-alive connections and stop the parser processes
+		Crawler.Crawler.connection_pool_.closeAll()
+		if (Crawler.Crawler.parser_pool_ != None) :
+			Crawler.Crawler.parser_pool_.close()
+			Crawler.Crawler.parser_pool_ = None
+
+		# save the final state of the crawl to the files (when completed, this empties the queue file)
+		# done after the crawlers terminate, so the URLs they were processing are included
+		self.compactCrawlState()
+		self.journal.close()
+		self.http_cache.close()
+		self.robots_cache.save()
+
+		controller.publish("done", (len(self.crawled_urls), len(self.known_urls), len(self.external_urls), len(self.failed_urls)))
+
+	# returns True if the project's website has been completely crawled, False otherwise
+	def crawlCompleted(self) :
+		return(len(self.known_urls) == len(self.crawled_urls) + len(self.failed_urls))
+
+	# saves the queue and the crawled, external and failed URL sets to the project's files
+	# and empties the journal, since all its transitions are now in the files
+	def compactCrawlState(self) :
+		# hold the queue's lock only to take a snapshot of the sets and rotate the journal, so the crawlers aren't
+		# stopped while the files are written and the transitions made from now on go to the new journal
+		with self.frontier.mutex :
+			snapshots = [
+				(self.paths["queue"], self.url_queue.snapshot()),
+				(self.paths["webpages"], self.crawled_urls.snapshot()),
+				(self.paths["external_links"], self.external_urls.snapshot()),
+				(self.paths["failed_links"], self.failed_urls.snapshot())
+			]
+			self.journal.rotate()
+
+		# write each file to a temp file and swap it in, so a file is never left half written
+		# NOTE: the rotated journal is only deleted after all the files are written, so if the application stops before that
+		# the files are loaded with both journals replayed on top of them
+		for path, urls in snapshots :
+			general.saveSetToFile(path + ".tmp", "w", urls)
+			os.replace(path + ".tmp", path)
+
+		self.journal.removeRotated()
+
+	# builds the paths for a project's files
+	def buildFilePaths(self) :
+		self.paths = {}
+
+		self.paths["project_folder"] = self.path_projects + self.root_domain
+		self.paths["webpages"] = self.paths["project_folder"] + "/webpages.txt"
+		self.paths["queue"] = self.paths["project_folder"] + "/queue.txt"
+		self.paths["external_links"] = self.paths["project_folder"] + "/external_links.txt"
+		self.paths["failed_links"] = self.paths["project_folder"] + "/failed_links.txt"
+		self.paths["journal"] = self.paths["project_folder"] + "/journal.txt"
+		self.paths["http_cache"] = self.paths["project_folder"] + "/http_cache.txt"
+		self.paths["url_db"] = self.paths["project_folder"] + "/urls.db"
+		self.paths["robots_cache"] = self.paths["project_folder"] + "/robots_cache.txt"
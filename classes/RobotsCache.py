@@ -0,0 +1,173 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import os, re, json, time, threading, email.utils, urllib.error, urllib.parse, urllib.request
+from classes import RobotsRules
+
+class RobotsCache :
+	"""This class defines a per project cache of the robots.txt files of the hosts crawled, used by the crawlers and the
+	site map build, so the files aren't requested again by every crawl and site map build.
+
+	Each file is kept until it expires, based on the Cache-Control (max-age) or Expires headers of its response,
+	but never for more than MAX_AGE_ seconds (as RFC 9309 recommends). If the server denies access to the file (401, 403),
+	all URLs are disallowed and if it has no file (any other 4xx), all URLs are allowed. Server errors (5xx) are retried
+	a few times, waiting longer each time, and if they persist all URLs are disallowed, but only for SERVER_ERROR_MAX_AGE_
+	seconds, after which the file is requested again. Network errors allow all URLs, but aren't kept, so the file is
+	requested again the next time.
+
+	The file has 1 JSON object per line, with the host's origin (ex: https://www.example.com), the lines of its
+	robots.txt and the time they expire, and is rewritten by save()."""
+
+	# class constant with the max #seconds a robots.txt file is kept
+	MAX_AGE_ = 86400
+	# class constant with the #seconds before the request for a robots.txt file is abandoned
+	TIMEOUT_ = 30
+	# class constants with the # of times a robots.txt file is requested again after a server error (5xx)
+	# and the #seconds waited before the 1st of them (doubled before each of the others)
+	SERVER_ERROR_RETRIES_ = 4
+	SERVER_ERROR_RETRY_DELAY_ = 2
+	# class constant with the max #seconds a robots.txt file that kept failing with server errors disallows all URLs
+	SERVER_ERROR_MAX_AGE_ = 300
+	# class constant with the lines of a robots.txt file disallowing all URLs
+	DISALLOW_ALL_ = ["User-agent: *", "Disallow: /"]
+	# class constant with the regex matching the max-age directive of a Cache-Control header
+	MAX_AGE_RE_ = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+	def __init__(self, path, user_agent) :
+		# instance variable with the path to the cache file
+		self.path = path
+
+		# instance variable with the user agent sent when requesting the robots.txt files
+		self.user_agent = user_agent
+
+		# instance variable with the entries, in the form {origin : {"origin" : origin, "lines" : [line, ...], "expires" : time}}
+		self.entries = {}
+
+		# instance variable with the lock used to access the entries and the file
+		self.lock = threading.Lock()
+
+	# loads the entries from the file, if it exists
+	def load(self) :
+		with self.lock :
+			self.entries.clear()
+
+			if (not os.path.isfile(self.path)) :
+				return
+
+			with open(self.path, "r", encoding="utf-8") as f :
+				for line in f :
+					try :
+						entry = json.loads(line)
+					except ValueError :
+						# a line left incomplete by an interrupted save, so ignore it
+						continue
+
+					self.entries[entry["origin"]] = entry
+
+	# writes the entries that haven't expired to the file
+	def save(self) :
+		with self.lock :
+			now = time.time()
+
+			with open(self.path + ".tmp", "w", encoding="utf-8") as f :
+				for entry in self.entries.values() :
+					if (entry["expires"] > now) :
+						f.write(json.dumps(entry) + "\n")
+			os.replace(self.path + ".tmp", self.path)
+
+	# returns the robots.txt rules of the url's host that apply to the robot name (a RobotsRules instance)
+	# NOTE: if the host's robots.txt isn't in the cache, or has expired, it's requested, blocking until it's received
+	def getRules(self, url, robots_name) :
+		return(RobotsRules.RobotsRules(self.getLines(url), robots_name))
+
+	# returns the lines of the robots.txt of the url's host, requesting it if it isn't in the cache or has expired
+	def getLines(self, url) :
+		origin = self.origin(url)
+
+		with self.lock :
+			entry = self.entries.get(origin)
+		if (entry != None and entry["expires"] > time.time()) :
+			return(entry["lines"])
+
+		# request the file without holding the lock, so the files of other hosts can be read meanwhile
+		lines, max_age = self.request(origin + "/robots.txt")
+
+		# the server is failing, so request the file again a few times, waiting longer each time
+		retry_delay = self.SERVER_ERROR_RETRY_DELAY_
+		for _ in range(self.SERVER_ERROR_RETRIES_) :
+			if (lines != None) :
+				break
+
+			time.sleep(retry_delay)
+			retry_delay *= 2
+			lines, max_age = self.request(origin + "/robots.txt")
+
+		# the server kept failing, so disallow all URLs for a short time, after which the file is requested again
+		if (lines == None) :
+			lines, max_age = self.DISALLOW_ALL_, self.SERVER_ERROR_MAX_AGE_
+
+		if (max_age > 0) :
+			with self.lock :
+				self.entries[origin] = {"origin" : origin, "lines" : lines, "expires" : time.time() + max_age}
+
+		return(lines)
+
+	# returns the #seconds until the robots.txt of the url's host expires in the cache (0 if it isn't in the cache)
+	def expiresIn(self, url) :
+		with self.lock :
+			entry = self.entries.get(self.origin(url))
+
+		return(0 if entry == None else max(0, entry["expires"] - time.time()))
+
+	# returns the origin of a URL (ex: https://www.example.com)
+	def origin(self, url) :
+		parsed_url = urllib.parse.urlsplit(url)
+
+		return(parsed_url.scheme + "://" + parsed_url.netloc.lower())
+
+	# requests a robots.txt file
+	# returns a tuple (lines of the file, or None if the server failed (5xx), #seconds they can be kept)
+	def request(self, url) :
+		try :
+			request = urllib.request.Request(url, headers={"User-Agent" : self.user_agent})
+			with urllib.request.urlopen(request, timeout=self.TIMEOUT_) as response :
+				return(response.read().decode("utf-8", "replace").splitlines(), self.maxAge(response.headers))
+		except urllib.error.HTTPError as e :
+			if (e.code >= 500) :
+				return(None, 0)
+			if (e.code in (401, 403)) :
+				return(self.DISALLOW_ALL_, self.maxAge(e.headers))
+			return([], self.maxAge(e.headers))
+		except Exception as e :
+			# the server couldn't be reached, so there are no rules to follow
+			return([], 0)
+
+	# returns the #seconds a response can be kept, based on its Cache-Control and Expires headers (at most MAX_AGE_)
+	def maxAge(self, headers) :
+		cache_control = headers.get("Cache-Control", "")
+		if ("no-store" in cache_control.lower()) :
+			return(0)
+
+		match = self.MAX_AGE_RE_.search(cache_control)
+		if (match != None) :
+			return(min(int(match.group(1)), self.MAX_AGE_))
+
+		expires = headers.get("Expires")
+		if (expires != None) :
+			try :
+				return(max(0, min(email.utils.parsedate_to_datetime(expires).timestamp() - time.time(), self.MAX_AGE_)))
+			except (TypeError, ValueError) :
+				# an invalid date means the response has already expired
+				return(0)
+
+		return(self.MAX_AGE_)
@@ -0,0 +1,201 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import re
+from classes import URLCanonicalizer
+
+class RobotsRules :
+	"""This class parses a robots.txt file and checks if URLs are allowed by the rules that apply to a robot name.
+	The rules of the groups whose User-agent is in the robot name are used or, if there are none, the rules of the * groups.
+
+	Allow and Disallow rules support the * (any characters) and $ (end of the URL) wildcards, and the rule matching
+	the most characters of a URL's path and query decides it, with Allow winning ties (as Google does).
+	The rules are compiled into 1 regex, with the longest rules first, so its 1st matching rule is the one deciding.
+
+	The decision for a directory (ex: /blog/) is kept when no rule can decide differently for the URLs in it,
+	so most URLs don't need to be matched against the rules. The decisions for up to CACHE_SIZE_ directories are kept."""
+
+	# class constant with the max # of directories whose decision is kept
+	CACHE_SIZE_ = 100000
+	# class constant returned by the cache lookups for the directories not in it (None is a valid decision)
+	NOT_CACHED_ = object()
+	# class constant with the regex matching the wildcards of a rule
+	WILDCARDS_RE_ = re.compile(r"[*$]")
+
+	def __init__(self, lines, robots_name) :
+		# instance variables with the min #seconds between requests set by the Crawl-delay and the Request-rate (None if not set)
+		self.crawl_delay = None
+		self.request_rate = None
+
+		# instance variable with the rules that apply to the robot name, in the form [(pattern, allow), ...]
+		# longest patterns first and, for the same length, Allow rules first
+		self.rules = self.parse(lines, robots_name)
+		self.rules.sort(key=lambda rule: (-len(rule[0]), not rule[1]))
+
+		# instance variable with the regex matching a path with the rules, where the name of the group matched is the rule's index
+		if (len(self.rules) > 0) :
+			self.regex = re.compile("|".join("(?P<r" + str(index) + ">" + self.patternRegex(rule[0]) + ")" for index, rule in enumerate(self.rules)))
+		else :
+			self.regex = None
+
+		# instance variable with the decisions kept, in the form {directory : True/False, or None if the URLs in it must be matched}
+		self.cache = {}
+
+	# returns the rules of the groups that apply to the robot name, in the form [(pattern, allow), ...]
+	# also sets the Crawl-delay and Request-rate of those groups
+	def parse(self, lines, robots_name) :
+		robots_name = robots_name.lower()
+		canonicalizer = URLCanonicalizer.URLCanonicalizer()
+
+		# local variable with the groups, in the form [{"agents" : [...], "rules" : [...], "crawl_delay" : float, "request_rate" : float}, ...]
+		groups = []
+		group = None
+		# local variable flagging if the last line was a User-agent (consecutive User-agent lines start 1 group)
+		reading_agents = False
+
+		for line in lines :
+			# remove the comments and ignore lines that aren't a "field: value" pair
+			line = line.split("#", 1)[0]
+			if (":" not in line) :
+				continue
+			field, value = line.split(":", 1)
+			field = field.strip().lower()
+			value = value.strip()
+
+			if (field == "user-agent") :
+				if (not reading_agents) :
+					group = {"agents" : [], "rules" : [], "crawl_delay" : None, "request_rate" : None}
+					groups.append(group)
+					reading_agents = True
+
+				group["agents"].append(value.split("/")[0].lower())
+				continue
+
+			reading_agents = False
+			# ignore the lines before the 1st User-agent
+			if (group == None) :
+				continue
+
+			if (field == "allow" or field == "disallow") :
+				# an empty Disallow allows everything, so it's the same as no rule
+				if (value != "") :
+					group["rules"].append((canonicalizer.normalizeEncoding(value, canonicalizer.QUERY_SAFE_), field == "allow"))
+			elif (field == "crawl-delay") :
+				try :
+					group["crawl_delay"] = float(value)
+				except ValueError :
+					pass
+			elif (field == "request-rate") :
+				# in the form requests/seconds
+				try :
+					requests, seconds = value.split("/", 1)
+					if (int(requests) > 0) :
+						group["request_rate"] = float(seconds) / int(requests)
+				except ValueError :
+					pass
+
+		# use the groups for the robot name or, if there are none, the * groups
+		matched_groups = [group for group in groups if any(agent != "*" and agent != "" and agent in robots_name for agent in group["agents"])]
+		if (len(matched_groups) == 0) :
+			matched_groups = [group for group in groups if "*" in group["agents"]]
+
+		rules = []
+		for group in matched_groups :
+			rules.extend(group["rules"])
+			if (group["crawl_delay"] != None) :
+				self.crawl_delay = group["crawl_delay"]
+			if (group["request_rate"] != None) :
+				self.request_rate = group["request_rate"]
+
+		return(rules)
+
+	# returns the regex of a rule's pattern, where * matches any characters and a $ at the end matches the end of the URL
+	@staticmethod
+	def patternRegex(pattern) :
+		regex = ""
+		for index, char in enumerate(pattern) :
+			if (char == "*") :
+				if (not regex.endswith(".*")) :
+					regex += ".*"
+			elif (char == "$" and index == len(pattern) - 1) :
+				regex += r"\Z"
+			else :
+				regex += re.escape(char)
+
+		return(regex)
+
+	# returns the min #seconds between requests set by the Crawl-delay or the Request-rate, or None if neither is set
+	def minDelay(self) :
+		delays = [delay for delay in (self.crawl_delay, self.request_rate) if delay != None]
+		if (len(delays) == 0) :
+			return(None)
+
+		return(max(delays))
+
+	# checks if an absolute URL is allowed by the rules
+	# returns True if it is, False otherwise
+	def canFetch(self, url) :
+		# find the path and query, after the scheme and host
+		path_index = url.find("/", url.find("://") + 3)
+		if (path_index == -1) :
+			return(self.canFetchPath("/"))
+
+		return(self.canFetchPath(url[path_index:].split("#", 1)[0]))
+
+	# checks if a path (with the query, if any) is allowed by the rules
+	# returns True if it is, False otherwise
+	def canFetchPath(self, path) :
+		if (self.regex == None) :
+			return(True)
+
+		# use the decision for the path's directory, if no rule can decide differently for the URLs in it
+		query_index = path.find("?")
+		directory = path[:path.rfind("/", 0, query_index if query_index != -1 else len(path)) + 1]
+
+		# NOTE: looked up in 1 go, since the crawler threads share this instance and any of them may clear the cache meanwhile
+		allowed = self.cache.get(directory, self.NOT_CACHED_)
+		if (allowed is self.NOT_CACHED_) :
+			allowed = self.directoryDecision(directory)
+			if (len(self.cache) >= self.CACHE_SIZE_) :
+				self.cache.clear()
+			self.cache[directory] = allowed
+
+		if (allowed == None) :
+			allowed = self.matchPath(path)
+
+		return(allowed)
+
+	# returns the decision for all the URLs in a directory, or None if the rules can decide differently for some of them
+	def directoryDecision(self, directory) :
+		for pattern, _ in self.rules :
+			literal_prefix = self.WILDCARDS_RE_.split(pattern, 1)[0]
+
+			# a rule without wildcards that the directory starts with applies to all the URLs in it
+			if (literal_prefix == pattern and directory.startswith(pattern)) :
+				continue
+
+			# any other rule that can match a URL in the directory may only match some of them
+			if (directory.startswith(literal_prefix) or literal_prefix.startswith(directory)) :
+				return(None)
+
+		# the rules matching the directory are the same that match all the URLs in it
+		return(self.matchPath(directory))
+
+	# matches a path with the rules
+	# returns True if it's allowed, False otherwise
+	def matchPath(self, path) :
+		match = self.regex.match(path)
+		if (match == None) :
+			return(True)
+
+		return(self.rules[int(match.lastgroup[1:])][1])
@@ -0,0 +1,254 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import re, array
+
+class SiteMapItems :
+	"""This class stores the site map items in columns, instead of 1 dictionary per item, using a few bytes per item
+	besides its URL: the lastmod is stored as an int (YYYYMMDD), the changefreq as the index of its value in CHANGEFREQS_
+	and the priority as a byte (1 + the priority in hundredths). 0 means the value is empty, so empty values sort first.
+	Values that aren't valid raise a ValueError instead of being stored, except that a lastmod with a time
+	(a W3C datetime, ex: 2024-01-01T10:00:00+00:00) is stored as its date.
+
+	The items are accessed by their position, like a list of dictionaries: items[position]["lastmod"] returns and sets
+	the values as strings, through a SiteMapItem. The positions follow the last sort(), which only changes the order
+	the positions map to the stored items, so the items sorted by URL are kept and reused until items are added."""
+
+	# class constant with the changefreq values, in the order they are sorted (most to least frequent)
+	CHANGEFREQS_ = ("", "always", "hourly", "daily", "weekly", "monthly", "yearly", "never")
+	# class constant with the cols of an item
+	COLS_ = ("url", "lastmod", "changefreq", "priority")
+	# class constant with the regex matching a lastmod, as a date or a W3C datetime, with the year, month and day in groups 1 to 3
+	LASTMOD_RE_ = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:\d{2}))?")
+
+	def __init__(self) :
+		self.clear()
+
+	# removes all the items
+	def clear(self) :
+		# instance variables with the columns, where the item i's values are at index i
+		self.urls = []
+		self.lastmods = array.array("i")
+		self.changefreqs = bytearray()
+		self.priorities = bytearray()
+
+		# instance variable with the index of the item at each position
+		self.order = array.array("i")
+
+		# instance variable with the indexes of the items sorted by URL asc (None = not built yet)
+		self.url_order = None
+
+		# instance variables with the stored form of the lastmod and priority strings converted before, in the form {string : int}
+		# NOTE: most items have one of a few values, so each is only converted once
+		self.lastmod_ints = {}
+		self.priority_ints = {}
+
+	def __len__(self) :
+		return(len(self.order))
+
+	# returns the item at a position
+	def __getitem__(self, position) :
+		return(SiteMapItem(self, self.order[position]))
+
+	# generator yielding the items, in the order of their positions
+	def __iter__(self) :
+		for index in self.order :
+			yield SiteMapItem(self, index)
+
+	# adds an item at the last position, with its values as strings
+	# raises ValueError if a value isn't valid, without adding the item
+	def append(self, url, lastmod, changefreq, priority) :
+		lastmod = self.lastmodInt(lastmod)
+		changefreq = self.changefreqInt(changefreq)
+		priority = self.priorityInt(priority)
+
+		self.order.append(len(self.urls))
+		self.urls.append(url)
+		self.lastmods.append(lastmod)
+		self.changefreqs.append(changefreq)
+		self.priorities.append(priority)
+
+		self.url_order = None
+
+	# returns the value, as a string, of a col of the item at an index
+	def getValue(self, index, col_alias) :
+		if (col_alias == "url") :
+			return(self.urls[index])
+		if (col_alias == "lastmod") :
+			return(self.lastmodText(self.lastmods[index]))
+		if (col_alias == "changefreq") :
+			return(self.CHANGEFREQS_[self.changefreqs[index]])
+		if (col_alias == "priority") :
+			return(self.priorityText(self.priorities[index]))
+
+		raise KeyError(col_alias)
+
+	# sets the value, passed as a string, of a col of the item at an index
+	def setValue(self, index, col_alias, value) :
+		self.setValues([index], col_alias, value, False)
+
+	# sets the value, passed as a string, of a col of several items
+	# if positions is True the items are passed by their positions, otherwise by their indexes
+	# NOTE: the value is only converted once, so updating many items costs about as much as updating 1
+	def setValues(self, items, col_alias, value, positions=True) :
+		if (col_alias == "url") :
+			column = self.urls
+			self.url_order = None
+		elif (col_alias == "lastmod") :
+			column = self.lastmods
+			value = self.lastmodInt(value)
+		elif (col_alias == "changefreq") :
+			column = self.changefreqs
+			value = self.changefreqInt(value)
+		elif (col_alias == "priority") :
+			column = self.priorities
+			value = self.priorityInt(value)
+		else :
+			raise KeyError(col_alias)
+
+		for item in items :
+			column[self.order[item] if positions else item] = value
+
+	# checks if a value, passed as a string, can be stored in a col (an empty value can)
+	# returns True if it can, False otherwise
+	def isValid(self, col_alias, value) :
+		converters = {"lastmod" : self.lastmodInt, "changefreq" : self.changefreqInt, "priority" : self.priorityInt}
+		if (col_alias not in converters) :
+			return(False)
+
+		try :
+			converters[col_alias](value)
+		except ValueError :
+			return(False)
+
+		return(True)
+
+	# sorts the items based on the passed column sorting, in the form [[col_alias, True/False], ...] with the primary col 1st
+	# and for each col an asc/desc bool value (asc=False, desc=True)
+	# raises KeyError if a col isn't valid
+	def sort(self, sort_cols) :
+		# any cols after the URL col don't change the order, since the URLs are unique
+		cols = []
+		for col_alias, descending in sort_cols :
+			if (col_alias not in self.COLS_) :
+				raise KeyError(col_alias)
+
+			cols.append((col_alias, descending))
+			if (col_alias == "url") :
+				break
+
+		# start from the items sorted by URL, if the last sorting col is the URL
+		if (cols[-1][0] == "url") :
+			if (self.url_order == None) :
+				self.url_order = array.array("i", sorted(range(len(self.urls)), key=lambda index: self.urlKey(self.urls[index])))
+			order = self.url_order.tolist()
+			if (cols[-1][1]) :
+				order.reverse()
+			cols = cols[:-1]
+		else :
+			order = self.order.tolist()
+
+		# run each sort, starting from the lowest to the primary sorting
+		# NOTE: the sort is stable, so each sort keeps the order of the items with the same value from the sorts before it
+		columns = {"lastmod" : self.lastmods, "changefreq" : self.changefreqs, "priority" : self.priorities}
+		for col_alias, descending in reversed(cols) :
+			order.sort(key=columns[col_alias].__getitem__, reverse=descending)
+
+		self.order = array.array("i", order)
+
+	# returns the key the URLs are sorted by (case insensitive, with URLs only differing in case in a fixed order)
+	# NOTE: the site map items are built from the URLs sorted by this key, so they start in the same order as the url sorting
+	@staticmethod
+	def urlKey(url) :
+		return((url.lower(), url))
+
+	# returns the stored form of a lastmod (YYYY-MM-DD, or a W3C datetime whose date is used), the int YYYYMMDD, or 0 if it's empty
+	# raises ValueError if it isn't valid
+	def lastmodInt(self, lastmod) :
+		value = self.lastmod_ints.get(lastmod)
+		if (value == None) :
+			if (lastmod == "") :
+				value = 0
+			else :
+				match = self.LASTMOD_RE_.fullmatch(lastmod)
+				if (match == None or int(match.group(2)) not in range(1, 13) or int(match.group(3)) not in range(1, 32)) :
+					raise ValueError("Invalid lastmod: " + repr(lastmod))
+
+				value = int(match.group(1)) * 10000 + int(match.group(2)) * 100 + int(match.group(3))
+			self.lastmod_ints[lastmod] = value
+
+		return(value)
+
+	# returns the lastmod (YYYY-MM-DD) of its stored form
+	@staticmethod
+	def lastmodText(value) :
+		if (value == 0) :
+			return("")
+
+		return("{0:04d}-{1:02d}-{2:02d}".format(value // 10000, value // 100 % 100, value % 100))
+
+	# returns the stored form of a changefreq, its index in CHANGEFREQS_, or 0 if it's empty
+	# raises ValueError if it isn't valid
+	def changefreqInt(self, changefreq) :
+		if (changefreq not in self.CHANGEFREQS_) :
+			raise ValueError("Invalid changefreq: " + repr(changefreq))
+
+		return(self.CHANGEFREQS_.index(changefreq))
+
+	# returns the stored form of a priority (0.0 to 1.0), 1 + the priority in hundredths, or 0 if it's empty
+	# raises ValueError if it isn't valid
+	def priorityInt(self, priority) :
+		value = self.priority_ints.get(priority)
+		if (value == None) :
+			if (priority == "") :
+				value = 0
+			else :
+				try :
+					number = float(priority)
+				except ValueError :
+					number = None
+				# NOTE: NaN isn't in the range either
+				if (number == None or not 0 <= number <= 1) :
+					raise ValueError("Invalid priority: " + repr(priority))
+
+				value = 1 + round(number * 100)
+			self.priority_ints[priority] = value
+
+		return(value)
+
+	# returns the priority of its stored form
+	@staticmethod
+	def priorityText(value) :
+		if (value == 0) :
+			return("")
+
+		return(str((value - 1) / 100))
+
+class SiteMapItem :
+	"""This class gives access to the values of 1 item stored in a SiteMapItems instance, like a dictionary
+	with the keys url, lastmod, changefreq and priority, where the values are strings."""
+
+	__slots__ = ("items", "index")
+
+	def __init__(self, items, index) :
+		self.items = items
+		self.index = index
+
+	def __getitem__(self, col_alias) :
+		return(self.items.getValue(self.index, col_alias))
+
+	def __setitem__(self, col_alias, value) :
+		self.items.setValue(self.index, col_alias, value)
+
+	def __contains__(self, col_alias) :
+		return(col_alias in self.items.COLS_)
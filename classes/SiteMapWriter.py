@@ -0,0 +1,139 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import os, re, time, gzip, xml.sax.saxutils
+
+class SiteMapWriter :
+	"""This class writes the site map XML files one <url> entry at a time, so memory use doesn't depend on the # of URLs.
+	When a file reaches the limits of the sitemap protocol (50,000 URLs or 50MB) the writer rolls over to a new file.
+
+	If all the items fit in 1 file it is named sitemap.xml. Otherwise the files are named sitemap-N.xml
+	and a sitemap_index.xml file, listing all of them, is also written.
+	If compress is True, all files are gzip compressed as they are written and get the extension .xml.gz"""
+
+	# class constants with the limits of each site map file
+	MAX_URLS_ = 50000
+	MAX_BYTES_ = 50 * 1024 * 1024
+
+	# class constants with the start and end of the site map and index files
+	URLSET_HEADER_ = b'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+	URLSET_FOOTER_ = b'</urlset>\n'
+	INDEX_HEADER_ = b'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+	INDEX_FOOTER_ = b'</sitemapindex>\n'
+
+	# class constant with the entities that need to be escaped in the XML text, besides & < and >
+	XML_ENTITIES_ = {"\"" : "&quot;", "'" : "&apos;"}
+
+	def __init__(self, path_folder, root_url, compress=False) :
+		# instance variables with the folder where the files will be written and the root URL they will be accessible from
+		self.path_folder = path_folder
+		self.root_url = root_url
+
+		# instance variables with the use/nouse of gzip compression and the matching file extension
+		self.compress = bool(compress)
+		self.extension = ".xml.gz" if self.compress else ".xml"
+
+		# instance variables with the current file, the # of URLs and (uncompressed) bytes written to it
+		self.file = None
+		self.num_urls = 0
+		self.num_bytes = 0
+
+		# instance variable with the names of the files written
+		self.file_names = []
+
+	# starts writing the site map files, removing any files left from a previous site map
+	def open(self) :
+		for item in os.listdir(self.path_folder) :
+			if (re.fullmatch(r"sitemap(-\d+|_index)?\.xml(\.gz)?", item) != None) :
+				os.remove(self.path_folder + "/" + item)
+
+		self.newFile()
+
+	# writes the <url> entry for a site map item
+	def addItem(self, item) :
+		# build the "url" node
+		entry = "<url><loc>" + self.escape(item["url"]) + "</loc>"
+
+		# add the optional nodes, if the data exists for this item and it's not empty
+		for col_alias in ("lastmod", "changefreq", "priority") :
+			if (col_alias in item and item[col_alias] != "") :
+				entry += "<" + col_alias + ">" + self.escape(item[col_alias]) + "</" + col_alias + ">"
+
+		entry = (entry + "</url>\n").encode("utf-8")
+
+		# if this entry doesn't fit in the current file, move on to a new one
+		if (self.num_urls >= self.MAX_URLS_ or self.num_bytes + len(entry) + len(self.URLSET_FOOTER_) > self.MAX_BYTES_) :
+			self.closeFile()
+			self.newFile()
+
+		self.write(entry)
+		self.num_urls += 1
+
+	# finishes writing the site map files
+	# returns the name of the file to be submitted to the search engines (sitemap.xml or sitemap_index.xml, with the .gz extension if compressed)
+	def close(self) :
+		self.closeFile()
+
+		# if all items fit in 1 file, name it sitemap.xml
+		if (len(self.file_names) == 1) :
+			os.replace(self.path_folder + "/" + self.file_names[0], self.path_folder + "/sitemap" + self.extension)
+			return("sitemap" + self.extension)
+
+		# there are several files, so write the index file
+		local_time_aux = time.localtime()
+		lastmod = "{0}-{1}-{2}".format(str(local_time_aux.tm_year), str(local_time_aux.tm_mon).zfill(2), str(local_time_aux.tm_mday).zfill(2))
+
+		with self.openFile(self.path_folder + "/sitemap_index" + self.extension) as f :
+			f.write(self.INDEX_HEADER_)
+
+			for file_name in self.file_names :
+				f.write(("<sitemap><loc>" + self.escape(self.root_url + "/" + file_name) + "</loc><lastmod>" + lastmod + "</lastmod></sitemap>\n").encode("utf-8"))
+
+			f.write(self.INDEX_FOOTER_)
+
+		return("sitemap_index" + self.extension)
+
+	# starts a new site map file
+	def newFile(self) :
+		self.file_names.append("sitemap-" + str(len(self.file_names) + 1) + self.extension)
+		self.file = self.openFile(self.path_folder + "/" + self.file_names[-1])
+		self.num_urls = 0
+		self.num_bytes = 0
+
+		self.write(self.URLSET_HEADER_)
+
+	# finishes the current site map file
+	def closeFile(self) :
+		if (self.file == None) :
+			return
+
+		self.write(self.URLSET_FOOTER_)
+		self.file.close()
+		self.file = None
+
+	# opens a file for writing, compressing its content as it's written if needed
+	def openFile(self, path) :
+		if (self.compress) :
+			return(gzip.open(path, "wb"))
+
+		return(open(path, "wb"))
+
+	# writes bytes to the current file, keeping count of its size
+	def write(self, data) :
+		self.file.write(data)
+		self.num_bytes += len(data)
+
+	# escapes the characters that can't be used in the XML text (& ' " < >)
+	def escape(self, text) :
+		return(xml.sax.saxutils.escape(text, self.XML_ENTITIES_))
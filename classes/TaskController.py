@@ -0,0 +1,65 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import threading, queue, traceback
+
+class TaskController(threading.Thread) :
+	"""This class runs a long task (ex: a crawl) in a background thread, so the GUI thread is never blocked.
+	The task reports its progress by publishing events, which are stored in a thread safe queue.
+	The GUI thread periodically drains that queue, with tkinter's after(), and handles each event.
+
+	The task is called with this instance as its 1st argument, so it can use publish(), followed by any arguments passed at instantiation."""
+
+	# class constant with the name of the event published if the task raises an exception
+	EVENT_ERROR_ = "error"
+
+	def __init__(self, task, *args) :
+		# call the threading.Thread __init__ method, and make sure the thread is daemon=True
+		# this insures the thread will terminate if the application is shutdown
+		super().__init__(daemon=True)
+
+		# instance variables with the function that runs the task and its arguments
+		self.task = task
+		self.args = args
+
+		# instance variable with the queue of events published by the task, in the form (event name, data)
+		self.events = queue.Queue()
+
+	# main method of a thread, defining what the thread should do
+	def run(self) :
+		try :
+			self.task(self, *self.args)
+		except Exception as e :
+			# let the GUI know the task failed
+			traceback.print_exc()
+			self.publish(self.EVENT_ERROR_, str(e))
+
+	# adds an event to the queue, to be handled by the GUI thread
+	def publish(self, name, data=None) :
+		self.events.put((name, data))
+
+	# returns a list with all the events currently in the queue, without blocking
+	def drainEvents(self) :
+		events = []
+
+		while True :
+			try :
+				events.append(self.events.get_nowait())
+			except queue.Empty :
+				break
+
+		return(events)
+
+	# returns True if the task has finished and all its events have been drained, False otherwise
+	def isFinished(self) :
+		return(not self.is_alive() and self.events.empty())
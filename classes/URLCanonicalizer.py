@@ -0,0 +1,204 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import re, string, fnmatch, urllib.parse
+
+class URLCanonicalizer :
+	"""This class converts the different spellings of a URL to 1 canonical form, so each webpage is only crawled once.
+	Relative URLs are resolved against the URL of the webpage they are in, and then:
+	- the scheme and host are lowercased and the default port (80 for http, 443 for https) is removed
+	- the fragment (#...) is removed
+	- the "." and ".." segments of the path are resolved and an empty path becomes "/"
+	- the percent-encoding is normalized (unreserved characters are decoded, the rest uses uppercase hex digits)
+	- the query params matching drop_params (ex: tracking params) are removed and the rest are sorted
+
+	Optionally, the trailing / of the path can be removed and the path lowercased (for websites whose paths are case insensitive).
+
+	Since the same links are found in many webpages (ex: menus), the canonical form of up to CACHE_SIZE_ URLs is kept."""
+
+	# class constant with the default port of each scheme
+	DEFAULT_PORTS_ = {"http" : 80, "https" : 443}
+	# class constant with the default query params removed (* matches any characters)
+	TRACKING_PARAMS_ = ("utm_*", "gclid", "dclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid", "_ga", "_gl", "igshid")
+	# class constant with the characters that don't need to be percent-encoded
+	UNRESERVED_ = frozenset(string.ascii_letters + string.digits + "-._~")
+	# class constant with the characters not percent-encoded in the path and in the query
+	PATH_SAFE_ = "/%:@!$&'()*+,;=-._~"
+	QUERY_SAFE_ = PATH_SAFE_ + "?"
+	# class constant with the regex matching a percent-encoded character
+	PERCENT_RE_ = re.compile(r"%([0-9A-Fa-f]{2})")
+	# class constant with the max # of URLs whose canonical form is kept
+	CACHE_SIZE_ = 100000
+	# class constant returned by the cache lookups for the URLs not in it (None is a valid canonical form)
+	NOT_CACHED_ = object()
+
+	def __init__(self, drop_params=TRACKING_PARAMS_, sort_query=True, strip_trailing_slash=False, lowercase_path=False) :
+		# instance variables with the rules
+		self.drop_params = [param.lower() for param in drop_params]
+		self.sort_query = sort_query
+		self.strip_trailing_slash = strip_trailing_slash
+		self.lowercase_path = lowercase_path
+
+		# instance variable with the regex matching the names of the query params to remove (None if there are none)
+		self.drop_params_re = None
+		if (len(self.drop_params) > 0) :
+			self.drop_params_re = re.compile("|".join(fnmatch.translate(param) for param in self.drop_params))
+
+		# instance variable with the canonical form of the URLs already converted, in the form {url : canonical url}
+		self.cache = {}
+		# instance variable with the last base URL used and its "scheme://host" part
+		self.base_origin = (None, None)
+
+	# the cache isn't sent to other processes (ex: when passed to a ParserPool)
+	def __getstate__(self) :
+		state = self.__dict__.copy()
+		state["cache"] = {}
+		return(state)
+
+	# returns the canonical form of a URL, resolved against base_url if it's relative
+	# returns None if it's not an http(s) URL (ex: mailto:, javascript:) or is malformed
+	def canonicalize(self, url, base_url=None) :
+		url = url.strip()
+
+		# resolve relative URLs, with a shortcut for the most common ones (starting with a single /)
+		if (base_url != None and not url.startswith(("http://", "https://"))) :
+			if (url.startswith("/") and not url.startswith("//")) :
+				url = self.originOf(base_url) + url
+			else :
+				url = urllib.parse.urljoin(base_url, url)
+
+		# NOTE: looked up in 1 go, since another thread sharing this instance may clear the cache meanwhile
+		canonical_url = self.cache.get(url, self.NOT_CACHED_)
+		if (canonical_url is not self.NOT_CACHED_) :
+			return(canonical_url)
+
+		canonical_url = self.canonicalizeAbsolute(url)
+
+		if (len(self.cache) >= self.CACHE_SIZE_) :
+			self.cache.clear()
+		self.cache[url] = canonical_url
+
+		return(canonical_url)
+
+	# returns the "scheme://host" part of a URL
+	def originOf(self, url) :
+		base_url, origin = self.base_origin
+
+		if (url != base_url) :
+			parts = urllib.parse.urlsplit(url)
+			origin = parts.scheme + "://" + parts.netloc
+			self.base_origin = (url, origin)
+
+		return(origin)
+
+	# returns the canonical form of an absolute URL, or None if it's not an http(s) URL or is malformed
+	def canonicalizeAbsolute(self, url) :
+		try :
+			parts = urllib.parse.urlsplit(url)
+
+			# add the http:// to the start of the URL, if it has no scheme
+			if (parts.scheme == "") :
+				parts = urllib.parse.urlsplit("http://" + url.lstrip("/"))
+
+			scheme = parts.scheme.lower()
+			if (scheme not in self.DEFAULT_PORTS_ or parts.hostname == None) :
+				return(None)
+
+			port = parts.port
+		except ValueError :
+			return(None)
+
+		# build the host, without the default port
+		netloc = parts.hostname
+		if (":" in netloc) :
+			# an IPv6 address
+			netloc = "[" + netloc + "]"
+		if (port != None and port != self.DEFAULT_PORTS_[scheme]) :
+			netloc += ":" + str(port)
+		if (parts.username != None) :
+			netloc = parts.netloc[:parts.netloc.rindex("@") + 1] + netloc
+
+		return(scheme + "://" + netloc + self.canonicalPath(parts.path) + self.canonicalQuery(parts.query))
+
+	# returns the canonical form of a URL's path
+	def canonicalPath(self, path) :
+		path = self.removeDotSegments(self.normalizeEncoding(path, self.PATH_SAFE_))
+
+		if (self.lowercase_path) :
+			path = path.lower()
+		if (path == "") :
+			path = "/"
+		elif (self.strip_trailing_slash and path != "/" and path.endswith("/")) :
+			path = path.rstrip("/") or "/"
+
+		return(path)
+
+	# returns the canonical form of a URL's query, starting with "?", or "" if there are no params left
+	def canonicalQuery(self, query) :
+		params = []
+
+		for param in query.split("&") :
+			if (param == "" or self.dropParam(urllib.parse.unquote_plus(param.split("=", 1)[0]))) :
+				continue
+
+			params.append(self.normalizeEncoding(param, self.QUERY_SAFE_))
+
+		if (len(params) == 0) :
+			return("")
+
+		if (self.sort_query) :
+			params.sort()
+
+		return("?" + "&".join(params))
+
+	# checks if a query param should be removed, based on its name
+	# returns True if it should, False otherwise
+	def dropParam(self, name) :
+		if (self.drop_params_re == None) :
+			return(False)
+
+		return(self.drop_params_re.match(name.lower()) != None)
+
+	# percent-encodes the characters that need it (ex: spaces and non ASCII characters), decodes the unreserved
+	# characters that were percent-encoded and uppercases the hex digits of the rest
+	def normalizeEncoding(self, text, safe) :
+		text = urllib.parse.quote(text, safe=safe)
+
+		return(self.PERCENT_RE_.sub(self.normalizeEscape, text))
+
+	# returns the canonical form of 1 percent-encoded character
+	def normalizeEscape(self, match) :
+		char = chr(int(match.group(1), 16))
+		if (char in self.UNRESERVED_) :
+			return(char)
+
+		return("%" + match.group(1).upper())
+
+	# resolves the "." and ".." segments of a path (RFC 3986, section 5.2.4)
+	def removeDotSegments(self, path) :
+		if ("." not in path) :
+			return(path)
+
+		segments = []
+		for segment in path.split("/") :
+			if (segment == "..") :
+				if (len(segments) > 1) :
+					segments.pop()
+			elif (segment != ".") :
+				segments.append(segment)
+
+		# keep the trailing / of paths ending in a "." or ".." segment
+		if (path.endswith(("/.", "/.."))) :
+			segments.append("")
+
+		return("/".join(segments))
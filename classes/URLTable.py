@@ -0,0 +1,208 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import collections
+
+class URLTable :
+	"""This class stores all the URLs of a project once, no matter how many states they are in, in a compact form.
+	Each URL is mapped to a byte with its state flags (known, queued, crawled, failed, external).
+
+	The URLs are split in a prefix (everything up to the last /, ex: "https://www.example.com/blog/") and a suffix.
+	Each prefix is stored once, with an id, and the URL is stored as the bytes of the prefix's id followed by the suffix,
+	so the scheme, host and folders shared by many URLs aren't repeated.
+	NOTE: the URLs aren't given ids of their own, since an int per URL would take more memory than the URL's suffix.
+
+	view() returns a set-like object with the URLs that have a flag, used in place of a set of URL strings.
+	Like the sets it replaces, it isn't thread safe, so the callers are expected to hold a lock (ex: the Frontier's mutex)."""
+
+	# class constants with the state flags of a URL
+	KNOWN_ = 1
+	QUEUED_ = 2
+	CRAWLED_ = 4
+	FAILED_ = 8
+	EXTERNAL_ = 16
+
+	# class constant with the # of bytes of a prefix's id, at the start of each key
+	PREFIX_ID_BYTES_ = 4
+
+	def __init__(self) :
+		self.clear()
+
+	# removes all the URLs
+	def clear(self) :
+		# instance variables with the prefixes, in the form [prefix, ...] and {prefix : prefix id}
+		self.prefixes = []
+		self.prefix_ids = {}
+
+		# instance variable with the URLs' state flags, in the form {key : flags}
+		self.entries = {}
+		# instance variable with the # of URLs with each flag, in the form {flag : count}
+		self.counts = {self.KNOWN_ : 0, self.QUEUED_ : 0, self.CRAWLED_ : 0, self.FAILED_ : 0, self.EXTERNAL_ : 0}
+
+		# instance variable with the keys of the queued URLs, in the order they were queued
+		# NOTE: URLs removed from the queue are only dropped from it when they reach its front
+		self.queue = collections.deque()
+
+	# releases the memory used by the URLs
+	def close(self) :
+		self.clear()
+
+	# returns the key a URL is stored with, or None if its prefix isn't known and create is False
+	def getKey(self, url, create=False) :
+		split_index = url.rfind("/") + 1
+
+		# find the prefix's id
+		prefix = url[:split_index]
+		prefix_id = self.prefix_ids.get(prefix)
+		if (prefix_id == None) :
+			if (not create) :
+				return(None)
+
+			prefix_id = len(self.prefixes)
+			self.prefixes.append(prefix)
+			self.prefix_ids[prefix] = prefix_id
+
+		return(prefix_id.to_bytes(self.PREFIX_ID_BYTES_, "big") + url[split_index:].encode("utf-8"))
+
+	# returns the URL stored with a key
+	def getURL(self, key) :
+		prefix_id = int.from_bytes(key[:self.PREFIX_ID_BYTES_], "big")
+
+		return(self.prefixes[prefix_id] + key[self.PREFIX_ID_BYTES_:].decode("utf-8"))
+
+	# checks if a URL has a flag
+	# returns True if it has, False otherwise
+	def hasFlag(self, url, flag) :
+		key = self.getKey(url)
+
+		return(key != None and self.entries.get(key, 0) & flag != 0)
+
+	# sets a flag of a URL, adding the URL to the table if needed
+	# returns True if the flag wasn't set, False otherwise
+	def setFlag(self, url, flag) :
+		key = self.getKey(url, True)
+		flags = self.entries.get(key, 0)
+
+		if (flags & flag != 0) :
+			return(False)
+
+		self.entries[key] = flags | flag
+		self.counts[flag] += 1
+
+		if (flag == self.QUEUED_) :
+			self.queue.append(key)
+
+		return(True)
+
+	# clears a flag of a URL
+	# returns True if the flag was set, False otherwise
+	def clearFlag(self, url, flag) :
+		key = self.getKey(url)
+		if (key == None) :
+			return(False)
+
+		flags = self.entries.get(key, 0)
+		if (flags & flag == 0) :
+			return(False)
+
+		self.entries[key] = flags & ~flag
+		self.counts[flag] -= 1
+
+		return(True)
+
+	# clears a flag of all the URLs
+	def clearAll(self, flag) :
+		for key, flags in self.entries.items() :
+			if (flags & flag != 0) :
+				self.entries[key] = flags & ~flag
+		self.counts[flag] = 0
+
+		if (flag == self.QUEUED_) :
+			self.queue.clear()
+
+	# returns the # of URLs with a flag
+	def count(self, flag) :
+		return(self.counts[flag])
+
+	# generator yielding the URLs with a flag
+	def iterFlag(self, flag) :
+		for key, flags in self.entries.items() :
+			if (flags & flag != 0) :
+				yield self.getURL(key)
+
+	# returns an iterable with the URLs that have a flag now, which can be used without holding the caller's lock
+	# NOTE: only the keys are copied, and the URLs are built from them as they are read
+	def snapshot(self, flag) :
+		keys = [key for key, flags in self.entries.items() if flags & flag != 0]
+
+		return(map(self.getURL, keys))
+
+	# removes and returns the URL at the front of the queue
+	# raises KeyError if the queue is empty
+	def popQueued(self) :
+		while (len(self.queue) > 0) :
+			key = self.queue.popleft()
+
+			# skip the URLs that were removed from the queue after being queued
+			flags = self.entries[key]
+			if (flags & self.QUEUED_ != 0) :
+				self.entries[key] = flags & ~self.QUEUED_
+				self.counts[self.QUEUED_] -= 1
+				return(self.getURL(key))
+
+		raise KeyError("pop from an empty queue")
+
+	# returns a set-like view of the URLs with a flag
+	def view(self, flag) :
+		return(URLSetView(self, flag))
+
+class URLSetView :
+	"""This class is a set-like view of the URLs in a URLTable with a state flag.
+	It supports the set operations used with the project's URL sets: add(), discard(), pop(), clear(), in, len() and iteration.
+	pop() returns the URLs in the order they were added, when viewing the queued URLs."""
+
+	def __init__(self, table, flag) :
+		self.table = table
+		self.flag = flag
+
+	def add(self, url) :
+		self.table.setFlag(url, self.flag)
+
+	def discard(self, url) :
+		self.table.clearFlag(url, self.flag)
+
+	def pop(self) :
+		if (self.flag == self.table.QUEUED_) :
+			return(self.table.popQueued())
+
+		for url in self.table.iterFlag(self.flag) :
+			self.table.clearFlag(url, self.flag)
+			return(url)
+
+		raise KeyError("pop from an empty set")
+
+	def clear(self) :
+		self.table.clearAll(self.flag)
+
+	def __contains__(self, url) :
+		return(self.table.hasFlag(url, self.flag))
+
+	def __len__(self) :
+		return(self.table.count(self.flag))
+
+	def __iter__(self) :
+		return(self.table.iterFlag(self.flag))
+
+	# returns an iterable with the URLs in the view now, which can be used without holding the caller's lock
+	def snapshot(self) :
+		return(self.table.snapshot(self.flag))
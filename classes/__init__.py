@@ -22,8 +22,8 @@ dir_contents = os.listdir(dir_path)
 
 # find all the python files
 for item in dir_contents :
-	# ignore this file
-	if (item == "__init__.py") :
+	# ignore this file and the command line interface
+	if (item == "__init__.py" or item == "__main__.py") :
 		continue
 
 	# check if this item is a file
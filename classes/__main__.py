@@ -0,0 +1,177 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# 															 #
+# Python Crawler and Site Map Generator v1.2.1				 #
+#															 #
+# Copyright 2016, PedroHenriques 							 #
+# http://www.pedrojhenriques.com 							 #
+# https://github.com/PedroHenriques 						 #
+# 															 #
+# Free to use under the MIT license.			 			 #
+# http://www.opensource.org/licenses/mit-license.php 		 #
+# 															 #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+# command line interface, to crawl a website and build its site map without the GUI
+# usage: python -m classes crawl|build|xml <root_url> [options]
+# the projects are stored in the same folder layout used by the GUI application
+
+import os, sys, argparse
+from classes import Project, TaskController, URLCanonicalizer
+
+# runs the passed project task in a background task, printing its progress, until it's done
+# if the user presses CTRL+C the task is stopped (a crawl is paused, so its state is saved)
+# returns True if the task was successful, False otherwise
+def runTask(project, task, print_progress, *args) :
+	controller = TaskController.TaskController(task, *args)
+	controller.start()
+
+	while not controller.isFinished() :
+		try :
+			controller.join(project.PROGRESS_UPDATE_SECONDS_)
+		except KeyboardInterrupt :
+			print("Stopping...")
+			project.paused = True
+
+		for name, data in controller.drainEvents() :
+			if (name == TaskController.TaskController.EVENT_ERROR_) :
+				project.showError(title="Operation Failed", message=data)
+				return(False)
+
+			print_progress(data)
+
+	return(True)
+
+# crawls the project's website, continuing an incomplete crawl or starting from scratch
+def crawl(project, args) :
+	project.num_threads = args.threads
+	project.concurrency = args.concurrency
+	project.max_rate = args.max_rate
+	project.max_body_size = args.max_body_size
+	project.fast_link_extractor = not args.html_parser
+	project.parser_processes = args.parser_processes
+	project.disk_frontier = args.disk_frontier
+	project.bloom_error_rate = args.bloom_error_rate
+
+	if (not project.prepareCrawl()) :
+		return(1)
+
+	# local function printing the URL counts published by the crawl
+	def printProgress(counts) :
+		print("Crawled {0} of {1} webpages found ({3} failed, {2} external)".format(*counts))
+
+	if (not runTask(project, project.runCrawl, printProgress, args.use_async)) :
+		return(1)
+
+	if (project.crawlCompleted()) :
+		project.showInfo(title="Operation Completed", message="The website has been successfully crawled.")
+	else :
+		project.showInfo(title="Operation Paused", message="The crawl task has been paused. Run the crawl command again to continue.")
+
+	return(0)
+
+# builds the site map data from the crawled URLs and saves it to the project's temp save file,
+# the same used by the "Save" button of the GUI
+def build(project, args) :
+	urls = project.prepareSiteMapBuild()
+	if (urls == None) :
+		return(1)
+
+	# local function printing the # of site map items built
+	def printProgress(data) :
+		print("Built {0} site map items".format(len(project.site_map_items)))
+
+	if (not runTask(project, project.runSiteMapBuild, printProgress, urls, not args.no_robots)) :
+		return(1)
+
+	# sort the items by URL, as the GUI displays them, and save them
+	project.sortSiteMapItems(project.site_map_items_sorting)
+	project.saveSiteMapData(False)
+
+	project.showInfo(title="Operation Completed", message="The site map data has " + str(len(project.site_map_items)) + " items.")
+	return(0)
+
+# creates the site map XML file(s) from the site map data in the project's temp save file
+def xml(project, args) :
+	if (not project.tempSaveSiteMapExists()) :
+		project.showError(title="Operation Failed", message="There is no site map data for this project. Run the build command first.")
+		return(1)
+
+	project.loadSiteMapData()
+	site_map_file = project.createSiteMapFile(args.gzip)
+
+	project.showInfo(title="Site Map File Created", message="The " + site_map_file + " file for this project has been created in the project's folder \"" + project.paths["project_folder"] + "\"")
+	return(0)
+
+# parses the command line arguments, opens (or, for the crawl command, creates) the project and runs the command
+# returns the exit status
+def main(argv=None) :
+	parser = argparse.ArgumentParser(prog="python -m classes", description="Crawls a website and builds its site map, without the GUI.")
+	parser.add_argument("command", choices=["crawl", "build", "xml"], help="crawl the website, build the site map data from the crawled URLs or create the site map XML file(s)")
+	parser.add_argument("root_url", help="the website's root URL")
+	parser.add_argument("--projects", default=None, help="the folder with the projects (default: ./projects/)")
+	parser.add_argument("--threads", type=int, default=Project.Project.DEFAULT_NUM_THREADS_, help="# of threads used to crawl")
+	parser.add_argument("--async", dest="use_async", action="store_true", help="crawl with the asynchronous crawler")
+	parser.add_argument("--concurrency", type=int, default=Project.Project.DEFAULT_CONCURRENCY_, help="max # of simultaneous requests of the asynchronous crawler")
+	parser.add_argument("--max-rate", type=float, default=Project.Project.DEFAULT_MAX_RATE_, help="max # of requests per second sent to each host when crawling (0 = no limit)")
+	parser.add_argument("--max-body-size", type=float, default=Project.Project.DEFAULT_MAX_BODY_SIZE_, help="max size, in MB, of a webpage downloaded when crawling (only the start of bigger webpages is parsed for links)")
+	parser.add_argument("--html-parser", action="store_true", help="collect the links with the full HTML parser, instead of the faster regex based link extractor")
+	parser.add_argument("--parser-processes", type=int, default=Project.Project.DEFAULT_PARSER_PROCESSES_, help="# of processes parsing the webpages, separate from the crawlers (0 = parsed by the crawlers, as they are downloaded)")
+	parser.add_argument("--drop-param", dest="drop_params", action="append", default=[], metavar="NAME", help="query param removed from the URLs found, besides the tracking params (ex: sessionid, * matches any characters). Can be used more than once")
+	parser.add_argument("--strip-trailing-slash", action="store_true", help="remove the trailing / of the URLs found (ex: /blog/ and /blog are the same webpage)")
+	parser.add_argument("--lowercase-paths", action="store_true", help="lowercase the path of the URLs found, for websites whose paths are case insensitive")
+	parser.add_argument("--disk-frontier", action="store_true", help="store the URLs found in a database in the project's folder, instead of in memory, to crawl websites with millions of webpages")
+	parser.add_argument("--bloom-error-rate", type=float, default=Project.Project.DEFAULT_BLOOM_ERROR_RATE_, metavar="RATE", help="with --disk-frontier, check the URLs found in a Bloom filter with this false positive rate (ex: 0.01) before looking them up in the database (0 = no Bloom filter)")
+	parser.add_argument("--no-robots", action="store_true", help="don't use the robots.txt file when building the site map data")
+	parser.add_argument("--gzip", action="store_true", help="gzip compress the site map XML file(s)")
+	args = parser.parse_args(argv)
+
+	if (args.threads < 1 or args.concurrency < 1) :
+		parser.error("--threads and --concurrency must be at least 1")
+	if (args.max_rate < 0) :
+		parser.error("--max-rate can't be negative")
+	if (args.parser_processes < 0) :
+		parser.error("--parser-processes can't be negative")
+	if (args.max_body_size <= 0) :
+		parser.error("--max-body-size must be bigger than 0")
+	if (args.bloom_error_rate < 0 or args.bloom_error_rate >= 1) :
+		parser.error("--bloom-error-rate must be between 0 and 1")
+
+	project = Project.Project()
+	if (args.projects != None) :
+		project.path_projects = args.projects.rstrip("/") + "/"
+
+	# set the rules used to convert the URLs to their canonical form before the project is created,
+	# so the start URL stored in a new project follows the same rules as the URLs found when crawling
+	project.canonicalizer = URLCanonicalizer.URLCanonicalizer(URLCanonicalizer.URLCanonicalizer.TRACKING_PARAMS_ + tuple(args.drop_params), strip_trailing_slash=args.strip_trailing_slash, lowercase_path=args.lowercase_paths)
+
+	# find the project for the root URL
+	project.root_url = args.root_url
+	if (not project.validateRootURL()) :
+		project.showError(title="An error occured", message="The root URL inserted is not valid.")
+		return(1)
+	root_url = project.root_url
+	root_domain = project.getDomain(root_url)
+
+	if (not os.path.isdir(project.path_projects + root_domain)) :
+		# only the crawl command can start a new project
+		if (args.command != "crawl") :
+			project.showError(title="Operation Failed", message="The project folder does not exist.")
+			return(1)
+
+		os.makedirs(project.path_projects, exist_ok=True)
+		if (not project.createProjectFolder(args.root_url)) :
+			return(1)
+
+	# keep the root URL as inserted, since the one rebuilt from the project's name has no scheme or port
+	project.loadProject(root_domain)
+	project.root_url = root_url
+
+	if (args.command == "crawl") :
+		return(crawl(project, args))
+	elif (args.command == "build") :
+		return(build(project, args))
+	else :
+		return(xml(project, args))
+
+if (__name__ == "__main__") :
+	sys.exit(main())
@@ -11,7 +11,8 @@
 # 															 #
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-import os, xml.etree.ElementTree as ET
+import os
+from classes import SiteMapWriter
 
 # general method for creating/opening and editing files
 def writeToFile(file_path, mode, content) :
@@ -23,12 +24,10 @@ def writeToFile(file_path, mode, content) :
 
 # method used to save url set() to a file
 def saveSetToFile(path, mode, urls) :
-	content = ""
-
-	for url in urls :
-		content += url + "\n"
-
-	writeToFile(path, mode, content)
+	# write the URLs as they are read from the set, instead of building the whole content in memory first
+	with open(path, mode, encoding="utf-8") as file_object :
+		file_object.writelines(url + "\n" for url in urls)
+	print(path + " in mode \"" + mode + "\"")
 
 # method used specificaly to save the site map state to a file
 # NOTE: does not create the actual site map
@@ -54,38 +53,19 @@ def saveTmpSiteMap(path_cur_project, file_name, mode, items, sorting) :
 
 	writeToFile(path_cur_project + "/tmp/" + file_name, mode, content)
 
-# this method will build the final site map XML file, based on site_map_items
-def createSiteMapXML(path_cur_project, site_map_items) :
-	# create the site map root node
-	xml_root = ET.Element("urlset", {"xmlns" : "http://www.sitemaps.org/schemas/sitemap/0.9"})
+# this method will build the final site map XML file(s), based on site_map_items
+# the items are written 1 at a time and split into several files with an index file, if needed
+# if compress is True, the files are gzip compressed while they are written
+# returns the name of the file to be submitted to the search engines
+def createSiteMapXML(path_cur_project, site_map_items, root_url, compress=False) :
+	writer = SiteMapWriter.SiteMapWriter(path_cur_project, root_url, compress)
+	writer.open()
 
-	# loop each item in the site map data and build the XML entry
+	# loop each item in the site map data and write its XML entry
 	for item in site_map_items :
-		# create the "url" node
-		node = ET.SubElement(xml_root, "url")
-
-		# add the "loc" node
-		# FIXME: we need to encode some characters (& ' " < >) + encode the entire URL with the server's encoding protocol
-		ET.SubElement(node, "loc").text = item["url"]
-
-		# if the lastmod data exists for this item and it's not empty, add it to the XML
-		if ("lastmod" in item and item["lastmod"] != "") :
-			ET.SubElement(node, "lastmod").text = item["lastmod"]
-
-		# if the changefreq data exists for this item and it's not empty, add it to the XML
-		if ("changefreq" in item and item["changefreq"] != "") :
-			ET.SubElement(node, "changefreq").text = item["changefreq"]
-
-		# if the priority data exists for this item and it's not empty, add it to the XML
-		if ("priority" in item and item["priority"] != "") :
-			ET.SubElement(node, "priority").text = item["priority"]
-
-	# create the XML tree
-	xml_obj = ET.ElementTree(xml_root)
-
-	# write the XML tree to the XML file
-	xml_obj.write(path_cur_project + "/sitemap.xml", encoding="utf-8", xml_declaration=True)
+		writer.addItem(item)
 
+	return(writer.close())
 
 # recursive method that will delete a directory and all its contents
 # returns True if successful, False if not